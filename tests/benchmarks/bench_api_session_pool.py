@@ -0,0 +1,93 @@
+"""
+Benchmark of APIHelper sessions: a new ClientSession per helper (legacy)
+vs the shared APISessionPool.
+
+    python -m tests.benchmarks.bench_api_session_pool --helpers 50 --requests 5
+
+Every helper stands for one test: it is initialized, sends `--requests`
+GET requests and is closed. By default the requests go to a local aiohttp
+server, where a new connection costs only a loopback TCP handshake; pass
+`--url` of a real HTTPS endpoint to include TLS handshakes and latency.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any, Optional
+
+from aiohttp import web
+
+from tests.utils.api_helper import APIHelper
+from tests.utils.api_session_pool import APISessionPool
+
+
+async def start_server(connections: set[Any]) -> tuple[web.AppRunner, str]:
+    async def orgs(request: web.Request) -> web.Response:
+        # The client address and port identify the connection
+        connections.add(request.transport.get_extra_info("peername"))  # type: ignore[union-attr]
+        return web.json_response([{"name": "bench-org"}])
+
+    app = web.Application()
+    app.router.add_get("/orgs", orgs)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    return runner, f"http://127.0.0.1:{port}/orgs"
+
+
+async def run_helpers(
+    url: str, helpers: int, requests: int, pool: Optional[APISessionPool]
+) -> float:
+    config: Any = SimpleNamespace(get_orgs_url=lambda: url)
+    start = time.perf_counter()
+    for _ in range(helpers):
+        helper = await APIHelper(config=config, pool=pool).init()
+        for _ in range(requests):
+            await helper.get_orgs(token="bench")
+        await helper._close()
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--helpers", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=5, help="Per helper")
+    parser.add_argument("--url", default=None, help="GET endpoint to use")
+    args = parser.parse_args()
+
+    # Connections seen by the local server, per case
+    connections: set[Any] = set()
+    runner = None
+    url = args.url
+    if url is None:
+        runner, url = await start_server(connections)
+    try:
+        legacy = await run_helpers(url, args.helpers, args.requests, None)
+        legacy_connections = len(connections)
+        connections.clear()
+        pool = APISessionPool()
+        pooled = await run_helpers(url, args.helpers, args.requests, pool)
+        await pool.close()
+    finally:
+        if runner is not None:
+            await runner.cleanup()
+
+    total = args.helpers * args.requests
+    print(f"{args.helpers} helpers x {args.requests} requests to {url}")
+    print(f"{'case':<20} | {'seconds':>8} | {'connections':>11} | speedup")
+    rows = [
+        ("session per helper", legacy, legacy_connections if runner else "n/a"),
+        ("shared pool", pooled, pool.connections_created),
+    ]
+    for case, seconds, opened in rows:
+        print(f"{case:<20} | {seconds:8.3f} | {opened:>11} | {legacy / seconds:6.1f}x")
+    print(f"Pool reused connections for {pool.connections_reused} of {total} requests")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,120 @@
+"""
+Benchmark of ApoloRunner backends: a fresh `apolo` process per command
+(subprocess) vs the long-lived apolo worker.
+
+    python -m tests.benchmarks.bench_apolo_backends --rounds 5
+
+Runs offline commands that need no login (`--commands`), `--rounds`
+times each, through both backends, and checks that both report the same
+success and output for every command. The worker's first command pays
+for starting the process and importing apolo-cli and is shown separately.
+Requires apolo-cli in the running interpreter.
+
+Then a fake worker answers a command with `--large-output` bytes of
+output, to check that replies larger than the stream line limit (64 KiB)
+come through intact and the worker stays up.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import shlex
+import shutil
+import sys
+import tempfile
+import time
+
+from tests.benchmarks.fake_apolo import expected_output, write_fake_worker
+from tests.utils.cli.apolo_components.apolo_runner import ApoloRunner
+from tests.utils.cli.persistent_command_manager import WORKER_SCRIPT, ApoloWorker
+
+DEFAULT_COMMANDS = ["--version", "--help", "config --help", "storage ls --help"]
+
+
+def default_binary() -> str:
+    # The console script installed next to this interpreter, then PATH
+    local = os.path.join(os.path.dirname(sys.executable), "apolo")
+    return local if os.path.exists(local) else shutil.which("apolo") or "apolo"
+
+
+async def run_all(
+    runner: ApoloRunner, commands: list[list[str]]
+) -> tuple[float, list[tuple[bool, str]]]:
+    outputs = []
+    start = time.perf_counter()
+    for args in commands:
+        ok, _ = await runner.run_command(*args, action="benchmark command")
+        outputs.append((ok, runner.last_command_output.strip()))
+    return time.perf_counter() - start, outputs
+
+
+async def check_large_output(size: int) -> float:
+    commands = [("echo", "x" * size), ("echo", "bad" + "x" * size), ("--version",)]
+    with tempfile.TemporaryDirectory() as work_dir:
+        worker = ApoloWorker(script=write_fake_worker(work_dir, WORKER_SCRIPT))
+        try:
+            start = time.perf_counter()
+            for args in commands:
+                returncode, out, err = await worker.execute(*args)
+                ok, text = expected_output(*args)
+                assert (returncode == 0) == ok, f"{args[0]}: exit code {returncode}"
+                assert (out if ok else err).strip() == text, (
+                    f"{args[0]}: {len(out)}/{len(err)} bytes of output"
+                )
+            seconds = time.perf_counter() - start
+        finally:
+            await worker.close()
+    assert worker.started == 1, f"Worker was restarted {worker.started - 1} times"
+    return seconds
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--commands", nargs="+", default=DEFAULT_COMMANDS)
+    parser.add_argument("--binary", default=None, help="apolo executable")
+    parser.add_argument("--large-output", type=int, default=4 * 2**20, help="Bytes")
+    args = parser.parse_args()
+
+    commands = [shlex.split(command) for command in args.commands] * args.rounds
+    subprocess_runner = ApoloRunner(
+        backend="subprocess", binary=args.binary or default_binary()
+    )
+    worker_runner = ApoloRunner(backend="worker")
+
+    try:
+        warmup, _ = await run_all(worker_runner, [["--version"]])
+        worker, worker_outputs = await run_all(worker_runner, commands)
+    finally:
+        await ApoloWorker.close_shared()
+    spawned, subprocess_outputs = await run_all(subprocess_runner, commands)
+
+    for command, expected, actual in zip(commands, subprocess_outputs, worker_outputs):
+        assert expected == actual, (
+            f"apolo {shlex.join(command)}: subprocess {expected!r}, worker {actual!r}"
+        )
+
+    count = len(commands)
+    print(f"{count} commands ({len(args.commands)} x {args.rounds} rounds)")
+    print(f"{'case':<22} | {'seconds':>8} | {'ms/command':>10} | speedup")
+    rows = [
+        ("subprocess", spawned),
+        ("worker", worker),
+        ("worker incl. startup", worker + warmup),
+    ]
+    for case, seconds in rows:
+        print(
+            f"{case:<22} | {seconds:8.3f} | {seconds / count * 1000:10.1f} | "
+            f"{spawned / seconds:6.1f}x"
+        )
+    print("Both backends produced the same results")
+
+    if args.large_output:
+        seconds = await check_large_output(args.large_output)
+        print(f"Worker returned {args.large_output} bytes of output in {seconds:.3f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+"""
+Micro-benchmark of file comparison: the old 4 KiB md5 loop vs FileHasher.
+
+    python -m tests.benchmarks.bench_file_hasher --sizes 1 16 256 1024
+
+Sizes are in MiB. Every case compares two equal files with different
+inodes, which is the download verification path.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+
+from tests.utils.file_hasher import FileHasher
+from tests.utils.test_data_management.file_generator import FileGenerator
+
+
+def legacy_compare(path_1: str, path_2: str) -> bool:
+    def file_md5(path: str) -> str:
+        hash_md5 = hashlib.md5()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(4096), b""):
+                hash_md5.update(chunk)
+        return hash_md5.hexdigest()
+
+    return file_md5(path_1) == file_md5(path_2)
+
+
+async def _timed(action: Callable[[], Awaitable[bool]]) -> float:
+    start = time.perf_counter()
+    await action()
+    return time.perf_counter() - start
+
+
+async def bench(size_mib: int, work_dir: str) -> list[tuple[str, float]]:
+    source = FileGenerator(work_dir).generate("bin", size_mib * 1024 * 1024, seed=0)
+    copy = os.path.join(work_dir, f"copy-{source.name}")
+    shutil.copyfile(source.path, copy)
+    hasher = FileHasher()
+
+    async def legacy() -> bool:
+        return await asyncio.to_thread(legacy_compare, source.path, copy)
+
+    async def compare() -> bool:
+        return await hasher.same_content_async(source.path, copy)
+
+    async def known_source() -> bool:
+        hasher.remember(source.path, source.md5)
+        return await hasher.same_content_async(source.path, copy)
+
+    results = [("legacy 4 KiB md5", await _timed(legacy))]
+    results.append(("hasher, cold", await _timed(compare)))
+    results.append(("hasher, cached", await _timed(compare)))
+    hasher = FileHasher()
+    results.append(("hasher, known source", await _timed(known_source)))
+    return results
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 16, 256, 1024])
+    parser.add_argument("--dir", default=None, help="Scratch directory")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as work_dir:
+        print(f"{'size':>8} | {'case':<22} | {'seconds':>8} | speedup")
+        for size in args.sizes:
+            results = await bench(size, work_dir)
+            baseline = results[0][1]
+            for case, seconds in results:
+                speedup = baseline / seconds if seconds else float("inf")
+                print(f"{size:>5} MiB | {case:<22} | {seconds:8.3f} | {speedup:6.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,131 @@
+"""
+Benchmark of post-test organisation cleanup: the legacy serial loop vs
+OrgCleaner, against an in-memory API with a fixed latency per request.
+
+    python -m tests.benchmarks.bench_org_cleanup --orgs 3 --projects 4 --parallel 4 8
+
+Besides timing, each OrgCleaner run checks that every organisation and
+project was deleted; with `--fail-every N` every Nth project delete fails
+and the run checks that exactly those projects and their organisations
+are reported and left in place.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from tests.utils.org_cleaner import CleanupResult, OrgCleaner
+
+
+class FakeAPI:
+    """The APIHelper calls OrgCleaner makes, with latency and failures."""
+
+    def __init__(
+        self, orgs: int, projects: int, latency: float, fail_every: int
+    ) -> None:
+        self.latency = latency
+        self.orgs = {
+            f"org-{o}": {f"proj-{o}-{p}" for p in range(projects)} for o in range(orgs)
+        }
+        numbered = [p for org in sorted(self.orgs) for p in sorted(self.orgs[org])]
+        self.failing = {
+            name
+            for idx, name in enumerate(numbered, start=1)
+            if fail_every and idx % fail_every == 0
+        }
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _call(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+    async def get_projects(self, token: str, org_name: str) -> Any:
+        await self._call()
+        return [{"name": name} for name in sorted(self.orgs[org_name])]
+
+    async def delete_proj(self, token: str, org_name: str, proj_name: str) -> Any:
+        await self._call()
+        if proj_name in self.failing:
+            return SimpleNamespace(status=500)
+        self.orgs[org_name].discard(proj_name)
+        return SimpleNamespace(status=204)
+
+    async def delete_org(self, token: str, org_name: str) -> Any:
+        await self._call()
+        if self.orgs[org_name]:
+            return SimpleNamespace(status=409)
+        del self.orgs[org_name]
+        return SimpleNamespace(status=204)
+
+
+async def legacy_cleanup(api: FakeAPI, org_names: list[str]) -> None:
+    for org_name in org_names:
+        try:
+            proj_data = await api.get_projects(token="bench", org_name=org_name)
+            for proj in proj_data:
+                await api.delete_proj(
+                    token="bench", org_name=org_name, proj_name=proj["name"]
+                )
+            await api.delete_org(token="bench", org_name=org_name)
+        except Exception:
+            pass
+
+
+def check(api: FakeAPI, result: CleanupResult) -> None:
+    failing_orgs = {name.split("-")[1] for name in api.failing}
+    expected_left = {f"org-{o}" for o in failing_orgs}
+    assert set(api.orgs) == expected_left, f"Left in place: {sorted(api.orgs)}"
+    reported = {r.split("/")[-1] for r in result.failed_resources if "/" in r}
+    assert reported == api.failing, f"Reported failed projects: {sorted(reported)}"
+    skipped = {r[len("org:") :] for r in result.failed_resources if "/" not in r}
+    assert skipped == expected_left, f"Reported failed orgs: {sorted(skipped)}"
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orgs", type=int, default=3)
+    parser.add_argument("--projects", type=int, default=4, help="Per organisation")
+    parser.add_argument("--parallel", type=int, nargs="+", default=[4, 8])
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds/request")
+    parser.add_argument("--fail-every", type=int, default=0)
+    args = parser.parse_args()
+
+    def new_api() -> FakeAPI:
+        return FakeAPI(args.orgs, args.projects, args.latency, args.fail_every)
+
+    api = new_api()
+    start = time.perf_counter()
+    await legacy_cleanup(api, sorted(api.orgs))
+    baseline = time.perf_counter() - start
+
+    requests = args.orgs * (args.projects + 2)
+    print(f"{args.orgs} orgs x {args.projects} projects, {requests} requests")
+    print(f"{'case':<18} | {'seconds':>8} | {'in flight':>9} | speedup")
+    print(f"{'legacy serial':<18} | {baseline:8.3f} | {1:>9} | {1.0:6.1f}x")
+    for parallel in args.parallel:
+        api = new_api()
+        helper: Any = api
+        cleaner = OrgCleaner(helper, token="bench", max_parallel=parallel)
+        start = time.perf_counter()
+        result = await cleaner.cleanup(sorted(api.orgs))
+        seconds = time.perf_counter() - start
+        check(api, result)
+        case = f"OrgCleaner x{parallel}"
+        print(
+            f"{case:<18} | {seconds:8.3f} | {api.max_in_flight:>9} | "
+            f"{baseline / seconds:6.1f}x"
+        )
+    print("All cleanup results are as expected")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,102 @@
+"""
+Benchmark and check of ApoloRunner.run_many against a fake `apolo`:
+commands run one by one with run_command vs concurrently with run_many.
+
+    python -m tests.benchmarks.bench_run_many --commands 16 --parallel 1 4 8
+
+Every `--bad-every`th command fails. Besides timing, each run checks that
+results keep the input order, that every command got its own output and
+that only the failing commands are reported as failed; a mismatch exits
+with an error.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+
+from tests.benchmarks.fake_apolo import expected_output, write_fake_apolo
+from tests.utils.cli.apolo_components.apolo_runner import (
+    ApoloRunner,
+    CLICommand,
+    CommandResult,
+)
+
+
+def make_commands(count: int, bad_every: int) -> list[CLICommand]:
+    commands = []
+    for idx in range(count):
+        bad = bool(bad_every) and idx % bad_every == 0
+        username = f"bad-user-{idx}" if bad else f"user-{idx}"
+        commands.append(
+            CLICommand(
+                args=("admin", "add-org-user", "bench-org", username, "user"),
+                action=f"add user {username} to organization bench-org",
+            )
+        )
+    return commands
+
+
+def check(
+    commands: list[CLICommand], results: list[CommandResult], runner: ApoloRunner
+) -> None:
+    assert len(results) == len(commands), f"{len(results)} results"
+    for command, result in zip(commands, results):
+        assert result.command == command, f"Out of order: {result.executed}"
+        ok, text = expected_output(*command.args)
+        assert result.ok == ok, f"{result.executed}: ok={result.ok}"
+        assert result.last_output.strip() == text, (
+            f"{result.executed}: got {result.last_output!r}"
+        )
+        assert f"$ {result.executed}\n" in runner.last_command_output, (
+            f"{result.executed} missing from last_command_output"
+        )
+
+
+async def run_serial(
+    runner: ApoloRunner, commands: list[CLICommand]
+) -> list[tuple[bool, str]]:
+    results = []
+    for command in commands:
+        ok, _ = await runner.run_command(*command.args, action=command.action)
+        results.append((ok, runner.last_command_output.strip()))
+    return results
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commands", type=int, default=16)
+    parser.add_argument("--parallel", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--delay", type=float, default=0.5, help="Seconds/command")
+    parser.add_argument("--bad-every", type=int, default=5)
+    args = parser.parse_args()
+
+    commands = make_commands(args.commands, args.bad_every)
+    with tempfile.TemporaryDirectory() as work_dir:
+        binary = write_fake_apolo(work_dir, delay=args.delay)
+        runner = ApoloRunner(backend="subprocess", binary=binary)
+
+        start = time.perf_counter()
+        serial = await run_serial(runner, commands)
+        baseline = time.perf_counter() - start
+        expected = [expected_output(*c.args) for c in commands]
+        assert serial == expected, "run_command results do not match the fake"
+
+        failed = sum(not ok for ok, _ in expected)
+        print(f"{args.commands} commands, {failed} failing, {args.delay}s each")
+        print(f"{'case':<20} | {'seconds':>8} | speedup")
+        print(f"{'run_command loop':<20} | {baseline:8.3f} | {1.0:6.1f}x")
+        for parallel in args.parallel:
+            start = time.perf_counter()
+            results = await runner.run_many(commands, max_parallel=parallel)
+            seconds = time.perf_counter() - start
+            check(commands, results, runner)
+            case = f"run_many x{parallel}"
+            print(f"{case:<20} | {seconds:8.3f} | {baseline / seconds:6.1f}x")
+    print("All results match the fake apolo")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,127 @@
+"""
+Micro-benchmark of app output validation against the schema registry:
+- legacy AppData: schema file re-read and a new Draft7Validator per call;
+- legacy SchemaData: jsonschema.validate() per item, which checks the
+  schema itself every time;
+- registry: compiled validator reused, all errors reported.
+
+    python -m tests.benchmarks.bench_schema_validation --items 10 100 1000
+
+Each run validates a list of `--items` deep_seek API sections `--calls`
+times, every `--invalid-every`th item being invalid.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from jsonschema import Draft7Validator, ValidationError, validate
+
+from tests.utils.test_data_management.app_data import AppData
+
+SCHEMAS_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "components", "app_schemas"
+)
+APP_NAME = "deep_seek"
+
+
+def _section(idx: int, valid: bool) -> dict[str, Any]:
+    section: dict[str, Any] = {
+        "__type__": "OpenAICompatChatAPI",
+        "host": f"deepseek-{idx}.apps.dev.apolo.us",
+        "port": 443,
+        "protocol": "https",
+        "timeout": 30.0,
+        "base_path": "/",
+        "api_type": "rest",
+        "api_base_path": "/v1",
+        "openai_api_type": "chat",
+        "endpoint_url": "/v1/chat/completions",
+        "hf_model": {
+            "__type__": "HuggingFaceModel",
+            "model_hf_name": "deepseek-ai/DeepSeek-R1",
+            "hf_token": None,
+        },
+    }
+    if not valid:
+        section["port"] = "443"
+        section["protocol"] = "ftp"
+    return section
+
+
+async def legacy_validate(outputs: list[dict[str, Any]]) -> tuple[bool, str]:
+    with open(os.path.join(SCHEMAS_PATH, f"{APP_NAME}_output_api_schema.json")) as f:
+        schema = json.load(f)
+    validator = Draft7Validator(schema)
+    errors: list[str] = []
+    for idx, section in enumerate(outputs):
+        try:
+            validator.validate(section)
+        except ValidationError as e:
+            errors.append(f"{idx} validation error: {e.message}")
+    return not errors, ";\n ".join(errors)
+
+
+async def legacy_validate_each(outputs: list[dict[str, Any]]) -> tuple[bool, str]:
+    with open(os.path.join(SCHEMAS_PATH, f"{APP_NAME}_output_api_schema.json")) as f:
+        schema = json.load(f)
+    errors: list[str] = []
+    for idx, section in enumerate(outputs):
+        try:
+            validate(instance=section, schema=schema)
+        except ValidationError as e:
+            errors.append(f"{idx} validation error: {e.message}")
+    return not errors, ";\n ".join(errors)
+
+
+async def registry_validate(outputs: list[dict[str, Any]]) -> tuple[bool, str]:
+    app_data = AppData(SCHEMAS_PATH)
+    await app_data.load_output_api_schema(APP_NAME)
+    return app_data.validate_api_section_schema(outputs)
+
+
+async def _throughput(
+    validate: Callable[[list[dict[str, Any]]], Awaitable[tuple[bool, str]]],
+    outputs: list[dict[str, Any]],
+    calls: int,
+) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        await validate(outputs)
+    return len(outputs) * calls / (time.perf_counter() - start)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--calls", type=int, default=5)
+    parser.add_argument(
+        "--invalid-every", type=int, default=10, help="Every Nth item is invalid"
+    )
+    args = parser.parse_args()
+
+    cases = {
+        "legacy AppData": legacy_validate,
+        "legacy validate()": legacy_validate_each,
+        "registry": registry_validate,
+    }
+    print(f"{'items':>7} | " + " | ".join(f"{name:>17}" for name in cases))
+    for items in args.items:
+        outputs = [
+            _section(idx, valid=bool(idx % args.invalid_every)) for idx in range(items)
+        ]
+        rates = [
+            await _throughput(validate_outputs, outputs, args.calls)
+            for validate_outputs in cases.values()
+        ]
+        print(f"{items:>7} | " + " | ".join(f"{rate:>11,.0f} it/s" for rate in rates))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
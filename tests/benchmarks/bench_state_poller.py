@@ -0,0 +1,119 @@
+"""
+Benchmark of app state waits: the legacy fixed-interval loop per app vs
+one shared StatePoller, against a simulated instances API.
+
+    python -m tests.benchmarks.bench_state_poller --apps 5 --scale 0.01
+
+App i turns healthy `--first-ready + i * --ready-step` seconds after the
+start. All times are in API seconds and multiplied by `--scale` when run,
+so the default scale turns the legacy 20 s interval into 0.2 s. The
+simulated API answers with an ETag and "not modified" while no app moved,
+like get_instances_if_changed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Optional
+
+from tests.utils.state_waiter import PollBackoff, StatePoller
+
+
+class FakeInstances:
+    def __init__(self, ready_at: list[float]) -> None:
+        self.ready_at = ready_at
+        self.started = time.monotonic()
+        self.requests = 0
+        self.not_modified = 0
+
+    def _states(self) -> dict[str, str]:
+        now = time.monotonic() - self.started
+        return {
+            f"app-{idx}": "healthy" if now >= ready else "progressing"
+            for idx, ready in enumerate(self.ready_at)
+        }
+
+    async def get_state(self, app_id: str) -> str:
+        self.requests += 1
+        return self._states()[app_id]
+
+    async def fetch(
+        self, etag: Optional[str]
+    ) -> tuple[Optional[str], Optional[dict[str, dict[str, Any]]]]:
+        self.requests += 1
+        states = self._states()
+        new_etag = str(sorted(states.items()))
+        if new_etag == etag:
+            self.not_modified += 1
+            return etag, None
+        items = {key: {"id": key, "state": state} for key, state in states.items()}
+        return new_etag, items
+
+
+async def legacy_wait(api: FakeInstances, app_id: str, interval: float) -> float:
+    while await api.get_state(app_id) != "healthy":
+        await asyncio.sleep(interval)
+    return time.monotonic() - api.started
+
+
+async def poller_wait(api: FakeInstances, poller: StatePoller, app_id: str) -> float:
+    await poller.wait_for(app_id, states=["healthy"], fail_states=["degraded"])
+    return time.monotonic() - api.started
+
+
+def row(case: str, api: FakeInstances, detected: list[float], scale: float) -> str:
+    # api.ready_at is already scaled
+    lags = [(seen - ready) / scale for seen, ready in zip(detected, api.ready_at)]
+    return (
+        f"{case:<16} | {max(detected) / scale:8.1f} | {api.requests:>8} | "
+        f"{api.not_modified:>12} | {statistics.mean(lags):8.1f} | {max(lags):7.1f}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--apps", type=int, default=5)
+    parser.add_argument("--first-ready", type=float, default=45.0)
+    parser.add_argument("--ready-step", type=float, default=15.0)
+    parser.add_argument("--legacy-interval", type=float, default=20.0)
+    parser.add_argument("--scale", type=float, default=0.01)
+    args = parser.parse_args()
+
+    ready_at = [args.first_ready + idx * args.ready_step for idx in range(args.apps)]
+    scaled = [ready * args.scale for ready in ready_at]
+    app_ids = [f"app-{idx}" for idx in range(args.apps)]
+
+    legacy_api = FakeInstances(scaled)
+    legacy = await asyncio.gather(
+        *(
+            legacy_wait(legacy_api, app_id, args.legacy_interval * args.scale)
+            for app_id in app_ids
+        )
+    )
+
+    poller_api = FakeInstances(scaled)
+    poller = StatePoller(
+        name="bench",
+        fetch=poller_api.fetch,
+        backoff_factory=lambda: PollBackoff(
+            initial=1.0 * args.scale, max_interval=10.0 * args.scale
+        ),
+    )
+    shared = await asyncio.gather(
+        *(poller_wait(poller_api, poller, app_id) for app_id in app_ids)
+    )
+
+    print(f"{args.apps} apps ready after {ready_at[0]:.0f}..{ready_at[-1]:.0f}s")
+    print(
+        f"{'case':<16} | {'total s':>8} | {'requests':>8} | {'not modified':>12} | "
+        f"{'mean lag':>8} | {'max lag':>7}"
+    )
+    print(row("legacy per app", legacy_api, legacy, args.scale))
+    print(row("shared poller", poller_api, shared, args.scale))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+"""
+Deterministic stand-in for the `apolo` executable, for benchmarks and
+checks that must not touch a real cluster.
+
+The fake sleeps FAKE_APOLO_DELAY seconds, echoes its arguments to stdout
+and exits 0. When an argument contains "bad" it writes an error to
+stderr and exits 1 instead. The fake worker answers the same way through
+the apolo worker protocol, without the delay.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+import sys
+
+_SCRIPT = """#!{python}
+import os
+import sys
+import time
+
+time.sleep(float(os.getenv("FAKE_APOLO_DELAY", "{delay}")))
+args = " ".join(sys.argv[1:])
+if any("bad" in arg for arg in sys.argv[1:]):
+    print(f"ERROR: cannot run '{{args}}'", file=sys.stderr)
+    sys.exit(1)
+print(f"OK: {{args}}")
+"""
+
+_WORKER = """import sys
+
+sys.path.insert(0, {worker_dir!r})
+from apolo_worker import serve
+
+
+def main(args):
+    joined = " ".join(args)
+    if any("bad" in arg for arg in args):
+        print(f"ERROR: cannot run '{{joined}}'", file=sys.stderr)
+        sys.exit(1)
+    print(f"OK: {{joined}}")
+
+
+serve(main)
+"""
+
+
+def write_fake_apolo(directory: str, delay: float = 0.5) -> str:
+    """Write an executable fake `apolo` into directory and return its path."""
+    path = os.path.join(directory, "apolo")
+    with open(path, "w") as f:
+        f.write(_SCRIPT.format(python=sys.executable, delay=delay))
+    os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR)
+    return path
+
+
+def write_fake_worker(directory: str, worker_script: str) -> str:
+    """
+    Write a worker script into directory that serves the fake through the
+    real worker loop of worker_script, and return its path.
+    """
+    path = os.path.join(directory, "fake_apolo_worker.py")
+    with open(path, "w") as f:
+        f.write(_WORKER.format(worker_dir=os.path.dirname(worker_script)))
+    return path
+
+
+def expected_output(*args: str) -> tuple[bool, str]:
+    """(ok, stdout or stderr) the fake produces for these arguments."""
+    joined = " ".join(args)
+    if any("bad" in arg for arg in args):
+        return False, f"ERROR: cannot run '{joined}'"
+    return True, f"OK: {joined}"
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import logging
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import Locator
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+logger = logging.getLogger("[🖱️ACTIONABILITY]")
+
+# How long an element may stay covered before the wait gives up early (ms)
+COVERED_GRACE_MS = 1000
+
+# Runs inside the page. Resolves as soon as the element is attached, visible,
+# enabled, accepts pointer events and is not covered by another element, or
+# with the last failed check once the deadline (epoch ms) passes. A detached
+# element resolves immediately so the caller can resolve the locator again,
+# and one that stays covered for `coveredGrace` ms resolves early, since an
+# overlay rarely goes away by itself.
+# DOM mutations schedule a check on the next animation frame; at most one
+# frame is pending at a time. A timer re-checks for frames that are throttled.
+_ACTIONABILITY_SCRIPT = """
+(el, { deadline, coveredGrace }) => new Promise((resolve) => {
+    let done = false;
+    let frame = 0;
+    let coveredSince = null;
+    let observer = null;
+    let timer = null;
+
+    const isDisabled = (node) => {
+        if (node.closest('[aria-disabled="true"]')) return true;
+        if ('disabled' in node && node.disabled) return true;
+        return !!node.closest('fieldset[disabled]') &&
+            ['BUTTON', 'INPUT', 'SELECT', 'TEXTAREA'].includes(node.tagName);
+    };
+
+    const check = () => {
+        if (!el.isConnected) return 'detached';
+        const style = getComputedStyle(el);
+        const rect = el.getBoundingClientRect();
+        if (style.visibility === 'hidden' || rect.width === 0 || rect.height === 0) {
+            return 'not visible';
+        }
+        if (isDisabled(el)) return 'not enabled';
+        if (style.pointerEvents === 'none') return 'pointer-events is none';
+
+        const x = rect.left + rect.width / 2;
+        const y = rect.top + rect.height / 2;
+        if (x >= 0 && y >= 0 && x < innerWidth && y < innerHeight) {
+            const hit = el.getRootNode().elementFromPoint(x, y);
+            if (hit && hit !== el && !el.contains(hit)) return 'covered';
+        }
+        return null;
+    };
+
+    const finish = (reason) => {
+        if (done) return;
+        done = true;
+        if (observer) observer.disconnect();
+        if (timer) clearInterval(timer);
+        if (frame) cancelAnimationFrame(frame);
+        resolve(reason);
+    };
+
+    const tick = () => {
+        if (done) return;
+        const reason = check();
+        const now = Date.now();
+        coveredSince = reason === 'covered' ? (coveredSince ?? now) : null;
+        if (reason === null || reason === 'detached' || now >= deadline ||
+                (coveredSince !== null && now - coveredSince >= coveredGrace)) {
+            finish(reason);
+        }
+    };
+
+    const schedule = () => {
+        if (done || frame) return;
+        frame = requestAnimationFrame(() => {
+            frame = 0;
+            tick();
+        });
+    };
+
+    observer = new MutationObserver(schedule);
+    observer.observe(document, { attributes: true, childList: true, subtree: true });
+    timer = setInterval(tick, 100);
+    tick();
+})
+"""
+
+
+@dataclass
+class ActionabilityStats:
+    """Latency (ms) of every actionability wait, to compare click timings across runs."""
+
+    latencies: list[float] = field(default_factory=list)
+    timeouts: int = 0
+
+    def record(self, latency_ms: float, ready: bool) -> None:
+        self.latencies.append(latency_ms)
+        if not ready:
+            self.timeouts += 1
+
+    def summary(self) -> str:
+        if not self.latencies:
+            return "no clicks recorded"
+        ordered = sorted(self.latencies)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return (
+            f"{len(ordered)} clicks, total {sum(ordered) / 1000:.1f}s, "
+            f"median {statistics.median(ordered):.0f}ms, p95 {p95:.0f}ms, "
+            f"max {ordered[-1]:.0f}ms, timeouts {self.timeouts}"
+        )
+
+
+click_stats = ActionabilityStats()
+
+
+@dataclass
+class Actionability:
+    ready: bool
+    reason: str
+    latency_ms: float
+
+
+async def wait_for_actionable(locator: Locator, timeout: int) -> Actionability:
+    """
+    Wait until the element behind `locator` can receive a click.
+    Usually costs one round trip: attaching is awaited by Playwright, all other
+    checks are polled inside the page until they pass or `timeout` ms elapse.
+    The locator is resolved again if the element gets replaced meanwhile.
+    """
+    started = time.monotonic()
+    deadline = time.time() * 1000 + timeout
+    reason: Any = "not attached"
+    while (remaining := deadline - time.time() * 1000) > 0:
+        try:
+            reason = await locator.evaluate(
+                _ACTIONABILITY_SCRIPT,
+                {"deadline": deadline, "coveredGrace": COVERED_GRACE_MS},
+                timeout=remaining,
+            )
+        except PlaywrightTimeoutError:
+            reason = "not attached"
+            break
+        except PlaywrightError as e:
+            # Navigation or re-render destroyed the element under evaluation
+            if "destroyed" not in str(e) and "not attached" not in str(e):
+                raise
+            reason = "detached"
+        if reason != "detached":
+            break
+    latency_ms = (time.monotonic() - started) * 1000
+    result = Actionability(
+        ready=reason is None, reason=reason or "", latency_ms=latency_ms
+    )
+    click_stats.record(latency_ms, result.ready)
+    if not result.ready:
+        logger.warning(
+            f"{locator} not actionable after {latency_ms:.0f}ms: {result.reason}"
+        )
+    return result
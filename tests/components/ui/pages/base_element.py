@@ -3,6 +3,11 @@ from playwright.async_api import Page, Locator, expect
 
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
+from tests.components.ui.pages.actionability import wait_for_actionable
+
+# Regular click attempt on a covered element before forcing it (ms)
+COVERED_CLICK_TIMEOUT_MS = 2000
+
 
 class BaseElement:
     def __init__(
@@ -53,46 +58,31 @@ class BaseElement:
         except TimeoutError:
             return False
 
-    async def click(self, timeout: int = 10000, interval: int = 500) -> None:
+    async def click(self, timeout: int = 10000) -> None:
         """
-        Attempts to click the element after verifying it is attached, visible, and enabled.
+        Clicks the element as soon as it is attached, visible, enabled,
+        accepts pointer events and is not covered by another element.
 
         Parameters
         ----------
         timeout : int
             Max total wait time in milliseconds (default: 10000).
-        interval : int
-            Wait interval between checks in milliseconds (default: 500).
         """
-        elapsed = 0
-        last_error = None
-
-        while elapsed < timeout:
-            try:
-                # Re-resolve locator to avoid stale references
-                await self.page.wait_for_timeout(interval)
-                self.re_resolve()
-
-                await self.locator.wait_for(state="attached", timeout=interval)
-                await expect(self.locator).to_be_visible(timeout=interval)
-                await expect(self.locator).to_be_enabled(timeout=interval)
-
-                pointer_events = await self.locator.evaluate(
-                    "el => getComputedStyle(el).pointerEvents"
+        # Re-resolve locator to avoid stale references
+        self.re_resolve()
+        state = await wait_for_actionable(self.locator, timeout)
+        click_timeout: Optional[float] = None
+        if not state.ready:
+            if state.reason != "covered":
+                raise TimeoutError(
+                    f"Element not ready for click after {timeout}ms: {self.locator}\nLast error: {state.reason}"
                 )
-                if pointer_events != "none":
-                    break
-            except (AssertionError, PlaywrightTimeoutError) as e:
-                last_error = e
-                await self.page.wait_for_timeout(interval)
-                elapsed += interval
-        else:
-            raise TimeoutError(
-                f"Element not ready for click after {timeout}ms: {self.locator}\nLast error: {last_error}"
-            )
+            # Overlays (tooltips, toasts): one short regular attempt, then
+            # the force click below
+            click_timeout = COVERED_CLICK_TIMEOUT_MS
 
         try:
-            await self.locator.click()
+            await self.locator.click(timeout=click_timeout)
         except PlaywrightTimeoutError:
             await self.locator.click(force=True)
 
@@ -15,19 +15,31 @@ LOGS_DIR = os.path.join(BASE_REPORT_DIR, "logs")
 SCREENSHOTS_DIR = os.path.join(BASE_REPORT_DIR, "screenshots")
 ALLURE_RESULTS_DIR = os.path.join(BASE_REPORT_DIR, "allure-results")
 ALLURE_REPORT_DIR = os.path.join(BASE_REPORT_DIR, "allure-report")
+AUTH_STATES_DIR = os.path.join(BASE_REPORT_DIR, "auth_states")
+# Kept between runs, like the Allure history
+SCHEMA_FINGERPRINTS_DIR = os.path.join(BASE_REPORT_DIR, "schema_fingerprints")
 CONFIG_PATH = os.path.join(PROJECT_ROOT, "tests", "test_data.yaml")
 
 # --- Create necessary directories (only once, master process) ---
 if os.getenv("PYTEST_XDIST_WORKER") in [None, "main"]:
-    for path in [LOGS_DIR, SCREENSHOTS_DIR, ALLURE_RESULTS_DIR, ALLURE_REPORT_DIR]:
+    for path in [
+        LOGS_DIR,
+        SCREENSHOTS_DIR,
+        ALLURE_RESULTS_DIR,
+        ALLURE_REPORT_DIR,
+        AUTH_STATES_DIR,
+        SCHEMA_FINGERPRINTS_DIR,
+    ]:
         os.makedirs(path, exist_ok=True)
-        # Clean old report files (except history)
+        # Clean old report files (except history and schema fingerprints)
         for root, dirs, files in os.walk(BASE_REPORT_DIR):
             for f in files:
                 full_path = os.path.join(root, f)
                 # Skip deleting history
                 if "allure-results/history" in full_path.replace("\\", "/"):
                     continue
+                if full_path.startswith(SCHEMA_FINGERPRINTS_DIR):
+                    continue
                 os.remove(full_path)
 
 # --- Suite-level test outcome tracking ---
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+from uuid import uuid4
+
+from allure_commons import plugin_manager
+from allure_commons.model2 import ATTACHMENT_PATTERN, Attachment, ExecutableItem
+from allure_commons.types import AttachmentType
+
+logger = logging.getLogger("[📎ATTACHMENTS]")
+
+
+@dataclass
+class AttachmentStats:
+    registered: int = 0
+    written: int = 0
+    deduplicated: int = 0
+    failed: int = 0
+    blocked: int = 0
+    bytes_written: int = 0
+    bytes_saved: int = 0
+    write_time: float = 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.registered} registered, {self.written} written "
+            f"({self.bytes_written / 1024**2:.1f} MiB, {self.write_time:.1f}s "
+            f"off the event loop), {self.deduplicated} deduplicated "
+            f"(~{self.bytes_saved / 1024**2:.1f} MiB saved), {self.failed} failed, "
+            f"{self.blocked} waited for a full queue"
+        )
+
+
+_Job = Optional[tuple[str, bytes]]
+
+
+class AttachmentWriter:
+    """
+    Allure attachments with the file write moved to a background thread.
+
+    The attachment is registered in the current step on the calling
+    thread, as `allure.attach` does, since Allure tracks open steps per
+    thread. Only the file write is queued. Identical payloads share one
+    file. The queue is bounded: when it is full, `attach` blocks and
+    `attach_async` waits, so a slow disk slows producers down instead of
+    piling payloads up in memory.
+    """
+
+    def __init__(self, max_queue: int = 64) -> None:
+        self.stats = AttachmentStats()
+        self._queue: queue.Queue[_Job] = queue.Queue(maxsize=max_queue)
+        self._files: dict[str, str] = {}
+        self._pending = 0
+        self._done = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def attach(
+        self,
+        body: str | bytes,
+        name: str,
+        attachment_type: AttachmentType = AttachmentType.TEXT,
+    ) -> None:
+        job = self._register(body, name, attachment_type)
+        if job is None:
+            return
+        if self._queue.full():
+            self.stats.blocked += 1
+        self._queue.put(job)
+
+    async def attach_async(
+        self,
+        body: str | bytes,
+        name: str,
+        attachment_type: AttachmentType = AttachmentType.TEXT,
+    ) -> None:
+        job = self._register(body, name, attachment_type)
+        if job is None:
+            return
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            self.stats.blocked += 1
+            await asyncio.to_thread(self._queue.put, job)
+
+    def flush(self, timeout: float = 60.0) -> bool:
+        """Wait until every queued attachment is on disk."""
+        with self._done:
+            flushed = self._done.wait_for(lambda: self._pending == 0, timeout)
+        if not flushed:
+            logger.warning(f"{self._pending} attachments still queued after {timeout}s")
+        return flushed
+
+    def close(self, timeout: float = 60.0) -> None:
+        self.flush(timeout)
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _register(
+        self, body: str | bytes, name: str, attachment_type: AttachmentType
+    ) -> _Job:
+        reporter = _current_reporter()
+        step = reporter.get_last_item(ExecutableItem) if reporter else None
+        if step is None:
+            return None
+
+        data = body.encode("utf-8") if isinstance(body, str) else body
+        key = f"{attachment_type.extension}:{hashlib.blake2b(data).hexdigest()}"
+        file_name = self._files.get(key)
+        job: _Job = None
+        if file_name is None:
+            file_name = ATTACHMENT_PATTERN.format(
+                prefix=uuid4(), ext=attachment_type.extension
+            )
+            self._files[key] = file_name
+            job = (file_name, data)
+            self._start()
+            with self._done:
+                self._pending += 1
+        else:
+            self.stats.deduplicated += 1
+            self.stats.bytes_saved += len(data)
+
+        step.attachments.append(
+            Attachment(source=file_name, name=name, type=attachment_type.mime_type)
+        )
+        self.stats.registered += 1
+        return job
+
+    def _start(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="allure-attachments", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while (job := self._queue.get()) is not None:
+            file_name, data = job
+            started = time.monotonic()
+            try:
+                plugin_manager.hook.report_attached_data(body=data, file_name=file_name)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not write attachment {file_name}: {e}")
+                written = False
+            else:
+                written = True
+            with self._done:
+                if written:
+                    self.stats.written += 1
+                    self.stats.bytes_written += len(data)
+                else:
+                    self.stats.failed += 1
+                self.stats.write_time += time.monotonic() - started
+                self._pending -= 1
+                self._done.notify_all()
+
+
+def _current_reporter() -> Any:
+    """The AllureReporter of allure-pytest, or None when Allure is off."""
+    for plugin in plugin_manager.get_plugins():
+        reporter = getattr(plugin, "allure_logger", None)
+        if reporter is not None:
+            return reporter
+    return None
+
+
+attachment_writer = AttachmentWriter()
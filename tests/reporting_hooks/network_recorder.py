@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+from allure_commons.types import AttachmentType
+from playwright.async_api import Response
+
+from tests.reporting_hooks.attachments import attachment_writer
+
+logger = logging.getLogger("[🌐NETWORK]")
+
+# NETWORK_RECORD_MODE:
+#   on-fail  - attach the recorded responses to failed tests only (default)
+#   always   - attach them to every test that recorded something
+#   off      - do not record at all
+MODES = ("on-fail", "always", "off")
+
+
+def parse_statuses(spec: str) -> list[tuple[int, int]]:
+    """Parse "400-599,302" into inclusive status ranges."""
+    ranges = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        low, _, high = part.partition("-")
+        ranges.append((int(low), int(high or low)))
+    return ranges
+
+
+@dataclass
+class NetworkPolicy:
+    mode: str = "on-fail"
+    statuses: list[tuple[int, int]] = field(default_factory=lambda: [(400, 599)])
+    url_pattern: Optional[re.Pattern[str]] = None
+    ring_size: int = 50
+    body_limit: int = 2000
+    max_body_bytes: int = 1024 * 1024
+    drain_timeout: float = 10.0
+
+    @classmethod
+    def from_env(cls) -> NetworkPolicy:
+        mode = os.getenv("NETWORK_RECORD_MODE", "on-fail").lower()
+        if mode not in MODES:
+            logger.warning(f"Unknown NETWORK_RECORD_MODE '{mode}', using 'on-fail'")
+            mode = "on-fail"
+        url_pattern = os.getenv("NETWORK_RECORD_URL")
+        return cls(
+            mode=mode,
+            statuses=parse_statuses(os.getenv("NETWORK_RECORD_STATUSES", "400-599")),
+            url_pattern=re.compile(url_pattern) if url_pattern else None,
+            ring_size=int(os.getenv("NETWORK_RING_SIZE", "50")),
+            # Characters of request/response body kept per entry
+            body_limit=int(os.getenv("NETWORK_BODY_LIMIT", "2000")),
+            # Larger responses are recorded without fetching the body
+            max_body_bytes=int(os.getenv("NETWORK_MAX_BODY_BYTES", str(1024**2))),
+            # Seconds to wait at teardown for bodies still being captured
+            drain_timeout=float(os.getenv("NETWORK_DRAIN_TIMEOUT", "10")),
+        )
+
+    def matches(self, status: int, url: str) -> bool:
+        if not any(low <= status <= high for low, high in self.statuses):
+            return False
+        return self.url_pattern is None or bool(self.url_pattern.search(url))
+
+
+@dataclass
+class NetworkStats:
+    seen: int = 0
+    matched: int = 0
+    dropped: int = 0
+    bodies_captured: int = 0
+    bodies_skipped: int = 0
+    body_bytes: int = 0
+    capture_time: float = 0.0
+    late: int = 0
+    attached: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"{self.seen} product responses seen, {self.matched} matched "
+            f"({self.dropped} dropped from ring, {self.late} finished after "
+            f"their test), {self.bodies_captured} bodies captured "
+            f"({self.body_bytes / 1024:.0f} KiB, {self.capture_time:.1f}s), "
+            f"{self.bodies_skipped} too large to capture, {self.attached} network "
+            f"logs attached"
+        )
+
+
+@dataclass
+class NetworkRecorder:
+    """
+    Records product-host responses that match the policy into a per-test
+    ring buffer, in a HAR-like format.
+
+    Responses are filtered on status and URL before anything else is
+    touched; bodies are fetched only for matched responses. Each entry is
+    tagged with the test that was running when the response arrived; a
+    capture that finishes after its test was attached is dropped rather
+    than landing in the next test's buffer. At teardown the pending
+    captures are drained, then the buffer is attached to Allure when the
+    test failed (or always, depending on mode).
+    """
+
+    policy: NetworkPolicy = field(default_factory=NetworkPolicy.from_env)
+    stats: NetworkStats = field(default_factory=NetworkStats)
+    _entries: deque[dict[str, Any]] = field(default_factory=deque)
+    _pending: set[asyncio.Task[None]] = field(default_factory=set)
+    _current: Optional[str] = None
+    _failed: bool = False
+
+    def listener(self, hostname: Optional[str]) -> Callable[[Response], None]:
+        def on_response(response: Response) -> None:
+            if self.policy.mode == "off" or self._current is None:
+                return
+            url = response.url
+            if urlparse(url).hostname != hostname:
+                return
+            self.stats.seen += 1
+            if not self.policy.matches(response.status, url):
+                return
+            self.stats.matched += 1
+            task = asyncio.create_task(self._record(response, self._current))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+        return on_response
+
+    def start_test(self, test: str) -> None:
+        self._entries.clear()
+        self._current = test
+        self._failed = False
+
+    def mark_failed(self, test: str) -> None:
+        if test == self._current:
+            self._failed = True
+
+    async def drain(self) -> None:
+        """Wait for the captures started during the current test."""
+        pending = [task for task in self._pending if not task.done()]
+        if not pending:
+            return
+        _, still_pending = await asyncio.wait(
+            pending, timeout=self.policy.drain_timeout
+        )
+        if still_pending:
+            logger.warning(
+                f"{len(still_pending)} responses still being captured after "
+                f"{self.policy.drain_timeout}s, they will not be attached"
+            )
+
+    def finish_test(self, test: str) -> None:
+        """Attach the recorded responses according to mode."""
+        entries = [e for e in self._entries if e["comment"] == test]
+        failed = self._failed
+        self._entries.clear()
+        self._current = None
+        if not entries or (self.policy.mode == "on-fail" and not failed):
+            return
+        har = {
+            "log": {
+                "version": "1.2",
+                "creator": {"name": "apolo-test-automation", "version": "1"},
+                "entries": entries,
+            }
+        }
+        attachment_writer.attach(
+            json.dumps(har, indent=2),
+            f"Network log: {len(entries)} responses",
+            AttachmentType.JSON,
+        )
+        self.stats.attached += 1
+        logger.info(f"Attached {len(entries)} recorded responses for {test}")
+
+    async def _record(self, response: Response, test: str) -> None:
+        request = response.request
+        status = response.status
+        logger.warning(f"[HTTP {status}] {request.method} {response.url}")
+
+        started = time.monotonic()
+        body = await self._capture_body(response)
+        try:
+            request_body = request.post_data or ""
+        except Exception:
+            request_body = "<not available>"
+        self.stats.capture_time += time.monotonic() - started
+
+        if test != self._current:
+            self.stats.late += 1
+            return
+
+        timing = request.timing
+        entry = {
+            "startedDateTime": datetime.fromtimestamp(
+                timing["startTime"] / 1000, tz=timezone.utc
+            ).isoformat(),
+            "time": max(timing["responseEnd"], timing["responseStart"], 0),
+            "comment": test,
+            "request": {
+                "method": request.method,
+                "url": response.url,
+                "postData": {"text": request_body[: self.policy.body_limit]},
+            },
+            "response": {
+                "status": status,
+                "statusText": response.status_text,
+                "content": {
+                    "mimeType": response.headers.get("content-type", ""),
+                    **body,
+                },
+            },
+        }
+        if len(self._entries) >= self.policy.ring_size:
+            self._entries.popleft()
+            self.stats.dropped += 1
+        self._entries.append(entry)
+
+    async def _capture_body(self, response: Response) -> dict[str, Any]:
+        length = response.headers.get("content-length")
+        if length and length.isdigit() and int(length) > self.policy.max_body_bytes:
+            self.stats.bodies_skipped += 1
+            return {"size": int(length), "comment": "body not captured"}
+        try:
+            body = await response.body()
+        except Exception as e:
+            return {"size": -1, "comment": f"body unavailable: {e}"}
+        self.stats.bodies_captured += 1
+        self.stats.body_bytes += len(body)
+        return {
+            "size": len(body),
+            "text": body[: self.policy.body_limit * 4].decode("utf-8", "replace")[
+                : self.policy.body_limit
+            ],
+        }
+
+
+network_recorder = NetworkRecorder()
@@ -4,21 +4,18 @@ import re
 from collections.abc import Awaitable
 from collections.abc import Callable
 
-import os
-import uuid
 import logging
 import inspect
 from functools import wraps
 from typing import Any, TypeVar, cast
 from collections.abc import Callable as ABC_Callable
 
-from playwright.async_api import Page
-
 import allure
 import markdown  # type: ignore[import-untyped]
 
 from tests.utils.exception_handling.exception_manager import ExceptionManager
-from tests.conftest import SCREENSHOTS_DIR
+from tests.reporting_hooks.attachments import attachment_writer
+from tests.reporting_hooks.screenshots import screenshot_pipeline
 
 logger = logging.getLogger("[📘TEST_INFO]")
 exception_manager = ExceptionManager(logger=logger)
@@ -39,12 +36,7 @@ def async_step(step_name: str) -> Callable[[ReportFunc], ReportFunc]:
                 try:
                     # Attach URL if available
                     if page:
-                        url = page.url
-                        allure.attach(
-                            url,
-                            name="Page URL",
-                            attachment_type=allure.attachment_type.TEXT,
-                        )
+                        await attachment_writer.attach_async(page.url, "Page URL")
 
                     result = await func(*args, **kwargs)
 
@@ -59,19 +51,15 @@ def async_step(step_name: str) -> Callable[[ReportFunc], ReportFunc]:
 
                 finally:
                     if page:
-                        await _capture_screenshot(
-                            page, resolved_name, func.__name__, is_failed
+                        await screenshot_pipeline.on_step_finished(
+                            page, resolved_name, is_failed
                         )
                     if cli_obj:
-                        allure.attach(
-                            cli_obj.last_command_executed,
-                            name="Executed CLI command",
-                            attachment_type=allure.attachment_type.TEXT,
+                        await attachment_writer.attach_async(
+                            cli_obj.last_command_executed, "Executed CLI command"
                         )
-                        allure.attach(
-                            cli_obj.last_command_output,
-                            name="Executed CLI command output",
-                            attachment_type=allure.attachment_type.TEXT,
+                        await attachment_writer.attach_async(
+                            cli_obj.last_command_output, "Executed CLI command output"
                         )
 
         return cast(ReportFunc, wrapper)
@@ -206,29 +194,6 @@ def _handle_if_cli_step(
         return cli_instance
 
 
-async def _capture_screenshot(
-    page: Page, step_name: str, func_name: str, is_failed: bool
-) -> None:
-    """Capture and attach a screenshot to Allure, labeled with pass/fail."""
-    suffix = "fail" if is_failed else "success"
-    screenshot_name = f"{func_name}_{suffix}_{uuid.uuid4().hex[:6]}.png"
-    screenshot_path = os.path.join(SCREENSHOTS_DIR, screenshot_name)
-
-    try:
-        await page.screenshot(path=screenshot_path, full_page=True)
-        with open(screenshot_path, "rb") as f:
-            allure.attach(
-                f.read(),
-                name=f"Screenshot: {step_name} ({suffix})",
-                attachment_type=allure.attachment_type.PNG,
-            )
-        logger.info(
-            f"📸 Screenshot captured and attached ({suffix}): {screenshot_path}"
-        )
-    except Exception as e:
-        logger.warning(f"⚠️ Could not capture screenshot ({suffix}): {e}")
-
-
 def _highlight_code_blocks_html(text: str) -> str:
     return re.sub(
         r"<code>(.*?)</code>",
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+import allure
+from playwright.async_api import Page
+
+from tests.reporting_hooks.attachments import attachment_writer
+
+logger = logging.getLogger("[📸SCREENSHOTS]")
+
+# SCREENSHOT_MODE:
+#   always   - attach a screenshot after every UI step (default)
+#   on-fail  - only capture and attach on failed steps
+#   ring     - keep the last SCREENSHOT_RING_SIZE success shots in memory
+#              and attach them together with the failure shot
+MODES = ("always", "on-fail", "ring")
+
+
+@dataclass
+class ScreenshotPolicy:
+    mode: str = "always"
+    ring_size: int = 3
+    image_format: str = "png"
+    quality: int = 70
+    scale: str = "device"
+
+    @classmethod
+    def from_env(cls) -> ScreenshotPolicy:
+        mode = os.getenv("SCREENSHOT_MODE", "always").lower()
+        if mode not in MODES:
+            logger.warning(f"Unknown SCREENSHOT_MODE '{mode}', using 'always'")
+            mode = "always"
+        image_format = os.getenv("SCREENSHOT_FORMAT", "png").lower()
+        if image_format not in ("png", "jpeg"):
+            logger.warning(f"Unknown SCREENSHOT_FORMAT '{image_format}', using 'png'")
+            image_format = "png"
+        return cls(
+            mode=mode,
+            ring_size=int(os.getenv("SCREENSHOT_RING_SIZE", "3")),
+            image_format=image_format,
+            quality=int(os.getenv("SCREENSHOT_QUALITY", "70")),
+            # "css" takes one pixel per CSS pixel, i.e. downscales HiDPI pages
+            scale=os.getenv("SCREENSHOT_SCALE", "device"),
+        )
+
+
+@dataclass
+class ScreenshotStats:
+    captured: int = 0
+    attached: int = 0
+    dropped: int = 0
+    skipped: int = 0
+    bytes_captured: int = 0
+    bytes_attached: int = 0
+    capture_time: float = 0.0
+    attach_time: float = 0.0
+
+    def summary(self) -> str:
+        avg_size = self.bytes_captured / self.captured if self.captured else 0
+        avg_capture = self.capture_time / self.captured if self.captured else 0
+        avg_attach = self.attach_time / self.attached if self.attached else 0
+        not_attached = self.dropped + self.skipped
+        saved_bytes = int(avg_size * not_attached)
+        saved_time = avg_attach * not_attached + avg_capture * self.skipped
+        return (
+            f"{self.captured} captured ({self.capture_time:.1f}s), "
+            f"{self.attached} attached ({self.bytes_attached / 1024**2:.1f} MiB, "
+            f"{self.attach_time:.1f}s), {self.dropped} dropped from ring, "
+            f"{self.skipped} skipped; saved ~{saved_bytes / 1024**2:.1f} MiB "
+            f"and ~{saved_time:.1f}s"
+        )
+
+
+@dataclass
+class _Shot:
+    name: str
+    body: bytes
+
+
+@dataclass
+class ScreenshotPipeline:
+    """
+    Captures step screenshots in memory and attaches them according to policy.
+    Attachments are registered while the step is still open; the attachment
+    writer puts the files on disk without blocking the loop.
+    """
+
+    policy: ScreenshotPolicy = field(default_factory=ScreenshotPolicy.from_env)
+    stats: ScreenshotStats = field(default_factory=ScreenshotStats)
+    _rings: weakref.WeakKeyDictionary[Page, deque[_Shot]] = field(
+        default_factory=weakref.WeakKeyDictionary
+    )
+
+    async def on_step_finished(
+        self, page: Page, step_name: str, is_failed: bool
+    ) -> None:
+        suffix = "fail" if is_failed else "success"
+        if not is_failed and self.policy.mode == "on-fail":
+            self.stats.skipped += 1
+            return
+
+        try:
+            body = await self._capture(page)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not capture screenshot ({suffix}): {e}")
+            return
+        shot = _Shot(name=f"Screenshot: {step_name} ({suffix})", body=body)
+
+        if self.policy.mode != "ring":
+            await self._attach(shot)
+            return
+
+        ring = self._rings.setdefault(page, deque())
+        if not is_failed:
+            ring.append(shot)
+            if len(ring) > self.policy.ring_size:
+                ring.popleft()
+                self.stats.dropped += 1
+            return
+
+        # Failure: flush the steps that led here, oldest first
+        while ring:
+            await self._attach(ring.popleft())
+        await self._attach(shot)
+
+    async def _capture(self, page: Page) -> bytes:
+        options: dict[str, Any] = {
+            "full_page": True,
+            "type": self.policy.image_format,
+            "scale": self.policy.scale,
+        }
+        if self.policy.image_format == "jpeg":
+            options["quality"] = self.policy.quality
+
+        started = time.monotonic()
+        body = await page.screenshot(**options)
+        self.stats.capture_time += time.monotonic() - started
+        self.stats.captured += 1
+        self.stats.bytes_captured += len(body)
+        return body
+
+    async def _attach(self, shot: _Shot) -> None:
+        attachment_type = (
+            allure.attachment_type.JPG
+            if self.policy.image_format == "jpeg"
+            else allure.attachment_type.PNG
+        )
+        started = time.monotonic()
+        try:
+            # Must not be moved to an executor: Allure keeps open steps per
+            # thread and seeds a new thread only once, so attaching from a
+            # pooled thread lands in the first step that thread ever saw.
+            # The writer registers here, on the loop thread, and only
+            # writes the file in the background.
+            await attachment_writer.attach_async(shot.body, shot.name, attachment_type)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not attach {shot.name}: {e}")
+            return
+        self.stats.attach_time += time.monotonic() - started
+        self.stats.attached += 1
+        self.stats.bytes_attached += len(shot.body)
+        logger.info(f"📸 {shot.name} attached ({len(shot.body) / 1024:.0f} KiB)")
+
+
+screenshot_pipeline = ScreenshotPipeline()
@@ -10,10 +10,14 @@ from tests.test_cases.steps.api_steps.api_steps import APISteps
 from tests.test_cases.steps.cli_steps.cli_steps import CLISteps
 from tests.test_cases.steps.ui_steps.ui_steps import UISteps
 from tests.utils.cli.apolo_cli import ApoloCLI
+from tests.utils.instance_state_monitor import InstanceStateMonitor
 from tests.utils.test_config_helper import ConfigManager
 from tests.utils.test_data_management.test_data import DataManager
 from tests.utils.test_data_management.users_manager import UsersManager
 from tests.utils.api_helper import APIHelper
+from tests.utils.auth_state_cache import AuthStateCache
+from tests.utils.test_data_management.schema_data import SchemaData
+from tests.utils.topology_cache import TopologyCache
 
 
 class BaseTestClass:
@@ -27,6 +31,10 @@ class BaseTestClass:
         users_manager: UsersManager,
         api_helper: APIHelper,
         apolo_cli: ApoloCLI,
+        instance_state_monitor: InstanceStateMonitor,
+        auth_state_cache: AuthStateCache,
+        topology_cache: TopologyCache,
+        schema_data: SchemaData,
     ) -> None:
         """
         Inject test dependencies into the base test class.
@@ -36,6 +44,10 @@ class BaseTestClass:
         - PageManager factory (`add_page_manager`)
         - Test configuration
         - Data/user/API helpers
+        - Shared app instance state monitor
+        - Cached login state of test users
+        - Topology cache shared by the tests of the class
+        - Saved template schemas
         """
         self._pm = page_manager
         self._add_pm = add_page_manager
@@ -44,6 +56,10 @@ class BaseTestClass:
         self._users_manager = users_manager
         self._api_helper = api_helper
         self._apolo_cli = apolo_cli
+        self._instance_state_monitor = instance_state_monitor
+        self._auth_state_cache = auth_state_cache
+        self._topology_cache = topology_cache
+        self._schema_data = schema_data
 
         self._user_counter = 1
         self._primary_taken = False
@@ -91,6 +107,7 @@ class BaseTestClass:
             self._data_manager,
             self._users_manager,
             self._api_helper,
+            self._auth_state_cache,
         )
 
         return steps
@@ -108,5 +125,8 @@ class BaseTestClass:
             test_config=self._test_config,
             api_helper=self._api_helper,
             data_manager=self._data_manager,
+            instance_monitor=self._instance_state_monitor,
+            topology_cache=self._topology_cache,
+            schema_data=self._schema_data,
         )
         return steps
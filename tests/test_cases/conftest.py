@@ -2,29 +2,46 @@ from __future__ import annotations
 from collections.abc import AsyncGenerator
 
 import asyncio
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Generator
 import logging
 import os
+import time
 from typing import Any
 from urllib.parse import urlparse
 
 import allure
 import pytest
 from _pytest.fixtures import FixtureRequest
-from allure_commons.types import AttachmentType
-from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright
+from playwright.async_api import BrowserContext
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 
+from tests.conftest import AUTH_STATES_DIR, SCHEMA_FINGERPRINTS_DIR
 from tests.components.ui.page_manager import PageManager
+from tests.components.ui.pages.actionability import click_stats
+from tests.reporting_hooks.attachments import attachment_writer
+from tests.reporting_hooks.network_recorder import network_recorder
+from tests.reporting_hooks.screenshots import screenshot_pipeline
 from tests.test_cases.steps.ui_steps.ui_steps import UISteps
 from tests.utils.api_helper import APIHelper
+from tests.utils.api_retry import default_retry_middleware
+from tests.utils.api_session_pool import APISessionPool
+from tests.utils.auth_state_cache import AuthStateCache, decode_jwt_expiry
+from tests.utils.browser_pool import BrowserPool
 from tests.utils.cli.apolo_cli import ApoloCLI
+from tests.utils.cli.persistent_command_manager import ApoloWorker
 from tests.utils.exception_handling.exception_manager import ExceptionManager
+from tests.utils.file_hasher import file_hasher
+from tests.utils.instance_state_monitor import InstanceStateMonitor
+from tests.utils.org_cleaner import OrgCleaner
 from tests.utils.test_config_helper import ConfigManager
 from tests.utils.test_data_management.schema_data import SchemaData
+from tests.utils.test_data_management.schema_drift import FingerprintStore
+from tests.utils.test_data_management.schema_registry import schema_registry
 from tests.utils.test_data_management.test_data import DataManager
+from tests.utils.test_data_management.user_pool import UserPool
 from tests.utils.test_data_management.users_manager import UsersManager, UserData
+from tests.utils.topology_cache import TopologyCache
 
 logger = logging.getLogger("[🔧TEST CONFIG]")
 exception_manager = ExceptionManager(logger=logger)
@@ -34,13 +51,29 @@ CONFIG_PATH = os.path.join(PROJECT_ROOT, "tests", "test_data.yaml")
 APP_OUTPUT_SCHEMA_PATH = os.path.join(
     PROJECT_ROOT, "tests", "components", "app_schemas"
 )
+SAVED_SCHEMAS_PATH = os.path.join(
+    PROJECT_ROOT, "tests", "components", "json_schema", "saved_schemas"
+)
 
 STORAGE_OBJECTS_PATH = os.path.join(PROJECT_ROOT, "storage_objects")
 GENERATED_DATA_PATH = os.path.join(STORAGE_OBJECTS_PATH, "generated_objects")
 DOWNLOAD_PATH = os.path.join(STORAGE_OBJECTS_PATH, "downloads")
+# Holds credentials, so it is kept outside the repository
+USER_POOL_FILE = os.getenv(
+    "USER_POOL_FILE",
+    os.path.join(
+        os.path.expanduser("~"), ".cache", "apolo-test-automation", "user_pool.json"
+    ),
+)
+
+# Warm per-worker browsers; each PageManager gets its own fresh context
+_browser_pool = BrowserPool()
+
+# Track per-test browser contexts
+_browser_contexts: list[BrowserContext] = []
 
-# Track per-test browser/context/playwright triples
-_browser_context_triples: list[tuple[Browser, BrowserContext, Playwright]] = []
+# Pooled users whose token expires sooner are not leased (seconds)
+POOLED_TOKEN_MARGIN = 2 * 60 * 60
 
 main_user: UserData | None = None
 second_user: UserData | None = None
@@ -48,9 +81,61 @@ third_user: UserData | None = None
 
 
 @pytest.fixture(scope="session", autouse=True)
-def ensure_storage_directories() -> None:
+def ensure_storage_directories() -> Generator[None, None, None]:
     for path in (STORAGE_OBJECTS_PATH, GENERATED_DATA_PATH, DOWNLOAD_PATH):
         os.makedirs(path, exist_ok=True)
+    yield
+    logger.info(f"File hashing: {file_hasher.stats.summary()}")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def preload_schemas() -> Generator[None, None, None]:
+    schema_registry.preload(APP_OUTPUT_SCHEMA_PATH, "*_schema.json")
+    yield
+    logger.info(f"JSON schemas: {schema_registry.stats.summary()}")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(
+    item: pytest.Item, call: pytest.CallInfo[None]
+) -> Generator[None, Any, None]:
+    outcome = yield
+    report = outcome.get_result()
+    if report.when in ("setup", "call") and report.failed:
+        network_recorder.mark_failed(item.nodeid)
+
+
+# Defined before setup_cleanup so it is set up first and also covers
+# setup failures; it is torn down last, after the post-test cleanup
+@pytest.fixture(autouse=True)
+async def network_log(request: FixtureRequest) -> AsyncGenerator[None, None]:
+    network_recorder.start_test(request.node.nodeid)
+    yield
+    await network_recorder.drain()
+    network_recorder.finish_test(request.node.nodeid)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item: pytest.Item) -> Generator[None, None, None]:
+    yield
+    # After fixture finalizers, so cleanup attachments are flushed too
+    attachment_writer.flush()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def close_attachment_writer() -> Generator[None, None, None]:
+    yield
+    attachment_writer.close()
+    logger.info(f"Allure attachments: {attachment_writer.stats.summary()}")
+    logger.info(f"Network recorder: {network_recorder.stats.summary()}")
+
+
+@pytest.fixture(scope="session", autouse=True)
+async def browser_pool() -> AsyncGenerator[BrowserPool, None]:
+    yield _browser_pool
+    await _browser_pool.close()
+    logger.info(f"Click actionability: {click_stats.summary()}")
+    logger.info(f"Screenshots: {screenshot_pipeline.stats.summary()}")
 
 
 @pytest.fixture(scope="function")
@@ -74,7 +159,7 @@ async def add_page_manager(
         pm1 = await add_page_manager()
         pm2 = await add_page_manager()
 
-    All opened browsers/contexts/playwrights are closed automatically after the test.
+    All opened contexts are closed automatically after the test.
     """
 
     async def _factory() -> PageManager:
@@ -100,30 +185,154 @@ def data_manager() -> DataManager:
     )
 
 
+@pytest.fixture(scope="session")
+def schema_fingerprints() -> Generator[FingerprintStore, None, None]:
+    store = FingerprintStore(
+        os.path.join(SCHEMA_FINGERPRINTS_DIR, "app_template_snapshots.json")
+    )
+    yield store
+    store.save()
+
+
 @pytest.fixture
-def schema_data() -> SchemaData:
+def schema_data(schema_fingerprints: FingerprintStore) -> SchemaData:
     logger.info("Creating schema data manager")
-    return SchemaData("components/json_schema/saved_schemas")
+    return SchemaData(SAVED_SCHEMAS_PATH, fingerprints=schema_fingerprints)
+
+
+@pytest.fixture(scope="session")
+async def api_session_pool() -> AsyncGenerator[APISessionPool, None]:
+    logger.info("Creating shared API session pool")
+    pool = APISessionPool()
+    yield pool
+    await pool.close()
+    logger.info(f"API retries: {default_retry_middleware.stats.summary()}")
 
 
 @pytest.fixture(scope="function")
-async def api_helper(test_config: ConfigManager) -> AsyncGenerator[APIHelper, None]:
+async def api_helper(
+    test_config: ConfigManager, api_session_pool: APISessionPool
+) -> AsyncGenerator[APIHelper, None]:
     logger.info("Creating API helper")
-    helper = await APIHelper(config=test_config).init()
+    helper = await APIHelper(config=test_config, pool=api_session_pool).init()
     yield helper
     await helper._close()
 
 
+@pytest.fixture(scope="session")
+async def instance_state_monitor(
+    api_session_pool: APISessionPool,
+) -> AsyncGenerator[InstanceStateMonitor, None]:
+    logger.info("Creating shared app instance state monitor")
+    helper = await APIHelper(
+        config=ConfigManager(CONFIG_PATH), pool=api_session_pool
+    ).init()
+    yield InstanceStateMonitor(api_helper=helper)
+    await helper._close()
+
+
+@pytest.fixture(scope="session")
+def auth_state_cache() -> AuthStateCache:
+    logger.info("Creating auth state cache")
+    return AuthStateCache(AUTH_STATES_DIR)
+
+
+@pytest.fixture(scope="session", autouse=True)
+async def apolo_worker() -> AsyncGenerator[None, None]:
+    """Stops the shared apolo CLI worker used by APOLO_CLI_BACKEND=worker."""
+    yield
+    await ApoloWorker.close_shared()
+
+
 @pytest.fixture(scope="function")
 def apolo_cli() -> ApoloCLI:
     logger.info("Creating Apolo CLI instance")
     return ApoloCLI()
 
 
+@pytest.fixture(scope="session")
+async def user_pool(
+    request: pytest.FixtureRequest,
+    api_session_pool: APISessionPool,
+    auth_state_cache: AuthStateCache,
+) -> AsyncGenerator[UserPool, None]:
+    """
+    On-disk pool of signed up users shared by workers and reused across runs.
+    Set USER_POOL_SIZE to sign up that many spare users before the first test.
+    """
+    pool = UserPool(USER_POOL_FILE)
+    size = int(os.getenv("USER_POOL_SIZE", "0"))
+    if size:
+        logger.info(f"Provisioning user pool up to {size} free users")
+        test_config = ConfigManager(CONFIG_PATH)
+        helper = await APIHelper(config=test_config, pool=api_session_pool).init()
+
+        async def _signup() -> UserData:
+            pm = await _create_page_manager(test_config, request)
+            ui_steps = UISteps(
+                pm,
+                test_config,
+                DataManager(
+                    gen_obj_path=GENERATED_DATA_PATH,
+                    download_path=DOWNLOAD_PATH,
+                    output_schemas_path=APP_OUTPUT_SCHEMA_PATH,
+                ),
+                UsersManager(),
+                helper,
+                auth_state_cache,
+            )
+            try:
+                return await ui_steps.ui_signup_new_user_ver_link()
+            finally:
+                await _cleanup_browsers()
+
+        try:
+            await pool.provision(size, _signup)
+        except Exception as e:
+            logger.warning(f"User pool provisioning failed: {e}")
+        finally:
+            await helper._close()
+
+    yield pool
+    if main_user:
+        pool.release(main_user)
+    pool.release_all()
+
+
 @pytest.fixture(scope="function")
-def users_manager() -> UsersManager:
+def users_manager(user_pool: UserPool) -> UsersManager:
     logger.info("Creating users manager")
-    return UsersManager()
+    return UsersManager(user_pool=user_pool)
+
+
+@pytest.fixture(scope="function")
+async def topology_cache(
+    request: FixtureRequest, api_helper: APIHelper
+) -> AsyncGenerator[TopologyCache, None]:
+    """
+    Topology cache shared by the tests of a class. Runs after the per-test
+    cleanup: drops this test's references, and after the last test of the
+    class deletes the cached orgs.
+    """
+    cache = getattr(request.cls, "_topology_cache", None)
+    if cache is None or cache.closed:
+        pending = {request.node.nodeid}
+        if cache is None and request.cls is not None:
+            pending |= {
+                item.nodeid
+                for item in request.session.items
+                if item.parent == request.node.parent
+            }
+        cache = TopologyCache(pending_tests=pending)
+        if request.cls is not None:
+            request.cls._topology_cache = cache
+
+    yield cache
+
+    await cache.release_held(api_helper)
+    if cache.finish_test(request.node.nodeid):
+        result = await cache.close(api_helper)
+        logger.info(f"Topology cache closed:\n{result.summary()}")
 
 
 @pytest.fixture(autouse=True)
@@ -135,11 +344,19 @@ async def setup_cleanup(
     users_manager: "UsersManager",
     api_helper: "APIHelper",
     apolo_cli: "ApoloCLI",
+    auth_state_cache: "AuthStateCache",
+    topology_cache: "TopologyCache",
 ) -> AsyncGenerator[None, None]:
     run_once = "class_setup" in request.keywords
 
     async def _teardown() -> Any:
-        await _do_full_teardown_logic(request, users_manager, data_manager, api_helper)
+        await _do_full_teardown_logic(
+            request,
+            users_manager,
+            data_manager,
+            api_helper,
+            keep_orgs=topology_cache.pinned_orgs(),
+        )
 
     if run_once:
         # first time we see this class
@@ -153,7 +370,12 @@ async def setup_cleanup(
 
             # run setup once for this class
             await _do_full_setup_logic(
-                request, test_config, data_manager, users_manager, api_helper
+                request,
+                test_config,
+                data_manager,
+                users_manager,
+                api_helper,
+                auth_state_cache,
             )
 
             # save users for reuse
@@ -181,7 +403,12 @@ async def setup_cleanup(
     else:
         # per-test setup/teardown
         await _do_full_setup_logic(
-            request, test_config, data_manager, users_manager, api_helper
+            request,
+            test_config,
+            data_manager,
+            users_manager,
+            api_helper,
+            auth_state_cache,
         )
 
         def finalizer() -> None:
@@ -200,9 +427,17 @@ async def _do_full_setup_logic(
     data_manager: DataManager,
     users_manager: UsersManager,
     api_helper: APIHelper,
+    auth_state_cache: AuthStateCache,
 ) -> None:
     global main_user, second_user, third_user
 
+    if not main_user:
+
+        async def _check(user: UserData) -> bool:
+            return await _reset_pooled_user(user, data_manager, api_helper)
+
+        main_user = await users_manager.lease_pooled_user(_check)
+
     if main_user:
         logger.info(f"Continue using {main_user} as main test user...")
         users_manager.main_user = main_user
@@ -215,9 +450,15 @@ async def _do_full_setup_logic(
             try:
                 pm = await _create_page_manager(test_config, request)
                 ui_steps = UISteps(
-                    pm, test_config, data_manager, users_manager, api_helper
+                    pm,
+                    test_config,
+                    data_manager,
+                    users_manager,
+                    api_helper,
+                    auth_state_cache,
                 )
                 main_user = await ui_steps.ui_signup_new_user_ver_link()
+                users_manager.add_to_pool(main_user)
                 users_manager.main_user = main_user
                 users_manager.main_user.authorized = False
                 break
@@ -244,6 +485,36 @@ async def _do_full_setup_logic(
         users_manager.third_user.authorized = False  # type: ignore[union-attr]
 
 
+async def _reset_pooled_user(
+    user: UserData, data_manager: DataManager, api_helper: APIHelper
+) -> bool:
+    """
+    Check that a pooled main user still works and bring it back to the state
+    of a fresh signup: no organisations. Users with an expired token are
+    dropped, so a new user is signed up instead.
+    """
+    expires_at = decode_jwt_expiry(user.token) if user.token else None
+    if expires_at is None or expires_at - time.time() < POOLED_TOKEN_MARGIN:
+        logger.info(f"Token of pooled user {user.email} expired")
+        return False
+
+    org_data = await api_helper.get_orgs(token=user.token)
+    if not isinstance(org_data, list):
+        logger.info(f"Pooled user {user.email} was rejected: {org_data}")
+        return False
+
+    organizations = [org["name"] for org in org_data if "name" in org]
+    if organizations:
+        cleaner = OrgCleaner(api_helper=api_helper, token=user.token)
+        result = await cleaner.cleanup(organizations)
+        for org_name in result.deleted_orgs:
+            data_manager.remove_organization(org_name)
+        if result.failures:
+            logger.info(f"Can not reset pooled user {user.email}:\n{result.summary()}")
+            return False
+    return True
+
+
 # ------------------------------
 # Teardown Logic
 # ------------------------------
@@ -252,6 +523,7 @@ async def _do_full_teardown_logic(
     users_manager: UsersManager,
     data_manager: DataManager,
     api_helper: APIHelper,
+    keep_orgs: set[str] | None = None,
 ) -> None:
     global second_user, third_user
 
@@ -262,7 +534,9 @@ async def _do_full_teardown_logic(
 
     with allure.step("Post-test cleanup"):
         try:
-            await _cleanup_orgs(data_manager, api_helper)
+            await _cleanup_orgs(data_manager, api_helper, keep_orgs)
+            # Fetch pending response bodies while the pages are still open
+            await network_recorder.drain()
             await _cleanup_browsers()
         except Exception as exc:
             if not hasattr(request.session, "cleanup_warning"):
@@ -271,69 +545,48 @@ async def _do_full_teardown_logic(
                 )
             formatted_msg = exception_manager.handle(exc, context="Post-test cleanup")
             logger.exception(f"Post-test cleanup failed: {formatted_msg}")
-            allure.attach(
-                formatted_msg,
-                name="Cleanup exception",
-                attachment_type=AttachmentType.TEXT,
-            )
+            attachment_writer.attach(formatted_msg, "Cleanup exception")
             logger.warning(f"Post-test cleanup failed: {formatted_msg}", RuntimeWarning)
 
 
 async def _cleanup_orgs(
     data_manager: DataManager,
     api_helper: APIHelper,
+    keep_orgs: set[str] | None = None,
 ) -> None:
-    global main_user, second_user, third_user
     if not main_user:
         logger.info("Main user is None. Nothing to cleanup.")
         return
     org_data = await api_helper.get_orgs(token=main_user.token)
-    organizations = [org["name"] for org in org_data if "name" in org]
+    # Orgs of cached topologies are deleted by the topology cache itself
+    organizations = [
+        org["name"]
+        for org in org_data
+        if "name" in org and org["name"] not in (keep_orgs or set())
+    ]
     token = main_user.token
     logger.info(f"Cleaning up {len(organizations)} organisations")
 
     if not organizations:
-        allure.attach(
-            "No organisations to clean up.",
-            name="Cleanup note",
-            attachment_type=AttachmentType.TEXT,
-        )
+        attachment_writer.attach("No organisations to clean up.", "Cleanup note")
         return
 
-    for org_name in organizations:
-        with allure.step(f"Delete organisation: {org_name}"):
-            try:
-                proj_data = await api_helper.get_projects(
-                    token=token, org_name=org_name
-                )
-                projects = [proj["name"] for proj in proj_data if "name" in proj]
-                logger.info(f"Cleaning up {len(projects)} projects")
-                for proj_name in projects:
-                    with allure.step(f"Delete project: {proj_name}"):
-                        await api_helper.delete_proj(
-                            token=token, org_name=org_name, proj_name=proj_name
-                        )
-                        logger.info(f"Deleted project: {proj_name}")
-                await api_helper.delete_org(token=token, org_name=org_name)
-                data_manager.remove_organization(org_name)
-            except Exception as exc:
-                formatted_msg = exception_manager.handle(
-                    exc, context="Post-test cleanup"
-                )
-                logger.warning(f"Can not delete org: {formatted_msg}")
-                logger.warning("Need to setup new test users due to cleanup issues...")
-                main_user = None
-                second_user = None
-                third_user = None
-            else:
-                logger.info(f"Deleted organisation: {org_name}")
+    cleaner = OrgCleaner(api_helper=api_helper, token=token)
+    result = await cleaner.cleanup(organizations)
+    for org_name in result.deleted_orgs:
+        data_manager.remove_organization(org_name)
+
+    attachment_writer.attach(result.summary(), "Cleanup summary")
+    if result.failures:
+        # Remaining resources are retried by the next cleanup run
+        logger.warning(f"Can not delete resources: {result.failed_resources}")
 
 
 async def _cleanup_browsers() -> None:
-    global _browser_context_triples
+    global _browser_contexts
     logger.info("Closing all browser sessions")
 
-    for browser, context, playwright in list(_browser_context_triples):
+    for context in list(_browser_contexts):
         try:
             for page in context.pages:
                 listener = getattr(page, "_response_listener", None)
@@ -343,57 +596,24 @@ async def _cleanup_browsers() -> None:
         except Exception as e:
             logger.warning(f"Failed to remove listeners: {e}")
 
-        try:
-            if context:
-                await asyncio.wait_for(context.close(), timeout=3)
-                logger.info("Closed context")
-        except Exception as e:
-            logger.warning(f"Failed to close context: {e}")
-
-        try:
-            if browser and browser.is_connected():
-                await asyncio.wait_for(browser.close(), timeout=3)
-                logger.info("Closed browser")
-        except Exception as e:
-            logger.warning(f"Failed to close browser: {e}")
+        # Context is always closed; the browser itself stays warm in the pool
+        await _browser_pool.release(context)
 
-        try:
-            await asyncio.wait_for(playwright.stop(), timeout=3)
-            logger.info("Stopped Playwright")
-        except Exception as e:
-            logger.warning(f"Failed to stop Playwright: {e}")
-
-    _browser_context_triples.clear()
+    _browser_contexts.clear()
     logger.info("Browser cleanup finished")
 
 
-async def _start_browser() -> tuple[Browser, Playwright]:
-    """
-    Start Playwright + Chromium browser (per test).
-    """
-    playwright = await async_playwright().start()
-    logger.info("Starting browser in a headless mode...")
-    browser = await playwright.chromium.launch(
-        headless=True,
-        args=["--no-sandbox", "--disable-dev-shm-usage", "--window-size=1920,1080"],
-    )
-    return browser, playwright
-
-
 async def _create_page_manager(
     test_config: ConfigManager, request: pytest.FixtureRequest
 ) -> PageManager:
-    playwright: Playwright = await async_playwright().start()
-    browser = await playwright.chromium.launch(
-        headless=True,
-        args=["--no-sandbox", "--disable-dev-shm-usage", "--window-size=1920,1080"],
-    )
-    context = await browser.new_context(no_viewport=True, accept_downloads=True)
+    context = await _browser_pool.new_context(no_viewport=True, accept_downloads=True)
 
-    _browser_context_triples.append((browser, context, playwright))
+    _browser_contexts.append(context)
 
     page = await context.new_page()
-    page.on("response", lambda response: _log_failed_requests(test_config, response))
+    listener = network_recorder.listener(urlparse(test_config.cli_login_url).hostname)
+    page.on("response", listener)
+    setattr(page, "_response_listener", listener)
 
     logger.info(f"Navigating to: {test_config.base_url}")
     try:
@@ -404,44 +624,3 @@ async def _create_page_manager(
     test_config.context = context
     request.node.page = page
     return PageManager(page)
-
-
-async def _log_failed_requests(test_config: ConfigManager, response: Any) -> None:
-    """
-    Logs HTTP responses within product hostname.
-    """
-    status = response.status
-    request = response.request
-    url = request.url
-
-    cli_login_url = test_config.cli_login_url
-    product_hostname = urlparse(cli_login_url).hostname
-
-    parsed_url = urlparse(url)
-    if parsed_url.hostname != product_hostname:
-        return
-
-    if status >= 200:
-        method = request.method
-        try:
-            request_body = request.post_data or "<not available>"
-        except Exception:
-            request_body = "<not available>"
-
-        try:
-            response_body = await response.text()
-        except Exception:
-            response_body = "<unavailable>"
-
-        log_msg = (
-            f"[HTTP {status}] {method} {url}\n"
-            f"Request Body (first 2000 chars):\n{request_body[:2000]}\n"
-            f"Response Body (first 2000 chars):\n{response_body[:2000]}"
-        )
-
-        logger.warning(log_msg)
-        allure.attach(
-            log_msg,
-            name=f"HTTP {status} - {method} {os.path.basename(url)}",
-            attachment_type=AttachmentType.TEXT,
-        )
@@ -227,6 +227,26 @@ class AdminSteps:
         )
         assert result, error_message
 
+    @async_step("Add users to organization via CLI")
+    async def cli_add_users_to_org(
+        self, org_name: str, usernames: list[str], role: str = "user"
+    ) -> None:
+        results = await self._apolo_cli.admin.add_users_to_org(
+            org_name=org_name, usernames=usernames, role=role.lower()
+        )
+        failed = [f"{r.executed}: {r.error}" for r in results if not r.ok]
+        assert not failed, "\n".join(failed)
+
+    @async_step("Add organization members to projects via CLI")
+    async def cli_add_org_members_to_projects(
+        self, org_name: str, proj_names: list[str], usernames: list[str], role: str
+    ) -> None:
+        results = await self._apolo_cli.admin.add_users_to_projects(
+            org_name=org_name, proj_names=proj_names, usernames=usernames, role=role
+        )
+        failed = [f"{r.executed}: {r.error}" for r in results if not r.ok]
+        assert not failed, "\n".join(failed)
+
     @async_step("Remove user from organization via CLI")
     async def cli_remove_user_from_org(
         self, org_name: str, username: str, expected_error: str = ""
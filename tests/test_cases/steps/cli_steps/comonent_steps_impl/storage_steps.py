@@ -101,9 +101,9 @@ class StorageSteps:
     async def validate_file_matches_expected_file(
         self, file_path_1: str, file_path_2: str
     ) -> None:
-        assert self._data_manager.compare_files_md5(file_path_1, file_path_2), (
-            "MD5 hash does not match!"
-        )
+        assert await self._data_manager.compare_files_md5_async(
+            file_path_1, file_path_2
+        ), "MD5 hash does not match!"
 
     @async_step("Verify folder listed in ls output")
     async def verify_folder_listed(self, folder_name: str) -> None:
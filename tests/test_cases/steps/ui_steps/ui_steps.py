@@ -1,9 +1,15 @@
+import logging
 import os
+from typing import Optional
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from tests.reporting_hooks.reporting import async_step
 from tests.test_cases.steps.ui_steps.page_steps import PageSteps
 from tests.utils.api_helper import APIHelper
+from tests.utils.auth_state_cache import AuthStateCache
 from tests.utils.browser_helper import extract_access_token_from_local_storage
+from tests.utils.file_transfer import TransferResult, digest_file
 from tests.components.ui.page_manager import PageManager
 from tests.utils.test_config_helper import ConfigManager
 from tests.utils.test_data_management.test_data import DataManager
@@ -18,6 +24,7 @@ class UISteps(PageSteps):
         data_manager: DataManager,
         users_manager: UsersManager,
         api_helper: APIHelper,
+        auth_state_cache: Optional[AuthStateCache] = None,
     ) -> None:
         super().__init__(page_manager, data_manager)
         self._pm = page_manager
@@ -25,6 +32,8 @@ class UISteps(PageSteps):
         self._data_manager = data_manager
         self._users_manager = users_manager
         self._api_helper = api_helper
+        self._auth_state_cache = auth_state_cache
+        self._logger = logging.getLogger("[🔑UI_LOGIN]")
 
     @async_step("Reload page")
     async def ui_reload_page(self) -> None:
@@ -68,6 +77,9 @@ class UISteps(PageSteps):
     @async_step("Login via UI")
     async def ui_login(self, user: UserData, fresh_login: bool = True) -> None:
         if not user.authorized:
+            if await self._restore_cached_login(user, fresh_login):
+                return
+
             await self.auth_page.verify_ui_page_displayed()
 
             await self.auth_page.ui_click_login_button()
@@ -86,6 +98,50 @@ class UISteps(PageSteps):
                 )
             else:
                 await self.apps_page.verify_ui_page_displayed()
+            await self._save_login_state(user)
+
+    async def _restore_cached_login(self, user: UserData, fresh_login: bool) -> bool:
+        """
+        Inject cached storage state for the user instead of the UI login.
+        Returns False (with a clean logged out page) if there is no valid
+        cached state or the app rejected it.
+        """
+        if not self._auth_state_cache:
+            return False
+        cached = self._auth_state_cache.get(user)
+        if not cached:
+            return False
+
+        page = self._pm.page
+        await page.context.set_storage_state(cached.storage_state)
+        await self._pm.main_page.reload()
+        try:
+            if fresh_login:
+                restored = await self._pm.welcome_new_user_page.is_loaded(
+                    email=user.email
+                )
+            else:
+                restored = await self._pm.apps_page.is_loaded()
+        except (AssertionError, PlaywrightTimeoutError):
+            restored = False
+
+        if restored:
+            user.token = cached.token
+            self._logger.info(f"Restored cached login state for {user.email}")
+            return True
+
+        self._logger.warning(
+            f"Cached login state for {user.email} was rejected, logging in via UI"
+        )
+        self._auth_state_cache.invalidate(user)
+        await page.context.clear_cookies()
+        await page.evaluate("window.localStorage.clear()")
+        await self._pm.main_page.reload()
+        return False
+
+    async def _save_login_state(self, user: UserData) -> None:
+        if self._auth_state_cache:
+            await self._auth_state_cache.save(user, self._pm.page.context)
 
     # ********************   Onboarding steps   ****************************
     @async_step("Pass new user onboarding and create first organization via UI")
@@ -141,6 +197,7 @@ class UISteps(PageSteps):
         token = await extract_access_token_from_local_storage(self._pm.login_page.page)
         user.token = token
         user.authorized = True
+        await self._save_login_state(user)
 
         return user
 
@@ -310,7 +367,7 @@ class UISteps(PageSteps):
     @async_step("Upload file via API and reload page")
     async def ui_upload_file(
         self, token: str, org_name: str, proj_name: str, file_path: str
-    ) -> None:
+    ) -> TransferResult:
         response = await self._api_helper.upload_file(
             token=token,
             organization=org_name,
@@ -318,9 +375,10 @@ class UISteps(PageSteps):
             file_path=file_path,
         )
         assert response.status == 201, (
-            f"Expected HTTP 201 response but got {response.status_code}!"
+            f"Expected HTTP 201 response but got {response.status}!"
         )
         await self.ui_reload_page()
+        return response
 
     @async_step("Download file via UI")
     async def ui_download_file(self) -> str:
@@ -336,10 +394,41 @@ class UISteps(PageSteps):
 
     @async_step("Validate if downloaded file matches expected file")
     async def validate_file_matches_expected_file(
-        self, file_path_1: str, file_path_2: str
+        self, expected: TransferResult, file_path: str
     ) -> None:
-        assert self._data_manager.compare_files_md5(file_path_1, file_path_2), (
-            "MD5 hash does not match!"
+        digest = await digest_file(file_path)
+        downloaded = TransferResult(
+            path=file_path,
+            status=200,
+            size=digest.size,
+            md5=digest.md5,
+            sha256=digest.sha256,
+        )
+        assert expected.matches(downloaded), (
+            f"Downloaded file does not match!\nExpected: {expected}\n"
+            f"Downloaded: {downloaded}"
+        )
+
+    @async_step("Verify file downloaded via API matches expected file")
+    async def verify_api_file_download(
+        self,
+        token: str,
+        org_name: str,
+        proj_name: str,
+        expected: TransferResult,
+    ) -> None:
+        file_name = os.path.basename(expected.path)
+        downloaded = await self._api_helper.download_file(
+            token=token,
+            organization=org_name,
+            project_name=proj_name,
+            file_name=file_name,
+            dest_path=os.path.join(self._data_manager.download_path, file_name),
+        )
+        assert downloaded.ok, f"Expected HTTP 2xx response but got {downloaded.status}!"
+        assert expected.matches(downloaded), (
+            f"Downloaded file does not match!\nExpected: {expected}\n"
+            f"Downloaded: {downloaded}"
         )
 
     # ********************   Organization API steps   ****************************
@@ -0,0 +1,67 @@
+import pytest
+
+from tests.reporting_hooks.reporting import async_suite, async_title
+from tests.test_cases.base_test_class import BaseTestClass
+from tests.test_cases.steps.api_steps.api_steps import APISteps
+from tests.test_cases.steps.ui_steps.ui_steps import UISteps
+from tests.utils.permission_matrix import (
+    UPLOAD_FILE,
+    VIEW_APPS,
+    PermissionMatrix,
+    invite_to_project,
+)
+
+PROJECT_ROLES_MATRIX = PermissionMatrix(
+    roles=("reader", "writer", "manager", "admin"),
+    rows={
+        VIEW_APPS: (True, True, True, True),
+        UPLOAD_FILE: (False, True, True, True),
+        invite_to_project("reader"): (False, False, True, True),
+        invite_to_project("writer"): (False, False, True, True),
+        invite_to_project("manager"): (False, False, True, True),
+        invite_to_project("admin"): (False, False, False, True),
+    },
+)
+
+
+@async_suite("API Project Permission Matrix", parent="API Tests")
+class TestAPIProjectPermissionMatrix(BaseTestClass):
+    @pytest.fixture(autouse=True)
+    async def setup(self) -> None:
+        """
+        Initialize shared resources for the test methods.
+        """
+        self._ui_steps: UISteps = await self.init_ui_test_steps()
+        self._api_steps: APISteps = await self.init_api_test_steps()
+
+    @async_title("Verify project role permissions matrix via API")
+    async def test_project_roles_permission_matrix(self) -> None:
+        """
+        - Login with valid credentials via **UI**.
+        - Signup `second user` via **UI**.
+        - Signup `third user` via **UI**.
+        - Create organization with a project per role of `second user` via **API**.
+        - Add `third user` to organization via **API**.
+
+        ### Verify that:
+
+        - `Reader`, `Writer`, `Manager` and `Admin` can view apps.
+        - Only `Writer`, `Manager` and `Admin` can upload files.
+        - Only `Manager` and `Admin` can invite `Reader`, `Writer` and `Manager`.
+        - Only `Admin` can invite `Admin`.
+        """
+        user = self._users_manager.main_user
+        await self._ui_steps.ui_login(user=user)
+        u2_ui_steps = await self.init_ui_test_steps()
+        second_user = await u2_ui_steps.ui_get_second_user()
+        await u2_ui_steps.ui_login(second_user)
+        u3_ui_steps = await self.init_ui_test_steps()
+        third_user = await u3_ui_steps.ui_get_third_user()
+        await u3_ui_steps.ui_login(third_user)
+
+        await self._api_steps.verify_api_permission_matrix(
+            token=user.token,
+            matrix=PROJECT_ROLES_MATRIX,
+            actor=second_user,
+            target=third_user,
+        )
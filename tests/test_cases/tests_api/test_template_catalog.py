@@ -0,0 +1,51 @@
+import pytest
+
+from tests.reporting_hooks.reporting import async_suite, async_title
+from tests.test_cases.base_test_class import BaseTestClass
+from tests.test_cases.steps.api_steps.api_steps import APISteps
+from tests.test_cases.steps.ui_steps.ui_steps import UISteps
+
+
+@async_suite("API Template Catalog", parent="API Tests")
+class TestAPITemplateCatalog(BaseTestClass):
+    @pytest.fixture(autouse=True)
+    async def setup(self) -> None:
+        """
+        Initialize shared resources for the test methods.
+        """
+        self._ui_steps: UISteps = await self.init_ui_test_steps()
+        self._api_steps: APISteps = await self.init_api_test_steps()
+
+    @async_title("Verify saved app template snapshots match live templates via API")
+    async def test_template_catalog_matches_snapshots(self) -> None:
+        """
+        - Login with valid credentials via **UI**.
+        - Create new organization via **API**.
+        - Create new project via **API**.
+        - Get app templates of the project via **API**.
+
+        ### Verify that:
+
+        - Every saved template snapshot has a live template.
+        - Every live template matches its saved snapshot.
+        """
+        user = self._users_manager.main_user
+        await self._ui_steps.ui_login(user=user)
+        await self._ui_steps.ui_add_org_api(
+            token=user.token, gherkin_name="Default-organization"
+        )
+        org = self._data_manager.get_organization_by_gherkin_name(
+            "Default-organization"
+        )
+        proj = org.add_project("Project-1")
+        await self._ui_steps.ui_add_proj_api(
+            token=user.token,
+            org_name=org.org_name,
+            proj_name=proj.project_name,
+            default_role="reader",
+            proj_default=True,
+        )
+
+        await self._api_steps.verify_api_template_catalog(
+            token=user.token, org_name=org.org_name, proj_name=proj.project_name
+        )
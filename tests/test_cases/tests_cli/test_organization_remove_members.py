@@ -334,11 +334,10 @@ class TestCLIOrganizationRemoveMembers(BaseTestClass):
 
         await self._cli_steps.config.cli_login_with_token(token=user.token)
         org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="Manager"
-        )
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=third_user.username, role="Manager"
+        await self._cli_steps.admin.cli_add_users_to_org(
+            org_name=org.org_name,
+            usernames=[second_user.username, third_user.username],
+            role="Manager",
         )
 
         await self._cli_steps.admin.cli_get_org_users(org_name=org.org_name)
@@ -534,11 +533,10 @@ class TestCLIOrganizationRemoveMembers(BaseTestClass):
 
         await self._cli_steps.config.cli_login_with_token(token=user.token)
         org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
-        )
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=third_user.username, role="User"
+        await self._cli_steps.admin.cli_add_users_to_org(
+            org_name=org.org_name,
+            usernames=[second_user.username, third_user.username],
+            role="User",
         )
 
         await self._cli_steps.admin.cli_get_org_users(org_name=org.org_name)
@@ -3,6 +3,7 @@ import pytest
 from tests.reporting_hooks.reporting import async_suite, async_title
 
 from tests.test_cases.base_test_class import BaseTestClass
+from tests.utils.topology_builder import Topology
 
 
 @async_suite("CLI Project Remove Members", parent="CLI Tests")
@@ -23,12 +24,10 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Reader` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `second user` to project with `Reader` role via **CLI**.
 
         ### Verify that:
 
@@ -36,30 +35,27 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={second_user.username: "Reader"},
+            )
         )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Reader",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -86,12 +82,10 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Reader` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `second user` to project with `Reader` role via **CLI**.
 
         ### Verify that:
 
@@ -99,30 +93,27 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={second_user.username: "Reader"},
+            )
         )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Reader",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -149,12 +140,10 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Reader` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `second user` to project with `Reader` role via **CLI**.
 
         ### Verify that:
 
@@ -162,30 +151,27 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={second_user.username: "Reader"},
+            )
         )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Reader",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -212,12 +198,10 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Writer` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `second user` to project with `Writer` role via **CLI**.
 
         ### Verify that:
 
@@ -225,30 +209,27 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={second_user.username: "Writer"},
+            )
         )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Writer",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -275,12 +256,10 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Writer` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `second user` to project with `Writer` role via **CLI**.
 
         ### Verify that:
 
@@ -288,30 +267,27 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={second_user.username: "Writer"},
+            )
         )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Writer",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -338,12 +314,10 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Writer` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `second user` to project with `Writer` role via **CLI**.
 
         ### Verify that:
 
@@ -351,30 +325,27 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={second_user.username: "Writer"},
+            )
         )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Writer",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -401,12 +372,10 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Manager` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `second user` to project with `Manager` role via **CLI**.
 
         ### Verify that:
 
@@ -414,30 +383,27 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={second_user.username: "Manager"},
+            )
         )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Manager",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -464,12 +430,10 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Manager` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `second user` to project with `Manager` role via **CLI**.
 
         ### Verify that:
 
@@ -477,30 +441,27 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={second_user.username: "Manager"},
+            )
         )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Manager",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -527,12 +488,10 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Manager` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `second user` to project with `Manager` role via **CLI**.
 
         ### Verify that:
 
@@ -540,30 +499,27 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={second_user.username: "Manager"},
+            )
         )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Manager",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -590,12 +546,10 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Admin` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `second user` to project with `Admin` role via **CLI**.
 
         ### Verify that:
 
@@ -603,30 +557,27 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={second_user.username: "Admin"},
+            )
         )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Admin",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -653,12 +604,10 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Admin` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `second user` to project with `Admin` role via **CLI**.
 
         ### Verify that:
 
@@ -666,30 +615,27 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={second_user.username: "Admin"},
+            )
         )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Admin",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -716,12 +662,10 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Admin` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `second user` to project with `Admin` role via **CLI**.
 
         ### Verify that:
 
@@ -729,30 +673,27 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={second_user.username: "Admin"},
+            )
         )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Admin",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -779,9 +720,8 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
+        - Create new organization and project via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
 
         ### Verify that:
 
@@ -789,17 +729,18 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology().org("My-organization").project("My-organization", "project 1")
+        )
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
+        )
         org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -830,15 +771,12 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
         - Signup `third user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Manager` role via **API**.
+        - Add `third user` to project with `Reader` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `third user` to organization via **CLI**.
-        - Add `second user` to project with `Manager` role via **CLI**.
-        - Add `third user` to project with `Reader` role via **CLI**.
         - `Second user` login with Bearer auth token via **CLI**.
 
         ### Verify that:
@@ -847,9 +785,6 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
@@ -857,32 +792,26 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         third_user = await u3_ui_steps.ui_get_third_user()
         await u3_ui_steps.ui_login(third_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
-        )
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=third_user.username, role="User"
-        )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={
+                    second_user.username: "Manager",
+                    third_user.username: "Reader",
+                },
+            )
+        )
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Manager",
-        )
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=third_user.username,
-            role="Reader",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -913,15 +842,12 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
         - Signup `third user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Manager` role via **API**.
+        - Add `third user` to project with `Reader` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `third user` to organization via **CLI**.
-        - Add `second user` to project with `Manager` role via **CLI**.
-        - Add `third user` to project with `Reader` role via **CLI**.
         - `Second user` login with Bearer auth token via **CLI**.
 
         ### Verify that:
@@ -930,9 +856,6 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
@@ -940,32 +863,26 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         third_user = await u3_ui_steps.ui_get_third_user()
         await u3_ui_steps.ui_login(third_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
-        )
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=third_user.username, role="User"
-        )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={
+                    second_user.username: "Manager",
+                    third_user.username: "Reader",
+                },
+            )
+        )
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Manager",
-        )
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=third_user.username,
-            role="Reader",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -996,15 +913,12 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
         - Signup `third user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Manager` role via **API**.
+        - Add `third user` to project with `Reader` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `third user` to organization via **CLI**.
-        - Add `second user` to project with `Manager` role via **CLI**.
-        - Add `third user` to project with `Reader` role via **CLI**.
         - `Second user` login with Bearer auth token via **CLI**.
 
         ### Verify that:
@@ -1013,9 +927,6 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
@@ -1023,32 +934,26 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         third_user = await u3_ui_steps.ui_get_third_user()
         await u3_ui_steps.ui_login(third_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
-        )
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=third_user.username, role="User"
-        )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={
+                    second_user.username: "Manager",
+                    third_user.username: "Reader",
+                },
+            )
+        )
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Manager",
-        )
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=third_user.username,
-            role="Reader",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -1081,15 +986,12 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
         - Signup `third user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Manager` role via **API**.
+        - Add `third user` to project with `Writer` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `third user` to organization via **CLI**.
-        - Add `second user` to project with `Manager` role via **CLI**.
-        - Add `third user` to project with `Writer` role via **CLI**.
         - `Second user` login with Bearer auth token via **CLI**.
 
         ### Verify that:
@@ -1098,9 +1000,6 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
@@ -1108,32 +1007,26 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         third_user = await u3_ui_steps.ui_get_third_user()
         await u3_ui_steps.ui_login(third_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
-        )
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=third_user.username, role="User"
-        )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={
+                    second_user.username: "Manager",
+                    third_user.username: "Writer",
+                },
+            )
+        )
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Manager",
-        )
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=third_user.username,
-            role="Writer",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -1164,15 +1057,12 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
         - Signup `third user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Manager` role via **API**.
+        - Add `third user` to project with `Writer` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `third user` to organization via **CLI**.
-        - Add `second user` to project with `Manager` role via **CLI**.
-        - Add `third user` to project with `Writer` role via **CLI**.
         - `Second user` login with Bearer auth token via **CLI**.
 
         ### Verify that:
@@ -1181,9 +1071,6 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
@@ -1191,32 +1078,26 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         third_user = await u3_ui_steps.ui_get_third_user()
         await u3_ui_steps.ui_login(third_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
-        )
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=third_user.username, role="User"
-        )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={
+                    second_user.username: "Manager",
+                    third_user.username: "Writer",
+                },
+            )
+        )
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Manager",
-        )
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=third_user.username,
-            role="Writer",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -1247,15 +1128,12 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
         - Signup `third user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Manager` role via **API**.
+        - Add `third user` to project with `Writer` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `third user` to organization via **CLI**.
-        - Add `second user` to project with `Manager` role via **CLI**.
-        - Add `third user` to project with `Writer` role via **CLI**.
         - `Second user` login with Bearer auth token via **CLI**.
 
         ### Verify that:
@@ -1264,9 +1142,6 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
@@ -1274,32 +1149,26 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         third_user = await u3_ui_steps.ui_get_third_user()
         await u3_ui_steps.ui_login(third_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
-        )
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=third_user.username, role="User"
-        )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={
+                    second_user.username: "Manager",
+                    third_user.username: "Writer",
+                },
+            )
+        )
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Manager",
-        )
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=third_user.username,
-            role="Writer",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -1332,15 +1201,12 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
         - Signup `third user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Manager` role via **API**.
+        - Add `third user` to project with `Manager` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `third user` to organization via **CLI**.
-        - Add `second user` to project with `Manager` role via **CLI**.
-        - Add `third user` to project with `Manager` role via **CLI**.
         - `Second user` login with Bearer auth token via **CLI**.
 
         ### Verify that:
@@ -1349,9 +1215,6 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
@@ -1359,32 +1222,26 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         third_user = await u3_ui_steps.ui_get_third_user()
         await u3_ui_steps.ui_login(third_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
-        )
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=third_user.username, role="User"
-        )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={
+                    second_user.username: "Manager",
+                    third_user.username: "Manager",
+                },
+            )
+        )
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Manager",
-        )
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=third_user.username,
-            role="Manager",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -1415,15 +1272,12 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
         - Signup `third user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Manager` role via **API**.
+        - Add `third user` to project with `Manager` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `third user` to organization via **CLI**.
-        - Add `second user` to project with `Manager` role via **CLI**.
-        - Add `third user` to project with `Manager` role via **CLI**.
         - `Second user` login with Bearer auth token via **CLI**.
 
         ### Verify that:
@@ -1432,9 +1286,6 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
@@ -1442,32 +1293,26 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         third_user = await u3_ui_steps.ui_get_third_user()
         await u3_ui_steps.ui_login(third_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
-        )
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=third_user.username, role="User"
-        )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={
+                    second_user.username: "Manager",
+                    third_user.username: "Manager",
+                },
+            )
+        )
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Manager",
-        )
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=third_user.username,
-            role="Manager",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -1498,15 +1343,12 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
         - Signup `third user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Manager` role via **API**.
+        - Add `third user` to project with `Manager` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `third user` to organization via **CLI**.
-        - Add `second user` to project with `Manager` role via **CLI**.
-        - Add `third user` to project with `Manager` role via **CLI**.
         - `Second user` login with Bearer auth token via **CLI**.
 
         ### Verify that:
@@ -1515,9 +1357,6 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
@@ -1525,32 +1364,26 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         third_user = await u3_ui_steps.ui_get_third_user()
         await u3_ui_steps.ui_login(third_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
-        )
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=third_user.username, role="User"
-        )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={
+                    second_user.username: "Manager",
+                    third_user.username: "Manager",
+                },
+            )
+        )
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Manager",
-        )
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=third_user.username,
-            role="Manager",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -1583,15 +1416,12 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
         - Signup `third user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Manager` role via **API**.
+        - Add `third user` to project with `Admin` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `third user` to organization via **CLI**.
-        - Add `second user` to project with `Manager` role via **CLI**.
-        - Add `third user` to project with `Admin` role via **CLI**.
         - `Second user` login with Bearer auth token via **CLI**.
 
         ### Verify that:
@@ -1600,9 +1430,6 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
@@ -1610,32 +1437,23 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         third_user = await u3_ui_steps.ui_get_third_user()
         await u3_ui_steps.ui_login(third_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={second_user.username: "Manager", third_user.username: "Admin"},
+            )
         )
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=third_user.username, role="User"
-        )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Manager",
-        )
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=third_user.username,
-            role="Admin",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -1668,15 +1486,12 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
         - Signup `third user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Writer` role via **API**.
+        - Add `third user` to project with `Reader` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `third user` to organization via **CLI**.
-        - Add `second user` to project with `Writer` role via **CLI**.
-        - Add `third user` to project with `Reader` role via **CLI**.
         - `Second user` login with Bearer auth token via **CLI**.
 
         ### Verify that:
@@ -1685,9 +1500,6 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
@@ -1695,32 +1507,23 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         third_user = await u3_ui_steps.ui_get_third_user()
         await u3_ui_steps.ui_login(third_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
-        )
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=third_user.username, role="User"
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={second_user.username: "Writer", third_user.username: "Reader"},
+            )
         )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Writer",
-        )
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=third_user.username,
-            role="Reader",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
@@ -1753,15 +1556,12 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         - Login with valid credentials via **UI**.
         - Get Bearer auth token from Playwright local storage.
-        - Create new organization via **API**.
         - Signup `second user` via **UI**.
         - Signup `third user` via **UI**.
+        - Create new organization and project via **API**.
+        - Add `second user` to project with `Reader` role via **API**.
+        - Add `third user` to project with `Reader` role via **API**.
         - Login with Bearer auth token via **CLI**.
-        - Create new project via **CLI**.
-        - Add `second user` to organization via **CLI**.
-        - Add `third user` to organization via **CLI**.
-        - Add `second user` to project with `Reader` role via **CLI**.
-        - Add `third user` to project with `Reader` role via **CLI**.
         - `Second user` login with Bearer auth token via **CLI**.
 
         ### Verify that:
@@ -1770,9 +1570,6 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         """
         user = self._users_manager.main_user
         await self._ui_steps.ui_login(user=user)
-        await self._ui_steps.ui_add_org_api(
-            token=user.token, gherkin_name="My-organization"
-        )
         u2_ui_steps = await self.init_ui_test_steps()
         second_user = await u2_ui_steps.ui_get_second_user()
         await u2_ui_steps.ui_login(second_user)
@@ -1780,32 +1577,23 @@ class TestCLIProjectStructureSetup(BaseTestClass):
         third_user = await u3_ui_steps.ui_get_third_user()
         await u3_ui_steps.ui_login(third_user)
 
-        await self._cli_steps.config.cli_login_with_token(token=user.token)
-        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
-        )
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=third_user.username, role="User"
+        api_steps = await self.init_api_test_steps()
+        topology = (
+            Topology()
+            .org("My-organization")
+            .project(
+                "My-organization",
+                "project 1",
+                members={second_user.username: "Reader", third_user.username: "Reader"},
+            )
         )
-
-        proj = org.add_project("project 1")
-        await self._cli_steps.admin.cli_add_new_project(
-            org_name=org.org_name, proj_name=proj.project_name
+        await api_steps.api_acquire_topology(
+            token=user.token, topology=topology, mutable=True
         )
+        org = self._data_manager.get_organization_by_gherkin_name("My-organization")
+        proj = org.get_project_by_gherkin_name("project 1")
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Reader",
-        )
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=third_user.username,
-            role="Reader",
-        )
+        await self._cli_steps.config.cli_login_with_token(token=user.token)
 
         await self._cli_steps.admin.cli_get_proj_users(
             org_name=org.org_name, proj_name=proj.project_name
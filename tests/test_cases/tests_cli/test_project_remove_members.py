@@ -350,11 +350,10 @@ class TestCLIProjectStructureSetup(BaseTestClass):
 
         await self._cli_steps.config.cli_login_with_token(token=user.token)
         org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
-        )
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=third_user.username, role="User"
+        await self._cli_steps.admin.cli_add_users_to_org(
+            org_name=org.org_name,
+            usernames=[second_user.username, third_user.username],
+            role="User",
         )
 
         proj = org.add_project("project 1")
@@ -432,11 +431,10 @@ class TestCLIProjectStructureSetup(BaseTestClass):
 
         await self._cli_steps.config.cli_login_with_token(token=user.token)
         org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
-        )
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=third_user.username, role="User"
+        await self._cli_steps.admin.cli_add_users_to_org(
+            org_name=org.org_name,
+            usernames=[second_user.username, third_user.username],
+            role="User",
         )
 
         proj = org.add_project("project 1")
@@ -514,11 +512,10 @@ class TestCLIProjectStructureSetup(BaseTestClass):
 
         await self._cli_steps.config.cli_login_with_token(token=user.token)
         org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
-        )
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=third_user.username, role="User"
+        await self._cli_steps.admin.cli_add_users_to_org(
+            org_name=org.org_name,
+            usernames=[second_user.username, third_user.username],
+            role="User",
         )
 
         proj = org.add_project("project 1")
@@ -526,16 +523,10 @@ class TestCLIProjectStructureSetup(BaseTestClass):
             org_name=org.org_name, proj_name=proj.project_name
         )
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Manager",
-        )
-        await self._cli_steps.admin.cli_add_org_member_to_project(
+        await self._cli_steps.admin.cli_add_org_members_to_projects(
             org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=third_user.username,
+            proj_names=[proj.project_name],
+            usernames=[second_user.username, third_user.username],
             role="Manager",
         )
 
@@ -596,11 +587,10 @@ class TestCLIProjectStructureSetup(BaseTestClass):
 
         await self._cli_steps.config.cli_login_with_token(token=user.token)
         org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
-        )
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=third_user.username, role="User"
+        await self._cli_steps.admin.cli_add_users_to_org(
+            org_name=org.org_name,
+            usernames=[second_user.username, third_user.username],
+            role="User",
         )
 
         proj = org.add_project("project 1")
@@ -745,11 +735,10 @@ class TestCLIProjectStructureSetup(BaseTestClass):
 
         await self._cli_steps.config.cli_login_with_token(token=user.token)
         org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
-        )
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=third_user.username, role="User"
+        await self._cli_steps.admin.cli_add_users_to_org(
+            org_name=org.org_name,
+            usernames=[second_user.username, third_user.username],
+            role="User",
         )
 
         proj = org.add_project("project 1")
@@ -829,11 +818,10 @@ class TestCLIProjectStructureSetup(BaseTestClass):
 
         await self._cli_steps.config.cli_login_with_token(token=user.token)
         org = self._data_manager.get_organization_by_gherkin_name("My-organization")
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=second_user.username, role="User"
-        )
-        await self._cli_steps.admin.cli_add_user_to_org(
-            org_name=org.org_name, username=third_user.username, role="User"
+        await self._cli_steps.admin.cli_add_users_to_org(
+            org_name=org.org_name,
+            usernames=[second_user.username, third_user.username],
+            role="User",
         )
 
         proj = org.add_project("project 1")
@@ -841,16 +829,10 @@ class TestCLIProjectStructureSetup(BaseTestClass):
             org_name=org.org_name, proj_name=proj.project_name
         )
 
-        await self._cli_steps.admin.cli_add_org_member_to_project(
-            org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=second_user.username,
-            role="Reader",
-        )
-        await self._cli_steps.admin.cli_add_org_member_to_project(
+        await self._cli_steps.admin.cli_add_org_members_to_projects(
             org_name=org.org_name,
-            proj_name=proj.project_name,
-            username=third_user.username,
+            proj_names=[proj.project_name],
+            usernames=[second_user.username, third_user.username],
             role="Reader",
         )
 
@@ -603,7 +603,8 @@ class TestUIFiles(BaseTestClass):
         ### Verify that:
 
         - User can download `bin` file via UI.
-        - Downloaded `bin` file md5 hash matches expected file.
+        - Downloaded `bin` file matches expected file.
+        - File downloaded via **API** matches expected file.
         """
 
         steps = self._steps
@@ -630,7 +631,7 @@ class TestUIFiles(BaseTestClass):
         await steps.files_page.verify_ui_add_folder_btn_enabled()
 
         file_path, file_name = await steps.files_page.generate_bin_file()
-        await steps.ui_upload_file(
+        uploaded = await steps.ui_upload_file(
             token=user.token,
             org_name=org.org_name,
             proj_name=proj.project_name,
@@ -642,7 +643,13 @@ class TestUIFiles(BaseTestClass):
         await steps.files_page.verify_ui_file_action_bar_displayed(name=file_name)
 
         downloaded_file_path = await steps.ui_download_file()
-        await steps.validate_file_matches_expected_file(file_path, downloaded_file_path)
+        await steps.validate_file_matches_expected_file(uploaded, downloaded_file_path)
+        await steps.verify_api_file_download(
+            token=user.token,
+            org_name=org.org_name,
+            proj_name=proj.project_name,
+            expected=uploaded,
+        )
 
     @async_title("User download txt file")
     async def test_download_txt_file(self) -> None:
@@ -655,7 +662,7 @@ class TestUIFiles(BaseTestClass):
         ### Verify that:
 
         - User can download `txt` file via UI.
-        - Downloaded `txt` file md5 hash matches expected file.
+        - Downloaded `txt` file matches expected file.
         """
 
         steps = self._steps
@@ -682,7 +689,7 @@ class TestUIFiles(BaseTestClass):
         await steps.files_page.verify_ui_add_folder_btn_enabled()
 
         file_path, file_name = await steps.files_page.generate_txt_file()
-        await steps.ui_upload_file(
+        uploaded = await steps.ui_upload_file(
             token=user.token,
             org_name=org.org_name,
             proj_name=proj.project_name,
@@ -694,7 +701,7 @@ class TestUIFiles(BaseTestClass):
         await steps.files_page.verify_ui_file_action_bar_displayed(name=file_name)
 
         downloaded_file_path = await steps.ui_download_file()
-        await steps.validate_file_matches_expected_file(file_path, downloaded_file_path)
+        await steps.validate_file_matches_expected_file(uploaded, downloaded_file_path)
 
     @async_title("User rename File")
     async def test_rename_file(self) -> None:
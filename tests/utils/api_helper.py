@@ -4,31 +4,66 @@ import base64
 import logging
 import os
 
+import aiofiles
 import aiohttp
+from collections.abc import Mapping
 from typing import Any, Optional, Union
 
+from tests.utils.api_retry import RetryMiddleware, default_retry_middleware
+from tests.utils.api_session_pool import APISessionPool
+from tests.utils.file_transfer import (
+    CHUNK_SIZE,
+    TRANSFER_TIMEOUT,
+    StreamDigest,
+    TransferResult,
+    digest_file,
+    read_chunks,
+    unsatisfied_range_total,
+)
 from tests.utils.test_config_helper import ConfigManager
 
 logger = logging.getLogger("[🌐API_helper]")
 
+# Total timeout in seconds of a helper's own (not pooled) session
+DEFAULT_TIMEOUT = 60
+
 
 class APIHelper:
     """
     Stateless API client using aiohttp, with optional per-request bearer token.
+    Requests go through a RetryMiddleware; the default one is shared, so its
+    circuit breakers and retry budgets cover all helpers of the worker.
     """
 
-    def __init__(self, config: ConfigManager, timeout: int = 60) -> None:
+    def __init__(
+        self,
+        config: ConfigManager,
+        timeout: Optional[int] = None,
+        pool: Optional[APISessionPool] = None,
+        retry: Optional[RetryMiddleware] = None,
+    ) -> None:
+        if timeout is not None and pool is not None:
+            raise ValueError(
+                "timeout is not applied to a pooled session, "
+                "set it on the APISessionPool instead"
+            )
         self._config = config
-        self._timeout = timeout
+        self._timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+        self._pool = pool
+        self._retry = retry or default_retry_middleware
         self._session: Optional[aiohttp.ClientSession] = None
 
     async def init(self) -> "APIHelper":
         """
         Async initializer to create aiohttp session safely.
+        If a pool is given, the shared pooled session is used instead.
         """
-        self._session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self._timeout)
-        )
+        if self._pool:
+            self._session = await self._pool.get_session()
+        else:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self._timeout)
+            )
         return self
 
     def _headers(self, token: Optional[str] = None) -> dict[str, str]:
@@ -51,55 +86,114 @@ class APIHelper:
         - Otherwise → returns raw text.
         """
         assert self._session is not None, "ClientSession is not initialized"
+        session = self._session
         logger.info(f"GET {endpoint}")
 
-        async with self._session.get(
-            endpoint, headers=self._headers(token), params=params
-        ) as response:
-            status = response.status
-            content_type = response.headers.get("content-type", "")
+        async def _attempt() -> tuple[int, Mapping[str, str], tuple[int, Any]]:
+            async with session.get(
+                endpoint, headers=self._headers(token), params=params
+            ) as response:
+                status = response.status
+                content_type = response.headers.get("content-type", "")
 
-            # Try JSON if content type is JSON
-            if "application/json" in content_type:
-                try:
-                    json_data = await response.json()
-                    return status, json_data
-                except Exception:
-                    pass
+                # Try JSON if content type is JSON
+                if "application/json" in content_type:
+                    try:
+                        json_data = await response.json()
+                        return status, response.headers, (status, json_data)
+                    except Exception:
+                        pass
+
+                # Fallback to text
+                text = await response.text()
 
-            # Fallback to text
-            text = await response.text()
+                # Detect Swagger UI page
+                if "swagger" in text.lower() and "<html" in text.lower():
+                    swagger = {"swagger_ui": True, "content": text}
+                    return status, response.headers, (status, swagger)
 
-            # Detect Swagger UI page
-            if "swagger" in text.lower() and "<html" in text.lower():
-                return status, {"swagger_ui": True, "content": text}
+                return status, response.headers, (status, text)
 
-            return status, text
+        return await self._retry.send("GET", endpoint, _attempt)
+
+    async def _get_if_changed(
+        self,
+        endpoint: str,
+        etag: Optional[str] = None,
+        token: Optional[str] = None,
+    ) -> tuple[int, Any, Optional[str]]:
+        """
+        Make conditional GET request using If-None-Match.
+        Returns (status, response_data, etag).
+        On 304 Not Modified response_data is None and the given etag is kept.
+        """
+        assert self._session is not None, "ClientSession is not initialized"
+        session = self._session
+        headers = self._headers(token)
+        if etag:
+            headers["If-None-Match"] = etag
+
+        async def _attempt() -> tuple[
+            int, Mapping[str, str], tuple[int, Any, Optional[str]]
+        ]:
+            async with session.get(endpoint, headers=headers) as response:
+                status = response.status
+                if status == 304:
+                    return status, response.headers, (status, None, etag)
+
+                new_etag = response.headers.get("ETag")
+                if "application/json" in response.headers.get("content-type", ""):
+                    try:
+                        data = await response.json()
+                        return status, response.headers, (status, data, new_etag)
+                    except Exception:
+                        pass
+                text = await response.text()
+                return status, response.headers, (status, text, new_etag)
+
+        return await self._retry.send("GET", endpoint, _attempt)
 
     async def _post(
         self,
         endpoint: str,
         data: Optional[Union[dict[str, Any], list[Any]]] = None,
         token: Optional[str] = None,
+        idempotent: bool = False,
+        retry_statuses: Optional[frozenset[int]] = None,
     ) -> tuple[int, Any]:
+        """
+        idempotent: the request may be retried like GET/PUT/DELETE; otherwise
+        it is only retried when the server certainly did not process it.
+        retry_statuses: statuses to retry instead of the retry policy's ones.
+        """
         assert self._session is not None, "ClientSession is not initialized"
+        session = self._session
         logger.info(f"POST {endpoint} with data: {data}")
 
-        async with self._session.post(
-            endpoint, headers=self._headers(token), json=data
-        ) as response:
-            status = response.status
-            content_type = response.headers.get("Content-Type", "")
+        async def _attempt() -> tuple[int, Mapping[str, str], tuple[int, Any]]:
+            async with session.post(
+                endpoint, headers=self._headers(token), json=data
+            ) as response:
+                status = response.status
+                content_type = response.headers.get("Content-Type", "")
 
-            try:
-                if "application/json" in content_type:
-                    result = await response.json()
-                else:
+                try:
+                    if "application/json" in content_type:
+                        result = await response.json()
+                    else:
+                        result = await response.text()
+                except Exception:
                     result = await response.text()
-            except Exception:
-                result = await response.text()
 
-            return status, result
+                return status, response.headers, (status, result)
+
+        return await self._retry.send(
+            "POST",
+            endpoint,
+            _attempt,
+            idempotent=idempotent,
+            retry_statuses=retry_statuses,
+        )
 
     async def _put(
         self,
@@ -109,27 +203,39 @@ class APIHelper:
         is_json: bool = True,
     ) -> Any:
         assert self._session is not None, "ClientSession is not initialized"
-        if is_json and isinstance(data, (dict, list)):
-            async with self._session.put(
-                endpoint, headers=self._headers(token), json=data
-            ) as response:
-                return await response.json()
-        else:
-            async with self._session.put(
-                endpoint, headers=self._headers(token), data=data
-            ) as response:
-                return response
+        session = self._session
+
+        async def _attempt() -> tuple[int, Mapping[str, str], Any]:
+            if is_json and isinstance(data, (dict, list)):
+                async with session.put(
+                    endpoint, headers=self._headers(token), json=data
+                ) as response:
+                    return response.status, response.headers, await response.json()
+            else:
+                async with session.put(
+                    endpoint, headers=self._headers(token), data=data
+                ) as response:
+                    return response.status, response.headers, response
+
+        return await self._retry.send("PUT", endpoint, _attempt)
 
     async def _delete(self, endpoint: str, token: Optional[str] = None) -> Any:
         assert self._session is not None, "ClientSession is not initialized"
-        async with self._session.delete(
-            endpoint, headers=self._headers(token)
-        ) as response:
-            return response
+        session = self._session
+
+        async def _attempt() -> tuple[int, Mapping[str, str], Any]:
+            async with session.delete(
+                endpoint, headers=self._headers(token)
+            ) as response:
+                return response.status, response.headers, response
+
+        return await self._retry.send("DELETE", endpoint, _attempt)
 
     async def _close(self) -> None:
-        if self._session:
+        # Pooled session is owned and closed by the pool itself
+        if self._session and not self._pool:
             await self._session.close()
+        self._session = None
 
     async def check_user_needs_verification(self, email: str) -> tuple[bool, str]:
         """
@@ -158,16 +264,139 @@ class APIHelper:
             raise RuntimeError(f"Unexpected response: {status}, {response}")
 
     async def upload_file(
-        self, token: str, organization: str, project_name: str, file_path: str
-    ) -> Any:
+        self,
+        token: str,
+        organization: str,
+        project_name: str,
+        file_path: str,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> TransferResult:
+        """
+        Stream the file to storage with chunked transfer encoding.
+        md5/sha256 of the sent bytes are computed on the way.
+        """
+        assert self._session is not None, "ClientSession is not initialized"
+        session = self._session
         file_name = os.path.basename(file_path)
         url = self._config.get_file_upload_url(organization, project_name, file_name)
-        with open(file_path, "rb") as f:
-            file_bytes = f.read()
-            response = await self._put(url, data=file_bytes, token=token)
-            logger.info(f"File upload response: {response}")
+        logger.info(f"PUT {url} streaming {file_path}")
+
+        async def _attempt() -> tuple[int, Mapping[str, str], TransferResult]:
+            # A retried attempt re-reads the file, so it needs a fresh digest
+            digest = StreamDigest()
+            async with session.put(
+                url,
+                headers=self._headers(token),
+                data=read_chunks(file_path, digest, chunk_size),
+                timeout=TRANSFER_TIMEOUT,
+            ) as response:
+                result = TransferResult(
+                    path=file_path,
+                    status=response.status,
+                    size=digest.size,
+                    md5=digest.md5,
+                    sha256=digest.sha256,
+                )
+                return response.status, response.headers, result
+
+        result = await self._retry.send("PUT", url, _attempt)
+        logger.info(f"File upload result: {result}")
+        return result
+
+    async def download_file(
+        self,
+        token: str,
+        organization: str,
+        project_name: str,
+        file_name: str,
+        dest_path: str,
+        resume: bool = True,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> TransferResult:
+        """
+        Stream a storage file to dest_path, hashing it on the way.
 
-        return response
+        Data goes to `<dest_path>.part`, which is renamed once complete.
+        A download that breaks off is continued with a byte-range request
+        from where it stopped, both on retries and, with `resume`, from a
+        `.part` file left by an earlier call.
+        """
+        assert self._session is not None, "ClientSession is not initialized"
+        session = self._session
+        url = self._config.get_file_download_url(organization, project_name, file_name)
+        part_path = f"{dest_path}.part"
+
+        digest = StreamDigest()
+        if resume and os.path.exists(part_path):
+            digest = await digest_file(part_path, chunk_size)
+        else:
+            open(part_path, "wb").close()
+        resumed_from = digest.size
+        logger.info(f"GET {url} streaming to {dest_path} from byte {resumed_from}")
+
+        async def _attempt() -> tuple[int, Mapping[str, str], TransferResult]:
+            nonlocal digest, resumed_from
+            while True:
+                headers = self._headers(token)
+                offset = digest.size
+                if offset:
+                    headers["Range"] = f"bytes={offset}-"
+                async with session.get(
+                    url, headers=headers, timeout=TRANSFER_TIMEOUT
+                ) as response:
+                    status = response.status
+                    if status == 416 and offset:
+                        total = unsatisfied_range_total(
+                            response.headers.get("Content-Range", "")
+                        )
+                        if total != offset:
+                            # The .part file is longer than the file or its
+                            # size is unknown: it is stale, start over
+                            logger.warning(
+                                f"Range {offset}- not satisfiable (file size "
+                                f"{total}), restarting {dest_path} from byte 0"
+                            )
+                            digest = StreamDigest()
+                            resumed_from = 0
+                            open(part_path, "wb").close()
+                            continue
+                        # Nothing left past the offset: the .part file is complete
+                        status = 206
+                    elif status in (200, 206):
+                        content_range = response.headers.get("Content-Range", "")
+                        if status == 206 and not content_range.startswith(
+                            f"bytes {offset}-"
+                        ):
+                            raise aiohttp.ClientPayloadError(
+                                f"Unexpected Content-Range for offset {offset}: "
+                                f"{content_range}"
+                            )
+                        if status == 200:
+                            # Full body: the server ignored the range, start over
+                            digest = StreamDigest()
+                        async with aiofiles.open(
+                            part_path, "ab" if status == 206 else "wb"
+                        ) as f:
+                            async for chunk in response.content.iter_chunked(
+                                chunk_size
+                            ):
+                                await f.write(chunk)
+                                digest.update(chunk)
+                    result = TransferResult(
+                        path=dest_path,
+                        status=status,
+                        size=digest.size,
+                        md5=digest.md5,
+                        sha256=digest.sha256,
+                        resumed_from=resumed_from,
+                    )
+                    return response.status, response.headers, result
+
+        result = await self._retry.send("GET", url, _attempt)
+        if result.ok:
+            os.replace(part_path, dest_path)
+        logger.info(f"File download result: {result}")
+        return result
 
     async def get_orgs(self, token: str) -> Any:
         url = self._config.get_orgs_url()
@@ -234,6 +463,18 @@ class APIHelper:
 
         return status, response
 
+    async def add_user_to_proj(
+        self, token: str, org_name: str, proj_name: str, username: str, role: str
+    ) -> Any:
+        url = self._config.get_add_user_to_proj_url(
+            org_name=org_name, proj_name=proj_name
+        )
+        data = {"user_name": username, "role": role}
+        status, response = await self._post(url, token=token, data=data)
+        logger.info(f"Add user {username} to proj {proj_name} response: {response}")
+
+        return status, response
+
     async def get_app_output(
         self, token: str, org_name: str, proj_name: str, app_id: str
     ) -> Any:
@@ -263,6 +504,27 @@ class APIHelper:
 
         return status, response
 
+    async def get_templates(self, token: str, org_name: str, proj_name: str) -> Any:
+        url = self._config.get_template_url(
+            organization=org_name, project_name=proj_name
+        )
+        status, response = await self._get(url, token=token)
+        count = len(response) if isinstance(response, list) else "n/a"
+        logger.info(f"Status: {status}. Templates: {count}")
+
+        return status, response
+
+    async def get_instances_if_changed(
+        self, token: str, org_name: str, proj_name: str, etag: Optional[str] = None
+    ) -> tuple[int, Any, Optional[str]]:
+        url = self._config.get_instances_url(org_name=org_name, proj_name=proj_name)
+        status, response, new_etag = await self._get_if_changed(
+            url, etag=etag, token=token
+        )
+        logger.info(f"Status: {status}. ETag: {new_etag}")
+
+        return status, response, new_etag
+
     async def get_app_instance(self, app_id: str, token: str) -> Any:
         url = self._config.get_app_instance_url(app_id=app_id)
         status, response = await self._get(url, token=token)
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from typing import Optional, TypeVar
+from urllib.parse import urlsplit
+
+import aiohttp
+
+logger = logging.getLogger("[🌐API_retry]")
+
+T = TypeVar("T")
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# A body that was cut off mid-stream is as transient as a reset connection
+TRANSPORT_ERRORS = (
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    asyncio.TimeoutError,
+)
+
+# attempt() sends one request and returns (status, response headers, result)
+Attempt = Callable[[], Awaitable[tuple[int, Mapping[str, str], T]]]
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+    retry_statuses: frozenset[int] = RETRY_STATUSES
+    # Consecutive failed attempts to a host before it is short-circuited
+    breaker_threshold: int = 5
+    breaker_cooldown: float = 30.0
+    # Retries allowed per endpoint within the window
+    budget_retries: int = 10
+    budget_window: float = 60.0
+
+
+@dataclass
+class RetryStats:
+    requests: int = 0
+    retries: int = 0
+    recovered: int = 0
+    budget_exhausted: int = 0
+    breaker_trips: int = 0
+    short_circuited: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"{self.requests} requests, {self.retries} retries, "
+            f"{self.recovered} recovered by retry, "
+            f"{self.budget_exhausted} out of retry budget, "
+            f"{self.breaker_trips} breaker trips, "
+            f"{self.short_circuited} short-circuited"
+        )
+
+
+@dataclass
+class _Breaker:
+    failures: int = 0
+    opened_at: Optional[float] = None
+    # Start of the half-open probe; a probe that never reported back (e.g.
+    # cancelled) is abandoned after another cooldown
+    probe_started: Optional[float] = None
+
+
+class RetryMiddleware:
+    """
+    Retries transient API failures inside a single request.
+
+    - Only idempotent requests are retried on retryable statuses and
+      connection errors/timeouts. Other requests are retried on 429 (not
+      processed) and when the connection could not be established at all,
+      unless the caller marks them idempotent.
+    - Retry-After (seconds or HTTP date) is honoured, otherwise the delay is
+      full-jitter exponential backoff; both are capped by max_delay.
+    - Every endpoint (method + URL without query) has a retry budget per
+      time window, so a persistently failing endpoint is not hammered.
+    - A per-host circuit breaker opens after `breaker_threshold` consecutive
+      failed attempts; the request that tripped it stops retrying, and new
+      requests to that host are rejected with CircuitOpenError until the
+      cooldown has passed. Then a single probe request decides whether it
+      closes again.
+    """
+
+    def __init__(self, policy: Optional[RetryPolicy] = None) -> None:
+        self.policy = policy or RetryPolicy()
+        self.stats = RetryStats()
+        self._breakers: dict[str, _Breaker] = {}
+        self._budgets: dict[str, deque[float]] = {}
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        attempt: Attempt[T],
+        idempotent: Optional[bool] = None,
+        retry_statuses: Optional[frozenset[int]] = None,
+    ) -> T:
+        """retry_statuses: statuses to retry instead of the policy's ones."""
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        if retry_statuses is None:
+            retry_statuses = self.policy.retry_statuses
+        parts = urlsplit(url)
+        host, endpoint = parts.netloc, f"{method.upper()} {parts.netloc}{parts.path}"
+        self.stats.requests += 1
+
+        self._check_breaker(host)
+        for attempt_no in range(1, self.policy.max_attempts + 1):
+            try:
+                status, headers, result = await attempt()
+            except TRANSPORT_ERRORS as exc:
+                self._record_failure(host)
+                not_sent = isinstance(exc, aiohttp.ClientConnectorError)
+                if not (idempotent or not_sent) or not self._can_retry(
+                    host, endpoint, attempt_no
+                ):
+                    raise
+                delay = self._backoff(attempt_no)
+                reason = f"{type(exc).__name__}: {exc}"
+            except Exception:
+                # Not a transport failure, so the host did answer
+                self._record_success(host)
+                raise
+            else:
+                if status not in retry_statuses:
+                    self._record_success(host)
+                    if attempt_no > 1:
+                        self.stats.recovered += 1
+                    return result
+                self._record_failure(host)
+                if not (idempotent or status == 429) or not self._can_retry(
+                    host, endpoint, attempt_no
+                ):
+                    return result
+                delay = self._retry_after(headers) or self._backoff(attempt_no)
+                reason = f"HTTP {status}"
+
+            self.stats.retries += 1
+            logger.warning(
+                f"{endpoint}: {reason}, retry {attempt_no}/"
+                f"{self.policy.max_attempts - 1} in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+        raise AssertionError("unreachable: the last attempt always returns or raises")
+
+    def _can_retry(self, host: str, endpoint: str, attempt_no: int) -> bool:
+        if attempt_no >= self.policy.max_attempts:
+            return False
+        if self._breakers[host].opened_at is not None:
+            return False
+        now = time.monotonic()
+        spent = self._budgets.setdefault(endpoint, deque())
+        while spent and now - spent[0] > self.policy.budget_window:
+            spent.popleft()
+        if len(spent) >= self.policy.budget_retries:
+            self.stats.budget_exhausted += 1
+            logger.warning(f"{endpoint}: retry budget exhausted")
+            return False
+        spent.append(now)
+        return True
+
+    def _backoff(self, attempt_no: int) -> float:
+        ceiling = min(self.policy.max_delay, self.policy.base_delay * 2**attempt_no)
+        return random.uniform(0, ceiling)
+
+    def _retry_after(self, headers: Mapping[str, str]) -> Optional[float]:
+        value = headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                retry_at = email.utils.parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            delay = retry_at.timestamp() - time.time()
+        return min(max(delay, 0.0), self.policy.max_delay)
+
+    def _check_breaker(self, host: str) -> None:
+        breaker = self._breakers.get(host)
+        if breaker is None or breaker.opened_at is None:
+            return
+        now = time.monotonic()
+        if now - breaker.opened_at < self.policy.breaker_cooldown:
+            self.stats.short_circuited += 1
+            raise CircuitOpenError(f"Circuit breaker is open for {host}")
+        probe = breaker.probe_started
+        if probe is not None and now - probe < self.policy.breaker_cooldown:
+            self.stats.short_circuited += 1
+            raise CircuitOpenError(f"Circuit breaker for {host} is probing")
+        breaker.probe_started = now
+
+    def _record_success(self, host: str) -> None:
+        breaker = self._breakers.setdefault(host, _Breaker())
+        if breaker.opened_at is not None:
+            logger.info(f"Circuit breaker closed for {host}")
+        breaker.failures, breaker.opened_at, breaker.probe_started = 0, None, None
+
+    def _record_failure(self, host: str) -> None:
+        breaker = self._breakers.setdefault(host, _Breaker())
+        breaker.failures += 1
+        if breaker.probe_started is not None or (
+            breaker.opened_at is None
+            and breaker.failures >= self.policy.breaker_threshold
+        ):
+            breaker.opened_at, breaker.probe_started = time.monotonic(), None
+            self.stats.breaker_trips += 1
+            logger.error(
+                f"Circuit breaker opened for {host} after {breaker.failures} "
+                f"failures, cooling down for {self.policy.breaker_cooldown}s"
+            )
+
+
+default_retry_middleware = RetryMiddleware()
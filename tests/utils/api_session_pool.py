@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from types import SimpleNamespace
+from typing import Optional
+
+import aiohttp
+
+logger = logging.getLogger("[🌐API_session_pool]")
+
+
+class APISessionPool:
+    """
+    Per-worker aiohttp connection pool shared by all APIHelper instances.
+
+    Keeps one ClientSession with a keep-alive TCPConnector and DNS cache,
+    so tests reuse already established TCP/TLS connections instead of
+    paying for new handshakes on every APIHelper.init().
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 20,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: int = 300,
+        timeout: int = 60,
+    ) -> None:
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._dns_cache_ttl = dns_cache_ttl
+        self._timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = asyncio.Lock()
+        self._connections_created = 0
+        self._connections_reused = 0
+
+    @property
+    def connections_created(self) -> int:
+        return self._connections_created
+
+    @property
+    def connections_reused(self) -> int:
+        return self._connections_reused
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared session, creating it on first use.
+        The session is bound to the event loop it was created in,
+        so it is rebuilt if called from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session and not self._session.closed and self._loop is loop:
+            return self._session
+
+        async with self._lock:
+            if self._session and not self._session.closed and self._loop is loop:
+                return self._session
+
+            if self._session and self._loop is not loop:
+                logger.warning(
+                    "Event loop changed, closing pooled session bound to the old loop"
+                )
+                await self._close_stale_session()
+
+            connector = aiohttp.TCPConnector(
+                limit=self._limit,
+                limit_per_host=self._limit_per_host,
+                keepalive_timeout=self._keepalive_timeout,
+                ttl_dns_cache=self._dns_cache_ttl,
+                use_dns_cache=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+                trace_configs=[self._trace_config()],
+            )
+            self._loop = loop
+            logger.info(
+                f"Created pooled session (limit={self._limit}, "
+                f"limit_per_host={self._limit_per_host}, "
+                f"keepalive={self._keepalive_timeout}s, dns_ttl={self._dns_cache_ttl}s)"
+            )
+            return self._session
+
+    async def close(self) -> None:
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+        logger.info(
+            f"Pooled session closed: {self._connections_created} connections created, "
+            f"{self._connections_reused} reused"
+        )
+
+    async def _close_stale_session(self) -> None:
+        session, old_loop = self._session, self._loop
+        self._session = None
+        if session is None or session.closed or old_loop is None:
+            return
+        if not old_loop.is_closed():
+            # Transports belong to the old loop: close them there, now if
+            # it runs in another thread, otherwise when it runs again
+            asyncio.run_coroutine_threadsafe(session.close(), old_loop)
+            return
+        # The old loop cannot close its transports any more; this releases
+        # the session and connector, their sockets are freed with them
+        try:
+            await session.close()
+        except Exception as e:
+            logger.warning(f"Failed to close pooled session of a closed loop: {e}")
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_connection_create_end(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceConnectionCreateEndParams,
+        ) -> None:
+            self._connections_created += 1
+
+        async def on_connection_reuseconn(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceConnectionReuseconnParams,
+        ) -> None:
+            self._connections_reused += 1
+
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from playwright.async_api import BrowserContext
+
+from tests.utils.test_data_management.users_manager import UserData
+
+logger = logging.getLogger("[🔑AUTH_STATE_CACHE]")
+
+
+def decode_jwt_expiry(token: str) -> Optional[float]:
+    """
+    Return the `exp` claim (epoch seconds) of a JWT without verifying it,
+    or None if the token can not be decoded.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+    except Exception:
+        return None
+
+
+@dataclass
+class CachedAuthState:
+    token: str
+    expires_at: float
+    storage_state: Any
+
+    def is_valid(self, margin: int) -> bool:
+        return self.expires_at - time.time() > margin
+
+
+class AuthStateCache:
+    """
+    Per-user cache of Playwright storage state (cookies + localStorage).
+
+    The state is saved after the first successful UI login and injected
+    into new browser contexts, so later tests start already logged in.
+    Entries whose token expires within `expiry_margin` seconds are ignored.
+    """
+
+    def __init__(self, cache_dir: str, expiry_margin: int = 300) -> None:
+        self._cache_dir = cache_dir
+        self._expiry_margin = expiry_margin
+        self._states: dict[str, CachedAuthState] = {}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def get(self, user: UserData) -> Optional[CachedAuthState]:
+        state = self._states.get(user.email) or self._load(user)
+        if state is None:
+            return None
+        if not state.is_valid(self._expiry_margin):
+            logger.info(f"Cached auth state for {user.email} expired")
+            self.invalidate(user)
+            return None
+        self._states[user.email] = state
+        return state
+
+    async def save(self, user: UserData, context: BrowserContext) -> None:
+        if not user.token:
+            return
+        expires_at = decode_jwt_expiry(user.token)
+        if expires_at is None:
+            logger.warning(f"Can not decode token expiry for {user.email}")
+            return
+
+        state = CachedAuthState(
+            token=user.token,
+            expires_at=expires_at,
+            storage_state=await context.storage_state(),
+        )
+        self._states[user.email] = state
+
+        path = self._path(user)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    "token": state.token,
+                    "expires_at": state.expires_at,
+                    "storage_state": state.storage_state,
+                },
+                f,
+            )
+        os.replace(tmp_path, path)
+        logger.info(f"Saved auth state for {user.email}")
+
+    def invalidate(self, user: UserData) -> None:
+        self._states.pop(user.email, None)
+        try:
+            os.remove(self._path(user))
+        except FileNotFoundError:
+            pass
+
+    def _load(self, user: UserData) -> Optional[CachedAuthState]:
+        try:
+            with open(self._path(user)) as f:
+                data = json.load(f)
+            return CachedAuthState(
+                token=data["token"],
+                expires_at=float(data["expires_at"]),
+                storage_state=data["storage_state"],
+            )
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Corrupted auth state for {user.email}: {e}")
+            self.invalidate(user)
+            return None
+
+    def _path(self, user: UserData) -> str:
+        return os.path.join(self._cache_dir, f"{user.username}.json")
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+
+logger = logging.getLogger("[🌍BROWSER_POOL]")
+
+CHROMIUM_ARGS = ["--no-sandbox", "--disable-dev-shm-usage", "--window-size=1920,1080"]
+
+
+@dataclass
+class _PooledBrowser:
+    browser: Browser
+    contexts_served: int = 0
+    active: set[BrowserContext] = field(default_factory=set)
+
+
+class BrowserPool:
+    """
+    Per-worker pool of warm Chromium processes.
+
+    Every `new_context()` call returns a fresh isolated BrowserContext from
+    one of the pooled browsers. A browser is relaunched when it is no longer
+    connected, and recycled after it served `max_contexts_per_browser`
+    contexts and has none left open.
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        max_contexts_per_browser: int = 30,
+        headless: bool = True,
+    ) -> None:
+        self._size = size
+        self._max_contexts = max_contexts_per_browser
+        self._headless = headless
+        self._playwright: Optional[Playwright] = None
+        self._browsers: list[_PooledBrowser] = []
+        self._owners: dict[BrowserContext, _PooledBrowser] = {}
+        self._lock = asyncio.Lock()
+        self._launched = 0
+
+    @property
+    def launched(self) -> int:
+        return self._launched
+
+    async def new_context(self, **context_options: Any) -> BrowserContext:
+        async with self._lock:
+            pooled = await self._acquire_browser()
+            context = await pooled.browser.new_context(**context_options)
+            pooled.contexts_served += 1
+            pooled.active.add(context)
+            self._owners[context] = pooled
+        return context
+
+    async def release(self, context: BrowserContext) -> None:
+        """Close the context and recycle its browser if it is worn out."""
+        pooled = self._owners.pop(context, None)
+        try:
+            await asyncio.wait_for(context.close(), timeout=3)
+            logger.info("Closed context")
+        except Exception as e:
+            logger.warning(f"Failed to close context: {e}")
+
+        if pooled is None:
+            return
+        pooled.active.discard(context)
+        if pooled.contexts_served >= self._max_contexts and not pooled.active:
+            async with self._lock:
+                if pooled in self._browsers:
+                    self._browsers.remove(pooled)
+                    logger.info(
+                        f"Recycling browser after {pooled.contexts_served} contexts"
+                    )
+                    await self._close_browser(pooled)
+
+    async def close(self) -> None:
+        async with self._lock:
+            for pooled in self._browsers:
+                await self._close_browser(pooled)
+            self._browsers.clear()
+            self._owners.clear()
+            if self._playwright:
+                try:
+                    await asyncio.wait_for(self._playwright.stop(), timeout=3)
+                    logger.info("Stopped Playwright")
+                except Exception as e:
+                    logger.warning(f"Failed to stop Playwright: {e}")
+                self._playwright = None
+        logger.info(f"Browser pool closed, {self._launched} browsers launched")
+
+    async def _acquire_browser(self) -> _PooledBrowser:
+        # Health check: drop browsers that crashed or were disconnected
+        for pooled in list(self._browsers):
+            if not pooled.browser.is_connected():
+                logger.warning("Pooled browser is disconnected, dropping it")
+                self._browsers.remove(pooled)
+
+        available = [
+            pooled
+            for pooled in self._browsers
+            if pooled.contexts_served < self._max_contexts
+        ]
+        if not available or (
+            len(self._browsers) < self._size
+            and all(pooled.active for pooled in available)
+        ):
+            pooled = _PooledBrowser(browser=await self._launch())
+            self._browsers.append(pooled)
+            return pooled
+
+        return min(available, key=lambda pooled: len(pooled.active))
+
+    async def _launch(self) -> Browser:
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        logger.info("Starting browser in a headless mode...")
+        browser = await self._playwright.chromium.launch(
+            headless=self._headless, args=CHROMIUM_ARGS
+        )
+        self._launched += 1
+        return browser
+
+    @staticmethod
+    async def _close_browser(pooled: _PooledBrowser) -> None:
+        try:
+            if pooled.browser.is_connected():
+                await asyncio.wait_for(pooled.browser.close(), timeout=3)
+                logger.info("Closed browser")
+        except Exception as e:
+            logger.warning(f"Failed to close browser: {e}")
@@ -1,8 +1,12 @@
 import logging
-import re
-from typing import Optional
+from collections.abc import Sequence
 
-from tests.utils.cli.apolo_components.apolo_runner import ApoloRunner
+from tests.utils.cli.apolo_components.apolo_runner import (
+    ApoloRunner,
+    CLICommand,
+    CommandResult,
+)
+from tests.utils.cli.cli_table import CLITable, index_rows
 
 logger = logging.getLogger("[🖥apolo_CLI]")
 
@@ -14,6 +18,9 @@ class ApoloAdmin:
         self._parsed_get_org_users_output: list[dict[str, str]] = []
         self._parsed_get_proj_users_output: list[dict[str, str]] = []
         self._parsed_get_projects_output: list[dict[str, str]] = []
+        self._org_users_by_name: dict[str, dict[str, str]] = {}
+        self._proj_users_by_name: dict[str, dict[str, str]] = {}
+        self._projects_by_name: dict[str, dict[str, str]] = {}
 
     @property
     def parsed_get_orgs_output(self) -> list[str]:
@@ -62,6 +69,9 @@ class ApoloAdmin:
         )
         if result:
             self._parsed_get_projects_output = self._parse_get_projects_output()
+            self._projects_by_name = index_rows(
+                self._parsed_get_projects_output, "proj_name"
+            )
         return result, error_message
 
     async def add_proj_user(
@@ -98,6 +108,9 @@ class ApoloAdmin:
         )
         if result:
             self._parsed_get_proj_users_output = self._parse_get_proj_users_output()
+            self._proj_users_by_name = index_rows(
+                self._parsed_get_proj_users_output, "username"
+            )
         return result, error_message
 
     async def remove_proj_user(
@@ -147,18 +160,11 @@ class ApoloAdmin:
 
     async def get_organizations(self) -> list[str]:
         await self._runner.run_command("admin", "get-orgs", action="get organizations")
-        organizations: list[str] = []
-        lines = (self._runner.last_command_output or "").splitlines()
-        header_index: Optional[int] = None
-        for i, line in enumerate(lines):
-            if re.match(r"^\s*Name\s*$", line):
-                header_index = i
-                break
-        if header_index is not None:
-            for line in lines[header_index + 2 :]:
-                org_name = line.strip()
-                if org_name:
-                    organizations.append(org_name)
+        try:
+            table = CLITable.parse(self._runner.last_command_output or "", ["Name"])
+            organizations = [row["Name"] for row in table.rows if row["Name"]]
+        except ValueError:
+            organizations = []
         self._parsed_get_orgs_output = organizations
         logger.info(f"Fetched organizations: {organizations}")
         return organizations
@@ -175,6 +181,54 @@ class ApoloAdmin:
             action=f"add user {username} to organization {org_name} as {role}",
         )
 
+    async def add_users_to_org(
+        self,
+        org_name: str,
+        usernames: Sequence[str],
+        role: str,
+        max_parallel: int = 4,
+    ) -> list[CommandResult]:
+        return await self._runner.run_many(
+            [
+                CLICommand(
+                    args=("admin", "add-org-user", org_name, username, role),
+                    action=f"add user {username} to organization {org_name} as {role}",
+                )
+                for username in usernames
+            ],
+            max_parallel=max_parallel,
+        )
+
+    async def add_users_to_projects(
+        self,
+        org_name: str,
+        proj_names: Sequence[str],
+        usernames: Sequence[str],
+        role: str,
+        cluster: str = "default",
+        max_parallel: int = 4,
+    ) -> list[CommandResult]:
+        return await self._runner.run_many(
+            [
+                CLICommand(
+                    args=(
+                        "admin",
+                        "add-project-user",
+                        "--org",
+                        org_name,
+                        cluster,
+                        proj_name,
+                        username,
+                        role.lower(),
+                    ),
+                    action=f"add user {username} to project {proj_name}",
+                )
+                for proj_name in proj_names
+                for username in usernames
+            ],
+            max_parallel=max_parallel,
+        )
+
     async def remove_user_from_org(
         self, org_name: str, username: str
     ) -> tuple[bool, str]:
@@ -192,132 +246,51 @@ class ApoloAdmin:
         )
         if result:
             self._parsed_get_org_users_output = self._parse_get_org_users_output()
+            self._org_users_by_name = index_rows(
+                self._parsed_get_org_users_output, "username"
+            )
         return result, error_message
 
     def _parse_get_org_users_output(self) -> list[dict[str, str]]:
         """
-        Parse CLI table output using '│' as column delimiter.
-        Returns a list of dicts with username, email, role, credits.
+        Parse `admin get-org-users` table.
+        Returns a list of dicts with username, role, email, credits.
         """
-        lines = self._runner.last_command_output.strip().splitlines()
-        data_rows = []
-
-        for i, line in enumerate(lines):
-            if "Role" in line and "Email" in line and "Credits" in line:
-                header_index = i
-                break
-        else:
-            raise ValueError("Table header not found.")
-
-        for row in lines[header_index + 2 :]:
-            if (
-                not row.strip()
-                or row.strip().startswith("╺")
-                or row.strip().startswith("━")
-            ):
-                continue
-
-            cols = [col.strip() for col in row.strip(" │").split("│")]
-            if len(cols) < 7:
-                continue
-
-            data_rows.append(
-                {
-                    "username": cols[0],
-                    "role": cols[1],
-                    "email": cols[2],
-                    "credits": cols[5],
-                }
-            )
-
-        return data_rows
+        table = CLITable.parse(
+            self._runner.last_command_output, ["Name", "Role", "Email", "Credits"]
+        )
+        return table.select(
+            {"Name": "username", "Role": "role", "Email": "email", "Credits": "credits"}
+        )
 
     def _parse_get_proj_users_output(self) -> list[dict[str, str]]:
         """
-        Parse CLI table output using '│' as column delimiter.
+        Parse `admin get-project-users` table.
         Returns a list of dicts with keys: username, role, email.
         """
-        lines = self._runner.last_command_output.strip().splitlines()
-        data_rows = []
-
-        # Find the header row
-        header_index = None
-        for i, line in enumerate(lines):
-            if (
-                "Role" in line
-                and "Email" in line
-                and "Full name" in line
-                and "Registered" in line
-            ):
-                header_index = i
-                break
-        if header_index is None:
-            raise ValueError("Table header not found.")
-
-        # Parse each data row after the header (skip separators and empty lines)
-        for row in lines[header_index + 2 :]:
-            if (
-                not row.strip()
-                or row.strip().startswith("╺")
-                or row.strip().startswith("━")
-                or row.strip().startswith("╵")
-            ):
-                continue
-
-            cols = [col.strip() for col in row.strip(" │").split("│")]
-            if len(cols) < 5:
-                continue
-
-            data_rows.append(
-                {
-                    "username": cols[0],
-                    "role": cols[1],
-                    "email": cols[2],
-                }
-            )
-
-        return data_rows
+        table = CLITable.parse(
+            self._runner.last_command_output,
+            ["Name", "Role", "Email", "Full name", "Registered"],
+        )
+        return table.select({"Name": "username", "Role": "role", "Email": "email"})
 
     def _parse_get_projects_output(self) -> list[dict[str, str]]:
         """
         Parse CLI admin get-projects output into a list of dicts.
         Each dict has keys: proj_name, cluster, org_name, default_role, default_proj
         """
-        lines = [
-            line
-            for line in self._runner.last_command_output.strip().splitlines()
-            if line.strip()
-        ]
-        header_idx = next(
-            i
-            for i, line in enumerate(lines)
-            if "Project name" in line and "Cluster name" in line
+        table = CLITable.parse(
+            self._runner.last_command_output, ["Project name", "Cluster name"]
+        )
+        return table.select(
+            {
+                "Project name": "proj_name",
+                "Cluster name": "cluster",
+                "Org name": "org_name",
+                "Default role": "default_role",
+                "Is default project": "default_proj",
+            }
         )
-
-        data_lines = []
-        for line in lines[header_idx + 2 :]:
-            if line.startswith("━"):
-                continue
-            if line.strip() == "":
-                continue
-            data_lines.append(line)
-
-        result = []
-        for line in data_lines:
-            cols = [col.strip() for col in line.split("  ") if col.strip()]
-            if len(cols) < 5:
-                cols = [col.strip() for col in line.split() if col.strip()]
-            if len(cols) == 5:
-                result.append(
-                    {
-                        "proj_name": cols[0],
-                        "cluster": cols[1],
-                        "org_name": cols[2],
-                        "default_role": cols[3],
-                        "default_proj": cols[4],
-                    }
-                )
-        return result
 
     async def set_org_default_credits(
         self, org_name: str, credits_amount: int
@@ -346,16 +319,11 @@ class ApoloAdmin:
         self, username: str, role: str, email: str, credits: str | float | int
     ) -> tuple[bool, str]:
         """
-        Look up the user by username in _parsed_get_org_users_output and
+        Look up the user by username in the parsed get-org-users output and
         verify that role, email, and credits match expected values.
         Returns (True, "") if fields match, else (False, details).
         """
-        # Find user by username
-        user = None
-        for u in self._parsed_get_org_users_output:
-            if u.get("username") == username:
-                user = u
-                break
+        user = self._org_users_by_name.get(username)
 
         if user is None:
             return False, f"User '{username}' not found in list"
@@ -394,16 +362,11 @@ class ApoloAdmin:
         self, username: str, role: str, email: str
     ) -> tuple[bool, str]:
         """
-        Look up the user by username in _parsed_get_proj_users_output and
+        Look up the user by username in the parsed get-project-users output and
         verify that role and email match expected values.
         Returns (True, "") if fields match, else (False, details).
         """
-        # Find user by username
-        user = None
-        for u in self._parsed_get_proj_users_output:
-            if u.get("username") == username:
-                user = u
-                break
+        user = self._proj_users_by_name.get(username)
 
         if user is None:
             return False, f"User '{username}' not found in list"
@@ -432,16 +395,11 @@ class ApoloAdmin:
         cluster: str = "default",
     ) -> tuple[bool, str]:
         """
-        Look up the project by proj_name in _parsed_get_projects_output and
+        Look up the project by proj_name in the parsed get-projects output and
         verify that org_name, default_role, default_proj, cluster match.
         Returns (True, "") if fields match; else (False, error message).
         """
-        # Lookup project by proj_name
-        project = None
-        for p in self._parsed_get_projects_output:
-            if p.get("proj_name") == proj_name:
-                project = p
-                break
+        project = self._projects_by_name.get(proj_name)
 
         if not project:
             return False, f"Project '{proj_name}' not found in list"
@@ -1,7 +1,7 @@
 import logging
-import re
 
 from tests.utils.cli.apolo_components.apolo_runner import ApoloRunner
+from tests.utils.cli.cli_table import CLITable, index_rows
 from tests.utils.test_data_management.disk_data import DiskData
 
 logger = logging.getLogger("[🖥apolo_CLI]")
@@ -12,6 +12,7 @@ class ApoloDisk:
         self._runner = runner
         self._parsed_create_disk_output: dict[str, str] = {}
         self._parsed_disk_list_output: list[dict[str, str]] = []
+        self._disks_by_name: dict[str, dict[str, str]] = {}
 
     async def create_disk(self, disk: DiskData) -> tuple[bool, str]:
         options = ["--name", disk.name, "--org", disk.org_name]
@@ -48,6 +49,7 @@ class ApoloDisk:
         )
         if result:
             self._parsed_disk_list_output = self._parse_disk_list_output()
+            self._disks_by_name = index_rows(self._parsed_disk_list_output, "name")
             return result, error_message
         else:
             return result, error_message
@@ -181,77 +183,28 @@ class ApoloDisk:
         Parse disk list CLI output and return a list of dicts
         with only selected fields.
         """
-        mapping = {
-            "Id": "id",
-            "Name": "name",
-            "Storage": "storage",
-            "Uri": "uri",
-            "Org name": "org_name",
-            "Project name": "proj_name",
-        }
-
-        def clean_line(line: str) -> str:
-            # Remove ANSI escape codes
-            line = re.sub(r"\x1B\[[0-?]*[ -/]*[@-~]", "", line)
-            # Replace box drawing characters with spaces
-            return re.sub(r"[╺╸━│╷╵]", " ", line)
-
-        lines = [
-            clean_line(line)
-            for line in self._runner.last_command_output.splitlines()
-            if line.strip()
-        ]
-        data = []
-        headers = []
-        header_index = None
-        col_positions = []
-
-        # Find header row and determine column boundaries
-        for i, line in enumerate(lines):
-            if "Id" in line and "Name" in line and "Storage" in line:
-                header_index = i
-                headers = re.split(r"\s{2,}", line.strip())
-                # Record start positions for each column
-                last_pos = 0
-                for h in headers:
-                    pos = line.index(h, last_pos)
-                    col_positions.append(pos)
-                    last_pos = pos + len(h)
-                col_positions.append(len(line))  # end of last col
-                break
-
-        if header_index is None:
-            raise ValueError("Header row not found in disk list output.")
-
-        # Process rows after the header + separator
-        for row in lines[header_index + 2 :]:
-            if not row.strip():
-                continue
-            cols = [
-                row[col_positions[i] : col_positions[i + 1]].strip()
-                for i in range(len(headers))
-            ]
-            row_dict = {}
-            for header, col in zip(headers, cols):
-                if header in mapping:
-                    row_dict[mapping[header]] = col
-            if row_dict:
-                data.append(row_dict)
-
-        return data
+        table = CLITable.parse(
+            self._runner.last_command_output, ["Id", "Name", "Storage"]
+        )
+        return table.select(
+            {
+                "Id": "id",
+                "Name": "name",
+                "Storage": "storage",
+                "Uri": "uri",
+                "Org name": "org_name",
+                "Project name": "proj_name",
+            }
+        )
 
     async def verify_disk_in_list_output(self, disk: DiskData) -> tuple[bool, str]:
         """
-        Look up the disk by name in _parsed_list_disks_output and
+        Look up the disk by name in the parsed disk list output and
         verify that id, storage, uri, org_name, proj_name, owner match expected values.
         Returns (True, "") if fields match; else (False, error message).
         """
 
-        parsed_disk = None
-        for d in self._parsed_disk_list_output:
-            if d.get("name") == disk.name:
-                parsed_disk = d
-                break
+        parsed_disk = self._disks_by_name.get(disk.name)
 
         if not parsed_disk:
             return False, f"Disk '{disk.name}' not found in list"
@@ -5,6 +5,8 @@ from tests.utils.cli.apolo_components.apolo_runner import ApoloRunner
 
 logger = logging.getLogger("[🖥apolo_CLI]")
 
+JOB_ID_PATTERN = r"Job ID:\s*(job-[\w-]+)"
+
 
 class ApoloJob:
     def __init__(self, runner: ApoloRunner) -> None:
@@ -27,9 +29,7 @@ class ApoloJob:
         if not result:
             raise RuntimeError(error_message)
 
-        job_id_match = re.search(
-            r"Job ID:\s*(job-[\w-]+)", self._runner.last_command_output or ""
-        )
+        job_id_match = re.search(JOB_ID_PATTERN, self._runner.last_command_output or "")
         logger.info(f"Job ID match: {job_id_match}")
         job_id = job_id_match.group(1) if job_id_match else ""
         logger.info(f"Job ID logging: {job_id}")
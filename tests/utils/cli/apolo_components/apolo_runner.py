@@ -1,17 +1,89 @@
 import asyncio
 import logging
+import os
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Optional
 
 
 from tests.utils.cli.cli_command_manager import CLICommandManager
+from tests.utils.cli.persistent_command_manager import PersistentCLICommandManager
 
 logger = logging.getLogger("[🖥apolo_CLI]")
 
+# Retained per stream and command; long `job run`/`storage cp` output beyond
+# this is dropped from the start
+MAX_OUTPUT_LINES = 10_000
+
+
+class OutputCleaner:
+    """
+    Per-command stderr line filter that drops pip upgrade notices
+    ("You are using ...", "You should consider upgrading ...") together
+    with their follow-up lines.
+    """
+
+    IGNORED_STARTS = (
+        "You are using",
+        "You should consider upgrading via the following command:",
+    )
 
-class ApoloRunner:
     def __init__(self) -> None:
-        self._binary: str = "apolo"
-        self._manager: CLICommandManager = CLICommandManager(binary=self._binary)
+        self._skip_block = False
+
+    def __call__(self, line: str) -> Optional[str]:
+        stripped = line.strip()
+        if stripped.startswith(self.IGNORED_STARTS):
+            self._skip_block = True
+            return None
+        if self._skip_block and (stripped.startswith("python -m") or not stripped):
+            return None
+        self._skip_block = False
+        return line
+
+
+@dataclass(frozen=True)
+class CLICommand:
+    args: tuple[str, ...]
+    action: str
+    timeout: Optional[int] = None
+
+
+@dataclass
+class CommandResult:
+    command: CLICommand
+    ok: bool
+    output: str
+    error: str
+    duration: float
+
+    @property
+    def executed(self) -> str:
+        return f"apolo {' '.join(self.command.args)}"
+
+    @property
+    def last_output(self) -> str:
+        """What `last_command_output` holds after running this command alone."""
+        return self.error if not self.ok else self.output
+
+
+class ApoloRunner:
+    def __init__(
+        self, backend: Optional[str] = None, binary: Optional[str] = None
+    ) -> None:
+        """
+        backend: "subprocess" spawns a fresh `apolo` process per command,
+        "worker" runs commands in a shared long-lived apolo-cli process.
+        Defaults to the APOLO_CLI_BACKEND env variable, then "subprocess".
+        binary: executable for the subprocess backend, e.g. a fake `apolo`;
+        defaults to the APOLO_CLI_BINARY env variable, then "apolo".
+        """
+        self._binary: str = binary or os.getenv("APOLO_CLI_BINARY") or "apolo"
+        self.backend = backend or os.getenv("APOLO_CLI_BACKEND", "subprocess")
+        if self.backend not in ("subprocess", "worker"):
+            raise ValueError(f"Unknown apolo CLI backend: {self.backend}")
+        self._manager: CLICommandManager = self._new_manager()
         self.last_command_executed: str = ""
         self.last_command_output: str = ""
 
@@ -19,24 +91,78 @@ class ApoloRunner:
         return await self.run_command("--version", action="check CLI version")
 
     async def run_command(
-        self, *args: str, action: str, timeout: Optional[int] = None
+        self,
+        *args: str,
+        action: str,
+        timeout: Optional[int] = None,
     ) -> tuple[bool, str]:
-        default_timeout: int = timeout if timeout else 60
+        """Run apolo command and capture its output."""
+        command = CLICommand(args=args, action=action, timeout=timeout)
+        self.last_command_executed = f"{self._binary} {' '.join(args)}"
+        result = await self._execute(self._manager, command)
+        self.last_command_output = result.last_output
+        return result.ok, result.error
+
+    async def run_many(
+        self, commands: Sequence[CLICommand], max_parallel: int = 4
+    ) -> list[CommandResult]:
+        """
+        Run independent commands concurrently, at most `max_parallel` at a
+        time, each with its own command manager. Results keep the input order;
+        a failing or timed-out command does not stop the others.
+        last_command_executed/output hold all commands for step attachments.
+        """
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def _run(command: CLICommand) -> CommandResult:
+            async with semaphore:
+                started = time.monotonic()
+                try:
+                    return await self._execute(self._new_manager(), command)
+                except Exception as exc:
+                    return CommandResult(
+                        command=command,
+                        ok=False,
+                        output="",
+                        error=str(exc),
+                        duration=time.monotonic() - started,
+                    )
+
+        results = list(await asyncio.gather(*(_run(c) for c in commands)))
+        self.last_command_executed = "\n".join(r.executed for r in results)
+        self.last_command_output = "\n\n".join(
+            f"$ {r.executed}\n{r.last_output}" for r in results
+        )
+        return results
+
+    def _new_manager(self) -> CLICommandManager:
+        if self.backend == "worker":
+            return PersistentCLICommandManager(
+                binary=self._binary,
+                max_lines=MAX_OUTPUT_LINES,
+                stderr_filter=OutputCleaner,
+            )
+        return CLICommandManager(
+            binary=self._binary,
+            max_lines=MAX_OUTPUT_LINES,
+            stderr_filter=OutputCleaner,
+        )
+
+    async def _execute(
+        self, manager: CLICommandManager, command: CLICommand
+    ) -> CommandResult:
+        args, action = command.args, command.action
+        default_timeout: int = command.timeout if command.timeout else 60
         logger.info(
             f"{action}. Running command via cli:\n\n{self._binary} {' '.join(args)}\n"
         )
-        self.last_command_executed = f"{self._binary} {' '.join(args)}"
+        started = time.monotonic()
 
         try:
-            await asyncio.wait_for(
-                self._manager.run_async(*args), timeout=default_timeout
-            )
-            await asyncio.wait_for(self._manager.wait(), timeout=default_timeout)
+            await asyncio.wait_for(manager.run_async(*args), timeout=default_timeout)
+            await asyncio.wait_for(manager.wait(), timeout=default_timeout)
         except asyncio.TimeoutError:
-            if hasattr(self._manager, "kill"):
-                self._manager.kill()
-            elif hasattr(self._manager, "process") and self._manager.process:
-                self._manager.process.kill()
+            manager.kill()
             logger.error(
                 f"Command timed out after {default_timeout} seconds and was killed."
             )
@@ -47,41 +173,20 @@ class ApoloRunner:
             logger.exception(f"Error running command {args}: {exc}")
             raise
 
-        raw_output = await self._manager.get_output()
-        raw_error = await self._manager.get_error()
-
-        def clean_output(text: str) -> str:
-            if not text:
-                return ""
-
-            ignored_starts = [
-                "You are using",
-                "You should consider upgrading via the following command:",
-            ]
-
-            cleaned_lines: list[str] = []
-            skip_block = False
-            for line in text.splitlines():
-                if any(line.strip().startswith(prefix) for prefix in ignored_starts):
-                    skip_block = True
-                    continue
-                if skip_block and (
-                    line.strip().startswith("python -m") or not line.strip()
-                ):
-                    continue
-                skip_block = False
-                cleaned_lines.append(line)
-
-            return "\n".join(cleaned_lines)
-
-        self.last_command_output = raw_output
-        cleaned_error = clean_output(raw_error)
-
-        if cleaned_error:
-            error_message = f"{action} failed:\n\n{cleaned_error}\n{self.last_command_output or ''}\n"
-            logger.error(error_message)
-            self.last_command_output = cleaned_error
-            return False, cleaned_error
+        output = await manager.get_output()
+        # stderr is already filtered line by line by OutputCleaner
+        error = await manager.get_error()
+        result = CommandResult(
+            command=command,
+            ok=not error,
+            output=output,
+            error=error,
+            duration=time.monotonic() - started,
+        )
 
-        logger.info(f"{action} succeeded:\n\n{self.last_command_output}\n")
-        return True, ""
+        if error:
+            error_message = f"{action} failed:\n\n{error}\n{output or ''}\n"
+            logger.error(error_message)
+        else:
+            logger.info(f"{action} succeeded:\n\n{output}\n")
+        return result
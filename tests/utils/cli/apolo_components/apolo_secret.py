@@ -1,6 +1,7 @@
 import logging
 
 from tests.utils.cli.apolo_components.apolo_runner import ApoloRunner
+from tests.utils.cli.cli_table import CLITable, index_rows
 
 logger = logging.getLogger("[🖥apolo_CLI]")
 
@@ -9,6 +10,7 @@ class ApoloSecret:
     def __init__(self, runner: ApoloRunner) -> None:
         self._runner = runner
         self._parsed_list_secrets_output: list[dict[str, str]] = []
+        self._secrets_by_key: dict[str, dict[str, str]] = {}
 
     async def create_secret(
         self, secret_name: str, secret_value: str
@@ -28,7 +30,9 @@ class ApoloSecret:
             # "--full-uri",
             action="list secrets",
         )
-        self._parsed_list_secrets_output = self._parse_list_secrets_output()
+        if result:
+            self._parsed_list_secrets_output = self._parse_list_secrets_output()
+            self._secrets_by_key = index_rows(self._parsed_list_secrets_output, "key")
         return result, error_message
 
     async def remove_secret(self, secret_name: str) -> tuple[bool, str]:
@@ -41,35 +45,25 @@ class ApoloSecret:
 
     def _parse_list_secrets_output(self) -> list[dict[str, str]]:
         """
-        Parses CLI-like table output into a list of dictionaries.
+        Parses `secret ls` table output into a list of dictionaries.
         Returns:
             list[dict]: A list of dictionaries with keys: key, org_name, project_name.
         """
-        lines = self._runner.last_command_output.strip().split("\n")
-
-        # Skip header and separator lines
-        data_lines = [
-            line.strip()
-            for line in lines
-            if line.strip() and not line.startswith("━") and not line.startswith("Key")
-        ]
-
-        result = []
-        for line in data_lines:
-            parts = line.split()
-            if len(parts) >= 3:
-                key_value = parts[0].replace("secret:", "", 1)
-                result.append(
-                    {"key": key_value, "org_name": parts[1], "project_name": parts[2]}
-                )
-
-        return result
+        table = CLITable.parse(
+            self._runner.last_command_output, ["Key", "Org", "Project"]
+        )
+        rows = table.select(
+            {"Key": "key", "Org": "org_name", "Project": "project_name"}
+        )
+        for row in rows:
+            row["key"] = row["key"].replace("secret:", "", 1)
+        return rows
 
     async def verify_secret_in_list_output(
         self, key: str, org_name: str, proj_name: str
     ) -> tuple[bool, str]:
         """
-        Look up the secret by key in _parsed_list_secrets_output and
+        Look up the secret by key in the parsed secret list output and
         verify that key, org_name, project_name match expected values.
 
         Args:
@@ -81,11 +75,7 @@ class ApoloSecret:
             tuple[bool, str]: (True, "") if matches; (False, error_message) otherwise.
         """
 
-        parsed_secret = None
-        for s in self._parsed_list_secrets_output:
-            if s.get("key") == key:
-                parsed_secret = s
-                break
+        parsed_secret = self._secrets_by_key.get(key)
 
         if not parsed_secret:
             return False, f"Secret with key '{key}' not found in list"
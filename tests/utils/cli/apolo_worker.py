@@ -0,0 +1,93 @@
+"""
+Long-lived apolo CLI worker.
+
+Imports apolo-cli once and then executes commands read from stdin, one JSON
+request per line: {"args": [...]}. Every command is answered with a line
+holding the reply size in bytes, followed by that many bytes of JSON:
+{"returncode": int, "stdout": str, "stderr": str}, i.e. exactly what a fresh
+`apolo` process would have produced. The size prefix lets the reader take
+replies of any size without a line length limit.
+
+The script is started by PersistentCLICommandManager and must not import
+anything from the tests package.
+"""
+
+import json
+import logging
+import os
+import sys
+import tempfile
+import traceback
+from typing import Any, Optional
+
+
+def _run(main: object, args: list[str]) -> tuple[int, str, str]:
+    """
+    Run one command with fd 1/2 pointed at temp files, so everything the
+    command writes is captured, including streams cached by click/rich.
+    """
+    root_logger = logging.getLogger()
+    handlers, level = list(root_logger.handlers), root_logger.level
+    returncode = 0
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        saved = os.dup(1), os.dup(2)
+        os.dup2(out.fileno(), 1)
+        os.dup2(err.fileno(), 2)
+        try:
+            main(args)  # type: ignore[operator]
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                returncode = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                returncode = 1
+        except BaseException:
+            traceback.print_exc()
+            returncode = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved[0], 1)
+            os.dup2(saved[1], 2)
+            os.close(saved[0])
+            os.close(saved[1])
+            # apolo-cli adds console and file log handlers on every invocation
+            for handler in list(root_logger.handlers):
+                if handler not in handlers:
+                    root_logger.removeHandler(handler)
+            root_logger.setLevel(level)
+        out.seek(0)
+        err.seek(0)
+        return returncode, out.read().decode(), err.read().decode()
+
+
+def serve(main: Optional[Any] = None) -> None:
+    """Answer commands until stdin is closed; `main` defaults to apolo-cli."""
+    # Keep the protocol pipes private: stray writes to fd 0/1/2 from apolo-cli
+    # or its children must not corrupt or consume protocol messages.
+    requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    replies = os.fdopen(os.dup(1), "wb")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+
+    if main is None:
+        # click takes the program name for usage/help texts from argv[0]
+        sys.argv = ["apolo"]
+        from apolo_cli.main import main
+
+    for line in requests:
+        if not line.strip():
+            continue
+        args = json.loads(line)["args"]
+        returncode, out, err = _run(main, args)
+        reply = json.dumps({"returncode": returncode, "stdout": out, "stderr": err})
+        payload = reply.encode()
+        replies.write(b"%d\n" % len(payload) + payload)
+        replies.flush()
+
+
+if __name__ == "__main__":
+    serve()
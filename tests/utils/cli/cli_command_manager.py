@@ -1,44 +1,154 @@
 import asyncio
 import logging
+import re
+from collections import deque
+from collections.abc import AsyncIterator, Callable
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Returns a fresh per-command line filter; the filter maps a line to the
+# line to keep, or None to drop it.
+LineFilterFactory = Callable[[], Callable[[str], Optional[str]]]
+
+STREAMS = ("stdout", "stderr")
+
 
 class CLICommandManager:
-    def __init__(self, binary: str = "apolo") -> None:
+    def __init__(
+        self,
+        binary: str = "apolo",
+        max_lines: Optional[int] = None,
+        stderr_filter: Optional[LineFilterFactory] = None,
+    ) -> None:
+        """
+        max_lines: keep only the last N lines of each stream (None keeps all).
+        stderr_filter: applied to every stderr line as it arrives.
+        """
         self.binary: str = binary
+        self._max_lines = max_lines
+        self._stderr_filter_factory = stderr_filter
+        self._stderr_filter: Optional[Callable[[str], Optional[str]]] = None
         self._process: Optional[asyncio.subprocess.Process] = None
+        self._readers: list[asyncio.Task[None]] = []
+        self._lines: dict[str, deque[str]] = {}
+        self._subscribers: dict[str, list[asyncio.Queue[Optional[str]]]] = {}
+        self._ended: dict[str, bool] = {}
+        self._stopped_early: bool = False
         self._stdout: str = ""
         self._stderr: str = ""
         self._raw_stderr: str = ""
+        self._reset()
 
     async def run_async(self, *args: str) -> None:
-        """Start CLI command asynchronously (non-blocking)."""
+        """Start CLI command asynchronously and capture its whole output."""
+        await self.start(*args)
+        await self._capture_output()
+
+    async def start(self, *args: str) -> None:
+        """
+        Start CLI command and stream its output in the background.
+        Use iter_lines/wait_for_line while it runs and finish() afterwards.
+        """
+        self._reset()
         self._process = await asyncio.create_subprocess_exec(
             self.binary,
             *args,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
+            limit=2**24,
         )
+        assert self._process.stdout and self._process.stderr, "Pipes are not open"
+        self._readers = [
+            asyncio.create_task(self._pump("stdout", self._process.stdout)),
+            asyncio.create_task(self._pump("stderr", self._process.stderr)),
+        ]
+
+    async def finish(self) -> None:
+        """Wait until the streamed command exits and store its output."""
         await self._capture_output()
 
     async def _capture_output(self) -> None:
         if not self._process:
             return
 
-        stdout_data, stderr_data = await self._process.communicate()
-        self._stdout = stdout_data.decode().strip()
+        await asyncio.gather(*self._readers)
+        await self._process.wait()
+        self._finalize(self._process.returncode)
 
-        stderr_text = stderr_data.decode().strip()
+    def _store_output(
+        self, returncode: Optional[int], stdout: str, stderr: str
+    ) -> None:
+        """Store the output of a command that was not streamed."""
+        for name, text in (("stdout", stdout), ("stderr", stderr)):
+            lines = text.split("\n")
+            if lines[-1] == "":
+                lines.pop()
+            for line in lines:
+                self._feed(name, line)
+            self._end(name)
+        self._finalize(returncode)
+
+    def _finalize(self, returncode: Optional[int]) -> None:
+        self._stdout = "\n".join(self._lines["stdout"]).strip()
+
+        stderr_text = "\n".join(self._lines["stderr"]).strip()
         self._raw_stderr = stderr_text
 
-        returncode = self._process.returncode
+        if self._stopped_early:
+            # Stopped by us after the expected output showed up
+            returncode = 0
         if returncode and returncode != 0:
             self._stderr = stderr_text
         else:
             self._stderr = ""
 
+    async def iter_lines(self, stream: str = "stdout") -> AsyncIterator[str]:
+        """Yield lines of `stream` as they arrive, starting from now."""
+        if self._ended[stream]:
+            return
+        queue: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        self._subscribers[stream].append(queue)
+        try:
+            while (line := await queue.get()) is not None:
+                yield line
+        finally:
+            self._subscribers[stream].remove(queue)
+
+    async def wait_for_line(
+        self,
+        pattern: str | re.Pattern[str],
+        stream: str = "stdout",
+        timeout: Optional[float] = None,
+        stop: bool = False,
+    ) -> Optional[re.Match[str]]:
+        """
+        Wait until a line of `stream` matches `pattern`; lines already
+        retained are checked first. Returns None if the stream ends without
+        a match. With `stop`, the command is terminated once it matched.
+        """
+        regex = re.compile(pattern)
+
+        async def _search() -> Optional[re.Match[str]]:
+            for line in list(self._lines[stream]):
+                if match := regex.search(line):
+                    return match
+            async for line in self.iter_lines(stream):
+                if match := regex.search(line):
+                    return match
+            return None
+
+        match = await asyncio.wait_for(_search(), timeout)
+        if match and stop:
+            await self.stop_early()
+        return match
+
+    async def stop_early(self) -> None:
+        """Terminate the running command; it is treated as succeeded."""
+        if await self.is_running():
+            self._stopped_early = True
+            await self.stop()
+
     async def is_running(self) -> bool:
         return self._process is not None and self._process.returncode is None
 
@@ -59,3 +169,38 @@ class CLICommandManager:
     async def stop(self) -> None:
         if self._process and await self.is_running():
             self._process.terminate()
+
+    def kill(self) -> None:
+        if self._process and self._process.returncode is None:
+            self._process.kill()
+
+    def _reset(self) -> None:
+        self._process = None
+        self._readers = []
+        self._lines = {name: deque(maxlen=self._max_lines) for name in STREAMS}
+        self._subscribers = {name: [] for name in STREAMS}
+        self._ended = {name: False for name in STREAMS}
+        self._stopped_early = False
+        self._stderr_filter = (
+            self._stderr_filter_factory() if self._stderr_filter_factory else None
+        )
+
+    async def _pump(self, name: str, reader: asyncio.StreamReader) -> None:
+        while raw := await reader.readline():
+            self._feed(name, raw.decode().rstrip("\n"))
+        self._end(name)
+
+    def _feed(self, name: str, line: str) -> None:
+        if name == "stderr" and self._stderr_filter:
+            filtered = self._stderr_filter(line)
+            if filtered is None:
+                return
+            line = filtered
+        self._lines[name].append(line)
+        for queue in self._subscribers[name]:
+            queue.put_nowait(line)
+
+    def _end(self, name: str) -> None:
+        self._ended[name] = True
+        for queue in self._subscribers[name]:
+            queue.put_nowait(None)
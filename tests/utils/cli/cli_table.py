@@ -0,0 +1,76 @@
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+_ANSI_ESCAPE = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
+# Rich box drawing characters used by apolo-cli tables (cell separators,
+# header underlines and table edges)
+_BOX_CHARS = re.compile(r"[│┃╷╵╺╸━─┿┼╋]")
+_CELL_GAP = re.compile(r"\s{2,}")
+
+
+@dataclass(frozen=True)
+class CLITable:
+    """
+    A table printed by apolo-cli, tokenized once into rows keyed by header.
+
+    Works for both table styles the CLI uses: cells separated by `│` and
+    cells separated by padding only. Column boundaries are taken from the
+    header row, so empty cells and values with single spaces stay in place.
+    """
+
+    headers: tuple[str, ...]
+    rows: tuple[dict[str, str], ...]
+
+    @classmethod
+    def parse(cls, output: str, required: Iterable[str]) -> "CLITable":
+        """
+        Parse `output`; the header is the first line that contains every
+        header in `required`. Raises ValueError if there is no such line.
+        """
+        required = list(required)
+        lines = [
+            _BOX_CHARS.sub(" ", _ANSI_ESCAPE.sub("", line))
+            for line in output.splitlines()
+        ]
+
+        for header_index, line in enumerate(lines):
+            headers = _CELL_GAP.split(line.strip())
+            if all(name in headers for name in required):
+                break
+        else:
+            raise ValueError(f"Table header {required} not found in CLI output.")
+
+        positions: list[int] = []
+        last_pos = 0
+        for name in headers:
+            pos = line.index(name, last_pos)
+            positions.append(pos)
+            last_pos = pos + len(name)
+        positions.append(max(len(row) for row in lines))
+
+        rows = []
+        for row in lines[header_index + 1 :]:
+            if not row.strip():
+                continue
+            cells = [
+                row[positions[i] : positions[i + 1]].strip()
+                for i in range(len(headers))
+            ]
+            rows.append(dict(zip(headers, cells)))
+        return cls(headers=tuple(headers), rows=tuple(rows))
+
+    def select(self, mapping: Mapping[str, str]) -> list[dict[str, str]]:
+        """Rows with only the `mapping` headers, renamed to the mapped keys."""
+        return [
+            {key: row.get(header, "") for header, key in mapping.items()}
+            for row in self.rows
+        ]
+
+
+def index_rows(rows: Iterable[dict[str, str]], key: str) -> dict[str, dict[str, str]]:
+    """Index parsed rows by the value of `key`; the first row wins on duplicates."""
+    index: dict[str, dict[str, str]] = {}
+    for row in rows:
+        index.setdefault(row[key], row)
+    return index
@@ -0,0 +1,130 @@
+import asyncio
+import json
+import logging
+import os
+import sys
+from typing import Optional
+
+from tests.utils.cli.cli_command_manager import CLICommandManager, LineFilterFactory
+
+logger = logging.getLogger(__name__)
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(__file__), "apolo_worker.py")
+
+
+class ApoloWorker:
+    """
+    One long-lived Python process with apolo-cli imported, shared by all
+    persistent command managers of a pytest worker.
+    Commands are executed one at a time; the process is restarted lazily
+    after it was killed or died.
+    """
+
+    _shared: Optional["ApoloWorker"] = None
+
+    def __init__(self, script: str = WORKER_SCRIPT) -> None:
+        self._script = script
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._lock = asyncio.Lock()
+        self.commands_run = 0
+        self.started = 0
+
+    @classmethod
+    def shared(cls) -> "ApoloWorker":
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    @classmethod
+    async def close_shared(cls) -> None:
+        if cls._shared is not None:
+            await cls._shared.close()
+            cls._shared = None
+
+    async def execute(self, *args: str) -> tuple[int, str, str]:
+        async with self._lock:
+            process = await self._ensure_started()
+            assert process.stdin and process.stdout, "Worker pipes are not open"
+            try:
+                process.stdin.write(json.dumps({"args": list(args)}).encode() + b"\n")
+                await process.stdin.drain()
+                # Size-prefixed reply: outputs above the stream's line limit
+                # (64 KiB) must not break the read
+                header = await process.stdout.readline()
+                payload = await process.stdout.readexactly(int(header))
+            except (ValueError, asyncio.IncompleteReadError):
+                # No, garbled or truncated reply
+                self.kill()
+                raise RuntimeError("apolo worker process exited unexpectedly")
+            except BaseException:
+                # Timed out or cancelled mid-command: the reply stream is out of sync
+                self.kill()
+                raise
+            self.commands_run += 1
+            reply = json.loads(payload)
+            return int(reply["returncode"]), reply["stdout"], reply["stderr"]
+
+    def kill(self) -> None:
+        if self._process and self._process.returncode is None:
+            self._process.kill()
+        self._process = None
+
+    async def close(self) -> None:
+        process, self._process = self._process, None
+        if not process or process.returncode is not None:
+            return
+        if process.stdin:
+            process.stdin.close()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=5)
+        except TimeoutError:
+            process.kill()
+        logger.info(
+            f"apolo worker closed after {self.commands_run} commands, "
+            f"{self.started} starts"
+        )
+
+    async def _ensure_started(self) -> asyncio.subprocess.Process:
+        if self._process is None or self._process.returncode is not None:
+            # -P: the script directory must not go on sys.path, otherwise
+            # tests/utils/cli/apolo_cli.py shadows the apolo_cli package
+            self._process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-P",
+                self._script,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+            )
+            self.started += 1
+            logger.info(f"Started apolo worker process (pid {self._process.pid})")
+        return self._process
+
+
+class PersistentCLICommandManager(CLICommandManager):
+    """
+    Same interface and output handling as CLICommandManager, but commands
+    run in a shared long-lived apolo worker instead of a fresh `apolo`
+    process, so interpreter startup and apolo-cli imports are paid once.
+    """
+
+    def __init__(
+        self,
+        binary: str = "apolo",
+        worker: Optional[ApoloWorker] = None,
+        max_lines: Optional[int] = None,
+        stderr_filter: Optional[LineFilterFactory] = None,
+    ) -> None:
+        super().__init__(
+            binary=binary, max_lines=max_lines, stderr_filter=stderr_filter
+        )
+        self._worker = worker or ApoloWorker.shared()
+
+    async def start(self, *args: str) -> None:
+        # The worker replies with the whole output at once, so "streaming"
+        # replays it: iter_lines/wait_for_line see the lines after the fact.
+        self._reset()
+        returncode, stdout, stderr = await self._worker.execute(*args)
+        self._store_output(returncode, stdout, stderr)
+
+    def kill(self) -> None:
+        self._worker.kill()
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+logger = logging.getLogger("[🔧FILE_HASHER]")
+
+# Files at least this big are hashed from one mmap in a single update
+MMAP_THRESHOLD = 8 * 1024 * 1024
+FIRST_BLOCK_SIZE = 64 * 1024
+
+# (realpath, size, mtime_ns, inode, algorithm)
+_Key = tuple[str, int, int, int, str]
+
+
+@dataclass
+class HasherStats:
+    hashed: int = 0
+    hashed_bytes: int = 0
+    cache_hits: int = 0
+    short_circuits: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"{self.hashed} files hashed ({self.hashed_bytes / 2**20:.1f} MiB), "
+            f"{self.cache_hits} cache hits, {self.short_circuits} short-circuits"
+        )
+
+
+class FileHasher:
+    """
+    File digests with a cache keyed by (path, size, mtime, inode).
+
+    A changed file gets a new key, so a cached digest is never stale.
+    hashlib releases the GIL while hashing, so the async variants run in a
+    thread pool and hash several files in parallel without blocking the
+    event loop.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self.stats = HasherStats()
+        self._cache: dict[_Key, str] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="file-hasher"
+        )
+
+    def digest(self, path: str, algorithm: str = "md5") -> str:
+        key = self._key(path, algorithm)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self.stats.cache_hits += 1
+                return cached
+
+        hexdigest = self._hash(path, algorithm, size=key[1])
+        with self._lock:
+            self._cache[key] = hexdigest
+            self.stats.hashed += 1
+            self.stats.hashed_bytes += key[1]
+        return hexdigest
+
+    def remember(self, path: str, hexdigest: str, algorithm: str = "md5") -> None:
+        """Store a digest that is already known, e.g. computed while writing."""
+        with self._lock:
+            self._cache[self._key(path, algorithm)] = hexdigest
+
+    def same_content(self, path_1: str, path_2: str, algorithm: str = "md5") -> bool:
+        verdict = self._short_circuit(path_1, path_2)
+        if verdict is not None:
+            return verdict
+        return self.digest(path_1, algorithm) == self.digest(path_2, algorithm)
+
+    async def digest_async(self, path: str, algorithm: str = "md5") -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.digest, path, algorithm)
+
+    async def same_content_async(
+        self, path_1: str, path_2: str, algorithm: str = "md5"
+    ) -> bool:
+        loop = asyncio.get_running_loop()
+        verdict = await loop.run_in_executor(
+            self._executor, self._short_circuit, path_1, path_2
+        )
+        if verdict is not None:
+            return verdict
+        digest_1, digest_2 = await asyncio.gather(
+            self.digest_async(path_1, algorithm), self.digest_async(path_2, algorithm)
+        )
+        return digest_1 == digest_2
+
+    def _short_circuit(self, path_1: str, path_2: str) -> Optional[bool]:
+        """Decide without hashing when possible: same inode, size or first block."""
+        stat_1, stat_2 = os.stat(path_1), os.stat(path_2)
+        verdict: Optional[bool] = None
+        if (stat_1.st_dev, stat_1.st_ino) == (stat_2.st_dev, stat_2.st_ino):
+            verdict = True
+        elif stat_1.st_size != stat_2.st_size:
+            verdict = False
+        else:
+            with open(path_1, "rb") as f_1, open(path_2, "rb") as f_2:
+                if f_1.read(FIRST_BLOCK_SIZE) != f_2.read(FIRST_BLOCK_SIZE):
+                    verdict = False
+                elif stat_1.st_size <= FIRST_BLOCK_SIZE:
+                    verdict = True
+        if verdict is not None:
+            with self._lock:
+                self.stats.short_circuits += 1
+        return verdict
+
+    @staticmethod
+    def _key(path: str, algorithm: str) -> _Key:
+        real_path = os.path.realpath(path)
+        stat = os.stat(real_path)
+        return real_path, stat.st_size, stat.st_mtime_ns, stat.st_ino, algorithm
+
+    @staticmethod
+    def _hash(path: str, algorithm: str, size: int) -> str:
+        with open(path, "rb") as f:
+            if size < MMAP_THRESHOLD:
+                return hashlib.file_digest(f, algorithm).hexdigest()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.new(algorithm, mm).hexdigest()
+
+
+file_hasher = FileHasher()
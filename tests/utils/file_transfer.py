@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Optional
+
+import aiofiles
+import aiohttp
+
+CHUNK_SIZE = 4 * 1024 * 1024
+
+# Multi-GB transfers can not fit into the default 60s total timeout; only
+# a stalled connection is treated as a failure.
+TRANSFER_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=120)
+
+_UNSATISFIED_RANGE = re.compile(r"bytes \*/(\d+)")
+
+
+class StreamDigest:
+    """md5 and sha256 of a byte stream, updated chunk by chunk."""
+
+    def __init__(self) -> None:
+        self._md5 = hashlib.md5()
+        self._sha256 = hashlib.sha256()
+        self.size = 0
+
+    def update(self, chunk: bytes | memoryview) -> None:
+        self._md5.update(chunk)
+        self._sha256.update(chunk)
+        self.size += len(chunk)
+
+    @property
+    def md5(self) -> str:
+        return self._md5.hexdigest()
+
+    @property
+    def sha256(self) -> str:
+        return self._sha256.hexdigest()
+
+
+@dataclass
+class TransferResult:
+    path: str
+    status: int
+    size: int = 0
+    md5: str = ""
+    sha256: str = ""
+    # Bytes that were already on disk when the download was resumed
+    resumed_from: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    def matches(self, other: TransferResult) -> bool:
+        return (self.size, self.md5, self.sha256) == (
+            other.size,
+            other.md5,
+            other.sha256,
+        )
+
+
+async def read_chunks(
+    path: str, digest: StreamDigest, chunk_size: int = CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Stream a file without loading it into memory, hashing every chunk."""
+    async with aiofiles.open(path, "rb") as f:
+        while chunk := await f.read(chunk_size):
+            digest.update(chunk)
+            yield chunk
+
+
+async def digest_file(path: str, chunk_size: int = CHUNK_SIZE) -> StreamDigest:
+    digest = StreamDigest()
+    async for _ in read_chunks(path, digest, chunk_size):
+        pass
+    return digest
+
+
+def unsatisfied_range_total(content_range: str) -> Optional[int]:
+    """File size from the `bytes */N` Content-Range of a 416 response."""
+    match = _UNSATISFIED_RANGE.fullmatch(content_range.strip())
+    return int(match.group(1)) if match else None
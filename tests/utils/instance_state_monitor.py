@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from tests.utils.api_helper import APIHelper
+from tests.utils.state_waiter import StatePoller, WaitResult
+
+logger = logging.getLogger("[📡INSTANCE_MONITOR]")
+
+
+class InstanceStateMonitor:
+    """
+    Serves app state waits from a single get_instances poll loop per project.
+
+    Any number of concurrent `wait_for` calls in the same (org, project)
+    share one request per tick, so N installs cost one poll instead of N.
+    """
+
+    def __init__(self, api_helper: APIHelper) -> None:
+        self._api_helper = api_helper
+        self._pollers: dict[tuple[str, str], StatePoller] = {}
+        self._tokens: dict[tuple[str, str], str] = {}
+
+    async def wait_for(
+        self,
+        app_id: str,
+        state: str | Iterable[str],
+        token: str,
+        org_name: str,
+        proj_name: str,
+        fail_states: Iterable[str] = (),
+        timeout: float = 600,
+        fail_if_missing: bool = False,
+    ) -> WaitResult:
+        states = [state] if isinstance(state, str) else list(state)
+        poller = self._get_poller(token, org_name, proj_name)
+        return await poller.wait_for(
+            app_id,
+            states=states,
+            fail_states=fail_states,
+            timeout=timeout,
+            fail_if_missing=fail_if_missing,
+        )
+
+    def requests_made(self, org_name: str, proj_name: str) -> int:
+        poller = self._pollers.get((org_name, proj_name))
+        return poller.requests if poller else 0
+
+    def _get_poller(self, token: str, org_name: str, proj_name: str) -> StatePoller:
+        key = (org_name, proj_name)
+        # Latest caller token is used, so polling survives token refreshes
+        self._tokens[key] = token
+        poller = self._pollers.get(key)
+        if poller:
+            return poller
+
+        async def fetch(
+            etag: Optional[str],
+        ) -> tuple[Optional[str], Optional[dict[str, dict[str, Any]]]]:
+            (
+                status,
+                response,
+                new_etag,
+            ) = await self._api_helper.get_instances_if_changed(
+                token=self._tokens[key],
+                org_name=org_name,
+                proj_name=proj_name,
+                etag=etag,
+            )
+            if status == 304:
+                return new_etag, None
+            if status != 200:
+                raise RuntimeError(f"API returned {status} instead of 200: {response}")
+            items = response.get("items", [])
+            return new_etag, {item["id"]: item for item in items if "id" in item}
+
+        poller = StatePoller(name=f"instances {org_name}/{proj_name}", fetch=fetch)
+        self._pollers[key] = poller
+        logger.info(f"Started instances poller for {org_name}/{proj_name}")
+        return poller
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+from tests.utils.api_helper import APIHelper
+
+logger = logging.getLogger("[🧹ORG_CLEANER]")
+
+
+@dataclass
+class CleanupFailure:
+    resource: str
+    error: str
+
+    def __str__(self) -> str:
+        return f"{self.resource}: {self.error}"
+
+
+@dataclass
+class CleanupResult:
+    deleted_orgs: list[str] = field(default_factory=list)
+    deleted_projects: list[str] = field(default_factory=list)
+    failures: list[CleanupFailure] = field(default_factory=list)
+
+    @property
+    def failed_resources(self) -> list[str]:
+        return [failure.resource for failure in self.failures]
+
+    def summary(self) -> str:
+        lines = [
+            f"Deleted organisations: {len(self.deleted_orgs)}",
+            f"Deleted projects: {len(self.deleted_projects)}",
+            f"Failures: {len(self.failures)}",
+        ]
+        lines.extend(f"  - {failure}" for failure in self.failures)
+        return "\n".join(lines)
+
+
+class OrgCleaner:
+    """
+    Deletes organisations together with their projects.
+
+    All projects of all organisations are deleted concurrently under a
+    shared semaphore; each organisation is deleted as soon as its own
+    projects are gone. Failures are collected per resource, and an
+    organisation whose projects could not be deleted is left in place.
+    """
+
+    def __init__(
+        self, api_helper: APIHelper, token: str, max_parallel: int = 8
+    ) -> None:
+        self._api_helper = api_helper
+        self._token = token
+        self._semaphore = asyncio.Semaphore(max_parallel)
+
+    async def cleanup(self, org_names: list[str]) -> CleanupResult:
+        result = CleanupResult()
+        await asyncio.gather(
+            *(self._cleanup_org(org_name, result) for org_name in org_names)
+        )
+        logger.info(f"Cleanup finished:\n{result.summary()}")
+        return result
+
+    async def _cleanup_org(self, org_name: str, result: CleanupResult) -> None:
+        org_resource = f"org:{org_name}"
+        try:
+            async with self._semaphore:
+                proj_data = await self._api_helper.get_projects(
+                    token=self._token, org_name=org_name
+                )
+            projects = [proj["name"] for proj in proj_data if "name" in proj]
+        except Exception as exc:
+            result.failures.append(CleanupFailure(org_resource, repr(exc)))
+            return
+
+        logger.info(f"Cleaning up {len(projects)} projects in {org_name}")
+        deleted = await asyncio.gather(
+            *(self._delete_project(org_name, proj, result) for proj in projects)
+        )
+        if not all(deleted):
+            result.failures.append(
+                CleanupFailure(org_resource, "skipped, not all projects were deleted")
+            )
+            return
+
+        try:
+            async with self._semaphore:
+                response = await self._api_helper.delete_org(
+                    token=self._token, org_name=org_name
+                )
+            self._check_response(response)
+        except Exception as exc:
+            result.failures.append(CleanupFailure(org_resource, repr(exc)))
+            return
+
+        result.deleted_orgs.append(org_name)
+        logger.info(f"Deleted organisation: {org_name}")
+
+    async def _delete_project(
+        self, org_name: str, proj_name: str, result: CleanupResult
+    ) -> bool:
+        proj_resource = f"project:{org_name}/{proj_name}"
+        try:
+            async with self._semaphore:
+                response = await self._api_helper.delete_proj(
+                    token=self._token, org_name=org_name, proj_name=proj_name
+                )
+            self._check_response(response)
+        except Exception as exc:
+            result.failures.append(CleanupFailure(proj_resource, repr(exc)))
+            return False
+
+        result.deleted_projects.append(f"{org_name}/{proj_name}")
+        logger.info(f"Deleted project: {proj_name}")
+        return True
+
+    @staticmethod
+    def _check_response(response: Any) -> None:
+        # 404 means the resource is already gone
+        status = getattr(response, "status", None)
+        if status is not None and status >= 400 and status != 404:
+            raise RuntimeError(f"Unexpected response status {status}")
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import tempfile
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Optional
+
+from tests.utils.api_helper import APIHelper
+from tests.utils.test_data_management.test_data import DataManager
+from tests.utils.test_data_management.users_manager import UserData
+from tests.utils.topology_builder import Topology, TopologyBuilder
+
+logger = logging.getLogger("[🔐PERMISSION_MATRIX]")
+
+ORG_GHERKIN_NAME = "Permission-matrix"
+DENIED_STATUSES = (401, 403)
+
+
+@dataclass(frozen=True)
+class CellContext:
+    api_helper: APIHelper
+    token: str
+    org_name: str
+    proj_name: str
+    target_username: str
+
+
+@dataclass(frozen=True)
+class MatrixAction:
+    """
+    One action a member tries; `run` returns the HTTP status of the attempt.
+    isolated: the action changes the project, so every cell gets its own one.
+    """
+
+    name: str
+    run: Callable[[CellContext], Awaitable[int]]
+    isolated: bool = False
+
+
+@dataclass(frozen=True)
+class PermissionMatrix:
+    """
+    Roles x actions table of expected outcomes (True = allowed):
+
+        PermissionMatrix(
+            roles=("reader", "writer", "manager", "admin"),
+            rows={
+                UPLOAD_FILE: (False, True, True, True),
+                invite_to_project("admin"): (False, False, False, True),
+            },
+        )
+    """
+
+    roles: tuple[str, ...]
+    rows: Mapping[MatrixAction, tuple[bool, ...]]
+
+    def __post_init__(self) -> None:
+        for action, expected in self.rows.items():
+            if len(expected) != len(self.roles):
+                raise ValueError(
+                    f"Action '{action.name}' has {len(expected)} outcomes "
+                    f"for {len(self.roles)} roles."
+                )
+
+    def cells(self) -> list[tuple[str, MatrixAction, bool]]:
+        return [
+            (role, action, allowed)
+            for action, expected in self.rows.items()
+            for role, allowed in zip(self.roles, expected)
+        ]
+
+
+@dataclass
+class CellResult:
+    role: str
+    action: str
+    expected: bool
+    observed: Optional[bool] = None
+    status: Optional[int] = None
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.observed == self.expected
+
+    def __str__(self) -> str:
+        expected = "allowed" if self.expected else "denied"
+        if self.observed is None:
+            got = self.error or f"unexpected status {self.status}"
+        else:
+            got = f"{'allowed' if self.observed else 'denied'} ({self.status})"
+        return f"{self.role} / {self.action}: expected {expected}, got {got}"
+
+
+@dataclass
+class MatrixReport:
+    roles: tuple[str, ...]
+    results: list[CellResult] = field(default_factory=list)
+
+    @property
+    def mismatches(self) -> list[CellResult]:
+        return [result for result in self.results if not result.ok]
+
+    def summary(self) -> str:
+        """Grid of observed outcomes; mismatching cells are marked with `!`."""
+        actions = list(dict.fromkeys(result.action for result in self.results))
+        cells = {(result.action, result.role): result for result in self.results}
+        width = max(len(action) for action in actions) if actions else 0
+        lines = [" " * width + " | " + " | ".join(self.roles)]
+        for action in actions:
+            marks = []
+            for role in self.roles:
+                result = cells[(action, role)]
+                mark = {True: "✓", False: "✗", None: "?"}[result.observed]
+                marks.append(f"{mark}{'' if result.ok else '!'}".ljust(len(role)))
+            lines.append(f"{action.ljust(width)} | " + " | ".join(marks))
+        lines.append(f"Mismatches: {len(self.mismatches)} of {len(self.results)}")
+        lines.extend(f"  - {result}" for result in self.mismatches)
+        return "\n".join(lines)
+
+
+class PermissionMatrixEngine:
+    """
+    Evaluates a PermissionMatrix with one org and two users.
+
+    The actor gets every role at once, each in its own project of a single
+    org, and `target` is the org member used by invite actions. The whole
+    topology is provisioned in one TopologyBuilder pass; isolated actions
+    get a separate project per role. All cells then run concurrently.
+    """
+
+    def __init__(
+        self,
+        api_helper: APIHelper,
+        data_manager: DataManager,
+        token: str,
+        actor: UserData,
+        target: UserData,
+        max_parallel: int = 8,
+    ) -> None:
+        self._api_helper = api_helper
+        self._data_manager = data_manager
+        self._token = token
+        self._actor = actor
+        self._target = target
+        self._semaphore = asyncio.Semaphore(max_parallel)
+
+    def topology(self, matrix: PermissionMatrix) -> Topology:
+        topology = Topology().org(
+            ORG_GHERKIN_NAME,
+            members={self._actor.username: "user", self._target.username: "user"},
+        )
+        # One shared project per role, one more per role for every isolated action
+        names = dict.fromkeys(
+            (self._project_gherkin_name(role, action), role)
+            for role, action, _ in matrix.cells()
+        )
+        for name, role in names:
+            topology.project(
+                ORG_GHERKIN_NAME, name, members={self._actor.username: role}
+            )
+        return topology
+
+    async def evaluate(self, matrix: PermissionMatrix) -> MatrixReport:
+        builder = TopologyBuilder(
+            api_helper=self._api_helper,
+            data_manager=self._data_manager,
+            token=self._token,
+        )
+        provisioned = await builder.provision(self.topology(matrix))
+        if provisioned.failures or provisioned.skipped:
+            raise RuntimeError(
+                f"Permission matrix setup failed:\n{provisioned.summary()}"
+            )
+        org = provisioned.orgs[ORG_GHERKIN_NAME]
+
+        async def _evaluate(
+            role: str, action: MatrixAction, allowed: bool
+        ) -> CellResult:
+            result = CellResult(role=role, action=action.name, expected=allowed)
+            proj = org.get_project_by_gherkin_name(
+                self._project_gherkin_name(role, action)
+            )
+            context = CellContext(
+                api_helper=self._api_helper,
+                token=self._actor.token,
+                org_name=org.org_name,
+                proj_name=proj.project_name,
+                target_username=self._target.username,
+            )
+            try:
+                async with self._semaphore:
+                    result.status = await action.run(context)
+            except Exception as exc:
+                result.error = repr(exc)
+                return result
+            if 200 <= result.status < 300:
+                result.observed = True
+            elif result.status in DENIED_STATUSES:
+                result.observed = False
+            return result
+
+        results = await asyncio.gather(*(_evaluate(*cell) for cell in matrix.cells()))
+        report = MatrixReport(roles=matrix.roles, results=list(results))
+        logger.info(f"Permission matrix:\n{report.summary()}")
+        return report
+
+    @staticmethod
+    def _project_gherkin_name(role: str, action: MatrixAction) -> str:
+        return f"{role} / {action.name}" if action.isolated else role
+
+
+async def _upload_file(context: CellContext) -> int:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "permission-matrix.txt")
+        with open(file_path, "w") as f:
+            f.write("permission matrix")
+        response = await context.api_helper.upload_file(
+            token=context.token,
+            organization=context.org_name,
+            project_name=context.proj_name,
+            file_path=file_path,
+        )
+    return int(response.status)
+
+
+async def _view_apps(context: CellContext) -> int:
+    status, _ = await context.api_helper.get_instances(
+        token=context.token, org_name=context.org_name, proj_name=context.proj_name
+    )
+    return int(status)
+
+
+def invite_to_project(role: str) -> MatrixAction:
+    async def _invite(context: CellContext) -> int:
+        status, _ = await context.api_helper.add_user_to_proj(
+            token=context.token,
+            org_name=context.org_name,
+            proj_name=context.proj_name,
+            username=context.target_username,
+            role=role,
+        )
+        return int(status)
+
+    return MatrixAction(name=f"invite {role}", run=_invite, isolated=True)
+
+
+UPLOAD_FILE = MatrixAction(name="upload file", run=_upload_file)
+VIEW_APPS = MatrixAction(name="view apps", run=_view_apps)
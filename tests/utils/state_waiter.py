@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+logger = logging.getLogger("[⏳STATE_WAITER]")
+
+# Fetch callback: receives the last seen ETag and returns (new_etag, items).
+# items maps a key (e.g. app id) to its raw item; None means "not modified".
+FetchStates = Callable[
+    [Optional[str]],
+    Awaitable[tuple[Optional[str], Optional[dict[str, dict[str, Any]]]]],
+]
+
+
+class PollBackoff:
+    """
+    Poll interval policy: a few fast polls first, then exponential growth
+    capped at max_interval. Every interval gets +/- jitter applied.
+    """
+
+    def __init__(
+        self,
+        initial: float = 1.0,
+        factor: float = 2.0,
+        max_interval: float = 10.0,
+        fast_polls: int = 3,
+        jitter: float = 0.2,
+    ) -> None:
+        self._initial = initial
+        self._factor = factor
+        self._max_interval = max_interval
+        self._fast_polls = fast_polls
+        self._jitter = jitter
+        self._attempt = 0
+
+    def reset(self) -> None:
+        self._attempt = 0
+
+    def next_interval(self) -> float:
+        growth = max(0, self._attempt - self._fast_polls + 1)
+        interval = min(self._initial * self._factor**growth, self._max_interval)
+        self._attempt += 1
+        spread = interval * self._jitter
+        return max(0.0, interval + random.uniform(-spread, spread))
+
+
+@dataclass
+class WaitResult:
+    key: str
+    state: str
+    item: dict[str, Any]
+    elapsed: float
+    polls: int
+    detection_lag: float
+
+    def __str__(self) -> str:
+        return (
+            f"'{self.key}' reached '{self.state}' after {self.elapsed:.1f}s "
+            f"({self.polls} polls, detection lag <= {self.detection_lag:.1f}s)"
+        )
+
+
+@dataclass
+class _Waiter:
+    key: str
+    states: frozenset[str]
+    fail_states: frozenset[str]
+    fail_if_missing: bool
+    future: asyncio.Future[WaitResult]
+    started: float = field(default_factory=time.monotonic)
+    polls: int = 0
+
+
+class StatePoller:
+    """
+    Single poll loop shared by any number of waiters.
+
+    Every tick fetches the states of all items at once and resolves each
+    waiter whose item reached a target (or failure) state. The loop only
+    runs while there is at least one pending waiter.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fetch: FetchStates,
+        backoff_factory: Callable[[], PollBackoff] = PollBackoff,
+    ) -> None:
+        self._name = name
+        self._fetch = fetch
+        self._backoff = backoff_factory()
+        self._waiters: list[_Waiter] = []
+        self._items: dict[str, dict[str, Any]] = {}
+        self._etag: Optional[str] = None
+        self._last_error: Optional[str] = None
+        self._last_interval = 0.0
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._requests = 0
+        self._not_modified = 0
+
+    @property
+    def requests(self) -> int:
+        return self._requests
+
+    @property
+    def not_modified(self) -> int:
+        return self._not_modified
+
+    async def wait_for(
+        self,
+        key: str,
+        states: Iterable[str],
+        fail_states: Iterable[str] = (),
+        timeout: float = 600,
+        fail_if_missing: bool = False,
+    ) -> WaitResult:
+        """
+        Wait until item `key` reaches one of `states`.
+        Raises AssertionError if it reaches one of `fail_states`
+        and TimeoutError if nothing happens within `timeout` seconds.
+        """
+        waiter = _Waiter(
+            key=key,
+            states=frozenset(s.lower() for s in states),
+            fail_states=frozenset(s.lower() for s in fail_states),
+            fail_if_missing=fail_if_missing,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._waiters.append(waiter)
+        self._backoff.reset()
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        try:
+            result = await asyncio.wait_for(waiter.future, timeout)
+        except TimeoutError:
+            last_state = self._items.get(key, {}).get("state")
+            raise TimeoutError(
+                f"⏳ Timed out after {timeout}s waiting for '{key}' to reach "
+                f"{sorted(waiter.states)} in {self._name}. "
+                f"Last state: {last_state}. Last error: {self._last_error}"
+            )
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+        logger.info(f"[{self._name}] {result}")
+        return result
+
+    async def _run(self) -> None:
+        while self._waiters:
+            self._wakeup.clear()
+            await self._poll()
+            if not self._waiters:
+                break
+            self._last_interval = self._backoff.next_interval()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._last_interval)
+            except TimeoutError:
+                pass
+        logger.info(
+            f"[{self._name}] Poller idle: {self._requests} requests, "
+            f"{self._not_modified} not modified"
+        )
+
+    async def _poll(self) -> None:
+        self._requests += 1
+        try:
+            etag, items = await self._fetch(self._etag)
+        except Exception as exc:
+            self._last_error = repr(exc)
+            logger.warning(f"[{self._name}] Poll failed: {exc}")
+            return
+
+        self._last_error = None
+        self._etag = etag
+        if items is None:
+            self._not_modified += 1
+        else:
+            if self._states(items) != self._states(self._items):
+                # Something moved: poll fast again to catch follow-up changes
+                self._backoff.reset()
+            self._items = items
+
+        for waiter in list(self._waiters):
+            waiter.polls += 1
+            self._resolve(waiter)
+
+    def _resolve(self, waiter: _Waiter) -> None:
+        if waiter.future.done():
+            return
+
+        item = self._items.get(waiter.key)
+        if item is None:
+            if waiter.fail_if_missing:
+                waiter.future.set_exception(
+                    ValueError(f"No item with id '{waiter.key}' found in API response")
+                )
+            return
+
+        state = str(item.get("state", "")).lower()
+        if state in waiter.fail_states:
+            waiter.future.set_exception(
+                AssertionError(f"'{waiter.key}' entered {state} state: {item}")
+            )
+        elif state in waiter.states:
+            waiter.future.set_result(
+                WaitResult(
+                    key=waiter.key,
+                    state=state,
+                    item=item,
+                    elapsed=time.monotonic() - waiter.started,
+                    polls=waiter.polls,
+                    detection_lag=self._last_interval,
+                )
+            )
+
+    @staticmethod
+    def _states(items: dict[str, dict[str, Any]]) -> dict[str, Any]:
+        return {key: item.get("state") for key, item in items.items()}
@@ -102,6 +102,13 @@ class ConfigManager:
             organization=organization, project=project_name, file_name=file_name
         )
 
+    def get_file_download_url(
+        self, organization: str, project_name: str, file_name: str
+    ) -> str:
+        return str(self._endpoints.file_download).format(
+            organization=organization, project=project_name, file_name=file_name
+        )
+
     def get_orgs_url(self) -> str:
         return str(self._endpoints.get_orgs)
 
@@ -125,6 +132,11 @@ class ConfigManager:
     def get_add_proj_url(self, org_name: str) -> str:
         return str(self._endpoints.add_proj).format(org_name=org_name)
 
+    def get_add_user_to_proj_url(self, org_name: str, proj_name: str) -> str:
+        return str(self._endpoints.add_user_to_proj).format(
+            org_name=org_name, proj_name=proj_name
+        )
+
     def get_app_output_url(self, org_name: str, proj_name: str, app_id: str) -> str:
         return str(self._endpoints.app_output).format(
             org_name=org_name, proj_name=proj_name, app_id=app_id
@@ -1,66 +1,39 @@
 from __future__ import annotations
 
-import json
-from pathlib import Path
 from typing import Optional, Any
 
-import aiofiles
-from jsonschema import Draft7Validator, ValidationError
+from tests.utils.test_data_management.schema_registry import (
+    CompiledSchema,
+    format_errors,
+    schema_registry,
+)
 
 
 class AppData:
     def __init__(self, schemas_path: str) -> None:
         self._output_schemas_path: str = schemas_path
-        self._saved_schema: Optional[dict[str, Any]] = None
+        self._saved_schema: Optional[CompiledSchema] = None
 
     async def load_output_ui_schema(self, app_name: str) -> None:
-        schema_path = Path(
-            f"{self._output_schemas_path}/{app_name}_output_ui_schema.json"
-        )
-
-        if not schema_path.exists():
-            raise ValueError(f"Schema file not found: {schema_path}")
-
-        async with aiofiles.open(schema_path, mode="r") as f:
-            content = await f.read()
-            self._saved_schema = json.loads(content)
+        self._load_schema(f"{app_name}_output_ui_schema.json")
 
     async def load_output_api_schema(self, app_name: str) -> None:
-        schema_path = Path(
-            f"{self._output_schemas_path}/{app_name}_output_api_schema.json"
-        )
-
-        if not schema_path.exists():
-            raise ValueError(f"Schema file not found: {schema_path}")
-
-        async with aiofiles.open(schema_path, mode="r") as f:
-            content = await f.read()
-            self._saved_schema = json.loads(content)
+        self._load_schema(f"{app_name}_output_api_schema.json")
 
     async def load_app_config_schema(self, app_name: str) -> None:
-        schema_path = Path(
-            f"{self._output_schemas_path}/{app_name}_config_file_schema.json"
-        )
-
-        if not schema_path.exists():
-            raise ValueError(f"Schema file not found: {schema_path}")
-
-        async with aiofiles.open(schema_path, mode="r") as f:
-            content = await f.read()
-            self._saved_schema = json.loads(content)
+        self._load_schema(f"{app_name}_config_file_schema.json")
 
     async def get_app_import_config_file_path(self, app_name: str) -> str:
         return f"{self._output_schemas_path}/{app_name}_import_config_file.yaml"
 
     async def load_compl_schema(self, app_name: str) -> None:
-        schema_path = Path(f"{self._output_schemas_path}/{app_name}_compl_schema.json")
+        self._load_schema(f"{app_name}_compl_schema.json")
 
-        if not schema_path.exists():
-            raise ValueError(f"Schema file not found: {schema_path}")
-
-        async with aiofiles.open(schema_path, mode="r") as f:
-            content = await f.read()
-            self._saved_schema = json.loads(content)
+    def _load_schema(self, file_name: str) -> None:
+        # Parsed and compiled once per process by the registry
+        self._saved_schema = schema_registry.get(
+            f"{self._output_schemas_path}/{file_name}"
+        )
 
     def validate_api_section_schema(
         self, outputs: list[dict[str, Any]]
@@ -68,11 +41,11 @@ class AppData:
         """
         Validate a list of output dicts against the loaded schema.
         Returns (True, "") if all are valid, else (False, summary of errors).
+        Every error of every item is reported, not only the first one.
         """
         if not self._saved_schema:
             raise ValueError("No schema loaded. Call load_output_schema first.")
 
-        validator = Draft7Validator(self._saved_schema)
         errors_summary: list[str] = []
 
         for idx, section in enumerate(outputs):
@@ -82,11 +55,10 @@ class AppData:
                 )
                 continue
 
-            try:
-                validator.validate(section)
-            except ValidationError as e:
-                title = section.get("title", f"<unknown at {idx}>")
-                errors_summary.append(f"{title} validation error: {e.message}")
+            title = section.get("title", f"<unknown at {idx}>")
+            errors_summary.extend(
+                format_errors(self._saved_schema.iter_errors(section), title)
+            )
 
         if errors_summary:
             return False, ";\n ".join(errors_summary)
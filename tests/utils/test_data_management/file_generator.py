@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import random
+import shutil
+import string
+import uuid
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Literal, Optional
+
+from lorem.data import WORDS  # type: ignore
+
+from tests.utils.file_transfer import StreamDigest
+
+logger = logging.getLogger("[🔧DATA MANAGER]")
+
+FileKind = Literal["bin", "txt", "sparse"]
+
+BLOCK_SIZE = 4 * 1024 * 1024
+# Sparse files get a seeded island of data every stride, holes in between
+SPARSE_STRIDE = 64 * 1024 * 1024
+SPARSE_ISLAND = 64 * 1024
+CACHE_DIR_NAME = ".cache"
+
+_EXTENSIONS: dict[str, str] = {"bin": "bin", "txt": "txt", "sparse": "bin"}
+
+# (size, md5, sha256)
+_Digest = tuple[int, str, str]
+
+
+@dataclass(frozen=True)
+class GeneratedFile:
+    path: str
+    name: str
+    size: int
+    md5: str
+    sha256: str
+
+
+class FileGenerator:
+    """
+    Deterministic test files with digests computed while they are written.
+
+    Content depends only on (kind, size, seed):
+    - bin: seeded PRNG bytes, streamed block by block;
+    - txt: lorem ipsum paragraphs from a seeded pool, exactly `size` bytes;
+    - sparse: a hole of `size` bytes with a seeded island every
+      SPARSE_STRIDE, written through mmap, so multi-GB files cost little disk.
+
+    Without a seed, the seed is derived from the file's random name, so
+    every file has its own content; it is written directly and not cached.
+    With an explicit seed, the content is generated once into
+    `<root>/.cache` and every call gets a hard link to it under a fresh
+    random name, so cached files are shared by tests and xdist workers and
+    must not be modified in place. Cache entries are written atomically
+    (temp file + os.replace).
+    """
+
+    def __init__(self, root: str) -> None:
+        self._root = root
+        self._cache_dir = os.path.join(root, CACHE_DIR_NAME)
+
+    def generate(
+        self, kind: FileKind, size: int, seed: Optional[int] = None
+    ) -> GeneratedFile:
+        extension = _EXTENSIONS[kind]
+        rand_part = "".join(random.choices(string.ascii_letters + string.digits, k=8))
+        name = f"regression-{kind}-file-{rand_part}.{extension}"
+        path = os.path.join(self._root, name)
+
+        if seed is None:
+            os.makedirs(self._root, exist_ok=True)
+            size, md5, sha256 = self._write(kind, size, zlib.crc32(name.encode()), path)
+            return GeneratedFile(
+                path=path, name=name, size=size, md5=md5, sha256=sha256
+            )
+
+        os.makedirs(self._cache_dir, exist_ok=True)
+        content_path = os.path.join(
+            self._cache_dir, f"{kind}-{size}-{seed}.{extension}"
+        )
+        digest = self._load_digest(content_path) or self._build(
+            kind, size, seed, content_path
+        )
+        size, md5, sha256 = digest
+        try:
+            os.link(content_path, path)
+        except OSError:
+            shutil.copyfile(content_path, path)
+        return GeneratedFile(path=path, name=name, size=size, md5=md5, sha256=sha256)
+
+    def _load_digest(self, content_path: str) -> Optional[_Digest]:
+        try:
+            with open(f"{content_path}.json") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not os.path.exists(content_path):
+            return None
+        return int(meta["size"]), str(meta["md5"]), str(meta["sha256"])
+
+    def _build(
+        self, kind: FileKind, size: int, seed: int, content_path: str
+    ) -> _Digest:
+        tmp_path = f"{content_path}.{uuid.uuid4().hex}.tmp"
+        size, md5, sha256 = self._write(kind, size, seed, tmp_path)
+
+        meta_tmp_path = f"{tmp_path}.json"
+        with open(meta_tmp_path, "w") as f:
+            json.dump({"size": size, "md5": md5, "sha256": sha256}, f)
+        os.replace(tmp_path, content_path)
+        os.replace(meta_tmp_path, f"{content_path}.json")
+        logger.info(f"Generated {kind} file content {content_path}")
+        return size, md5, sha256
+
+    def _write(self, kind: FileKind, size: int, seed: int, path: str) -> _Digest:
+        rng = random.Random(seed)
+        stream = StreamDigest()
+        if kind == "sparse":
+            self._write_sparse(path, size, rng, stream)
+        else:
+            blocks = (
+                _random_blocks(rng, size) if kind == "bin" else _text_blocks(rng, size)
+            )
+            with open(path, "wb") as f:
+                for block in blocks:
+                    f.write(block)
+                    stream.update(block)
+        return stream.size, stream.md5, stream.sha256
+
+    @staticmethod
+    def _write_sparse(
+        path: str, size: int, rng: random.Random, stream: StreamDigest
+    ) -> None:
+        zeros = memoryview(bytes(BLOCK_SIZE))
+        with open(path, "wb+") as f:
+            f.truncate(size)
+            if not size:
+                return
+            with mmap.mmap(f.fileno(), size) as mm:
+                for offset in range(0, size, SPARSE_STRIDE):
+                    island = rng.randbytes(min(SPARSE_ISLAND, size - offset))
+                    mm[offset : offset + len(island)] = island
+                    stream.update(island)
+                    # The hole is hashed from memory, never read from disk
+                    gap = min(SPARSE_STRIDE, size - offset) - len(island)
+                    while gap > 0:
+                        stream.update(zeros[: min(gap, BLOCK_SIZE)])
+                        gap -= BLOCK_SIZE
+
+
+def _random_blocks(rng: random.Random, size: int) -> Iterator[bytes]:
+    for offset in range(0, size, BLOCK_SIZE):
+        yield rng.randbytes(min(BLOCK_SIZE, size - offset))
+
+
+def _text_blocks(rng: random.Random, size: int) -> Iterator[bytes]:
+    # ASCII only, so the byte size of every block is exact
+    pool = [_paragraph(rng).encode("ascii") for _ in range(64)]
+    for offset in range(0, size, BLOCK_SIZE):
+        length = min(BLOCK_SIZE, size - offset)
+        block = bytearray()
+        while len(block) < length:
+            block += rng.choice(pool)
+        yield bytes(block[:length])
+
+
+def _paragraph(rng: random.Random) -> str:
+    sentences = []
+    for _ in range(rng.randint(5, 10)):
+        sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 8)))
+        sentences.append(sentence.capitalize() + ".")
+    return " ".join(sentences) + "\n"
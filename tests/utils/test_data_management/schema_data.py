@@ -1,10 +1,73 @@
+import asyncio
+import glob
 import json
-from pathlib import Path
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Optional, Any
 
-import aiofiles
-from jsonschema.exceptions import ValidationError
-from jsonschema.validators import validate
+from tests.utils.test_data_management.schema_drift import (
+    FingerprintEntry,
+    FingerprintStore,
+    SchemaDiff,
+    diff_schemas,
+    fingerprint,
+    template_structure,
+)
+from tests.utils.test_data_management.schema_registry import (
+    CompiledSchema,
+    format_errors,
+    schema_registry,
+)
+
+PASSED = "passed"
+DRIFTED = "drifted"
+MISSING = "missing"
+
+
+@dataclass
+class TemplateResult:
+    name: str
+    status: str
+    # Report lines, e.g. the diff summary of a drifted template
+    errors: list[str] = field(default_factory=list)
+    # Saved snapshot vs live template; None when they are identical or the
+    # result was reused from the fingerprint store
+    diff: Optional[SchemaDiff] = None
+    # Same snapshot and live template as in the last run, result reused
+    unchanged: bool = False
+
+
+@dataclass
+class CatalogReport:
+    results: list[TemplateResult] = field(default_factory=list)
+    # Live templates without a saved snapshot
+    unknown_templates: list[str] = field(default_factory=list)
+
+    @property
+    def failures(self) -> list[TemplateResult]:
+        return [result for result in self.results if result.status != PASSED]
+
+    def summary(self) -> str:
+        width = max((len(result.name) for result in self.results), default=0)
+        lines = [
+            f"{result.name.ljust(width)} | {result.status}"
+            + (" [unchanged]" if result.unchanged else "")
+            for result in self.results
+        ]
+        unchanged = sum(result.unchanged for result in self.results)
+        lines.append(
+            f"Passed: {len(self.results) - len(self.failures)} of {len(self.results)}"
+            f" ({unchanged} unchanged since last run)"
+        )
+        if self.unknown_templates:
+            lines.append(
+                f"Live templates without saved snapshot: "
+                f"{', '.join(self.unknown_templates)}"
+            )
+        for result in self.failures:
+            lines.extend(result.errors)
+        return "\n".join(lines)
 
 
 class SchemaData:
@@ -12,16 +75,21 @@ class SchemaData:
     Manages expected and actual schemas, performs comparison, and tracks errors.
     """
 
-    def __init__(self, schemas_path: str) -> None:
+    def __init__(
+        self, schemas_path: str, fingerprints: Optional[FingerprintStore] = None
+    ) -> None:
         self._saved_schemas_path: str = schemas_path
-        self._saved_schema: Optional[dict[str, Any]] = None
+        self._fingerprints = fingerprints
+        self._saved_schema: Optional[CompiledSchema] = None
         self._live_schema: Optional[dict[str, Any]] = None
+        self._live_templates: dict[str, dict[str, Any]] = {}
+        self._indexed_from: Optional[list[dict[str, Any]]] = None
         self._error: bool = False
         self._error_message: Optional[str] = None
 
     @property
     def saved_schema(self) -> Optional[dict[str, Any]]:
-        return self._saved_schema
+        return self._saved_schema.schema if self._saved_schema else None
 
     @property
     def live_schema(self) -> Optional[dict[str, Any]]:
@@ -37,28 +105,35 @@ class SchemaData:
 
     async def load_saved_schema(self, app_name: str) -> None:
         """
-        Asynchronously loads a saved JSON schema for a given app name from disk.
+        Loads a saved JSON schema for a given app name; the file is parsed
+        and compiled once per process by the schema registry.
         """
-        schema_path = Path(f"{self._saved_schemas_path}/{app_name}.json")
-
-        if not schema_path.exists():
-            raise ValueError(f"Schema file not found: {schema_path}")
+        self._saved_schema = schema_registry.get(
+            f"{self._saved_schemas_path}/{app_name}.json"
+        )
 
-        async with aiofiles.open(schema_path, mode="r") as f:
-            content = await f.read()
-            self._saved_schema = json.loads(content)
+    def index_live_templates(
+        self, full_schema: list[dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        """Index the templates response by app name; the same list is indexed once."""
+        if full_schema is self._indexed_from:
+            return self._live_templates
 
-    def parse_live_schema(
-        self, full_schema: list[dict[str, Any]], app_name: str
-    ) -> None:
         if not isinstance(full_schema, list) or not all(
             isinstance(item, dict) for item in full_schema
         ):
             raise ValueError("Invalid schema format: expected a list of dictionaries")
 
-        match = next(
-            (item for item in full_schema if item.get("name") == app_name), None
-        )
+        self._live_templates = {
+            item["name"]: item for item in full_schema if "name" in item
+        }
+        self._indexed_from = full_schema
+        return self._live_templates
+
+    def parse_live_schema(
+        self, full_schema: list[dict[str, Any]], app_name: str
+    ) -> None:
+        match = self.index_live_templates(full_schema).get(app_name)
 
         if not match:
             raise ValueError(f"App with name '{app_name}' not found in response")
@@ -76,12 +151,98 @@ class SchemaData:
             self._error_message = "Live components is not set."
             return False
 
-        try:
-            validate(instance=self._live_schema, schema=self._saved_schema)
-            self._error = False
-            self._error_message = None
-            return True
-        except ValidationError as ve:
+        name = str(self._live_schema.get("name", ""))
+        drift = diff_schemas(self._saved_schema.schema, self._live_schema, name)
+        if self._saved_schema.validator is None:
+            self._error = True
+            self._error_message = (
+                f"Saved schema is not a valid JSON schema: "
+                f"{self._saved_schema.schema_error}\n{drift.summary()}"
+            )
+            return False
+
+        errors = self._saved_schema.iter_errors(self._live_schema)
+        if errors:
             self._error = True
-            self._error_message = f"Schema validation failed: {ve.message}"
+            self._error_message = (
+                "Schema validation failed: "
+                + ";\n ".join(format_errors(errors, name))
+                + f"\n{drift.summary()}"
+            )
             return False
+        self._error = False
+        self._error_message = None
+        return True
+
+    async def compare_catalog(
+        self, full_schema: list[dict[str, Any]], max_workers: int = 8
+    ) -> CatalogReport:
+        """
+        Compare the type structure of the input and output schemas of every
+        saved template snapshot with its live template; release metadata
+        and schema titles and descriptions are ignored. A template passes when both
+        fingerprints are equal; otherwise the structural diff is reported. Snapshots are compared in a thread
+        pool, off the event loop. With a fingerprint store, a template whose
+        snapshot and live template are the same as in the last run keeps
+        its result without being diffed again.
+        """
+        templates = self.index_live_templates(full_schema)
+        paths = sorted(glob.glob(os.path.join(self._saved_schemas_path, "*.json")))
+        names = [os.path.splitext(os.path.basename(path))[0] for path in paths]
+
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="template-snapshot"
+        ) as executor:
+            results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        executor,
+                        _compare_template,
+                        name,
+                        path,
+                        templates.get(name),
+                        self._fingerprints,
+                    )
+                    for name, path in zip(names, paths)
+                )
+            )
+        return CatalogReport(
+            results=list(results),
+            unknown_templates=sorted(set(templates) - set(names)),
+        )
+
+
+def _compare_template(
+    name: str,
+    snapshot_path: str,
+    live: Optional[dict[str, Any]],
+    fingerprints: Optional[FingerprintStore],
+) -> TemplateResult:
+    if live is None:
+        return TemplateResult(
+            name, MISSING, [f"{name}: app not found in templates response"]
+        )
+
+    with open(snapshot_path) as f:
+        saved = template_structure(json.load(f))
+    live = template_structure(live)
+    saved_fp, live_fp = fingerprint(saved), fingerprint(live)
+    if fingerprints is not None:
+        previous = fingerprints.lookup(name, saved_fp, live_fp)
+        if previous is not None:
+            return TemplateResult(
+                name, previous.status, list(previous.errors), unchanged=True
+            )
+
+    if saved_fp == live_fp:
+        result = TemplateResult(name, PASSED)
+    else:
+        diff = diff_schemas(saved, live, name)
+        result = TemplateResult(name, DRIFTED, diff.summary().splitlines(), diff)
+
+    if fingerprints is not None:
+        fingerprints.record(
+            name, FingerprintEntry(saved_fp, live_fp, result.status, result.errors)
+        )
+    return result
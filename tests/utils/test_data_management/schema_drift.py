@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+logger = logging.getLogger("[🔧SCHEMA_DRIFT]")
+
+# Paths listed per category in a diff summary
+SUMMARY_LIMIT = 20
+
+# App template fields checked for drift. The others (pub_date, version,
+# descriptions, logo, links) change with every release of an app.
+TEMPLATE_STRUCTURE_KEYS = ("input", "output")
+
+# Schema keywords that only describe a field to a reader
+ANNOTATION_KEYWORDS = frozenset(
+    {"title", "description", "examples", "x-title", "x-description"}
+)
+
+# Keywords whose keys are property or definition names, not keywords
+_NAMED_SUBSCHEMAS = frozenset({"properties", "patternProperties", "$defs"})
+
+
+def canonicalize(value: Any) -> Any:
+    """
+    Normalize a JSON document so equal structures serialize identically:
+    keys sorted, integral floats as ints, `type` lists sorted with a
+    single-item list collapsed to its item.
+    """
+    if isinstance(value, dict):
+        result = {}
+        for key in sorted(value):
+            item = canonicalize(value[key])
+            if key == "type" and isinstance(item, list):
+                item = sorted(item, key=str)
+                if len(item) == 1:
+                    item = item[0]
+            result[key] = item
+        return result
+    if isinstance(value, (list, tuple)):
+        return [canonicalize(item) for item in value]
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def strip_annotations(schema: Any) -> Any:
+    """
+    Drop annotation keywords from a JSON schema, keeping its type
+    structure: properties, types, references, constraints and defaults.
+    """
+    if isinstance(schema, list):
+        return [strip_annotations(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    result = {}
+    for key, value in schema.items():
+        if key in ANNOTATION_KEYWORDS:
+            continue
+        if key in _NAMED_SUBSCHEMAS and isinstance(value, dict):
+            result[key] = {name: strip_annotations(sub) for name, sub in value.items()}
+        else:
+            result[key] = strip_annotations(value)
+    return result
+
+
+def template_structure(template: dict[str, Any]) -> dict[str, Any]:
+    """
+    The part of an app template checked for drift: the type structure of
+    its input and output schemas.
+    """
+    return {
+        key: strip_annotations(template.get(key)) for key in TEMPLATE_STRUCTURE_KEYS
+    }
+
+
+def fingerprint(value: Any) -> str:
+    canonical = json.dumps(
+        canonicalize(value), sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@dataclass
+class SchemaDiff:
+    name: str
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    changed: list[tuple[str, Any, Any]] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    def summary(self, limit: int = SUMMARY_LIMIT) -> str:
+        if self.is_empty:
+            return f"{self.name}: no drift"
+        lines = [
+            f"{self.name}: {len(self.added)} added, {len(self.removed)} removed, "
+            f"{len(self.changed)} changed"
+        ]
+        lines.extend(f"  + {path}" for path in self.added[:limit])
+        lines.extend(f"  - {path}" for path in self.removed[:limit])
+        lines.extend(
+            f"  ~ {path}: {old!r} -> {new!r}" for path, old, new in self.changed[:limit]
+        )
+        hidden = sum(
+            max(len(paths) - limit, 0)
+            for paths in (self.added, self.removed, self.changed)
+        )
+        if hidden:
+            lines.append(f"  ... {hidden} more")
+        return "\n".join(lines)
+
+
+def diff_schemas(saved: Any, live: Any, name: str = "") -> SchemaDiff:
+    """
+    Structural diff of a saved document against its live counterpart.
+    A subtree present on one side only is reported once, at its root path.
+    """
+    diff = SchemaDiff(name=name)
+    _diff(canonicalize(saved), canonicalize(live), "$", diff)
+    return diff
+
+
+def _diff(saved: Any, live: Any, path: str, diff: SchemaDiff) -> None:
+    if isinstance(saved, dict) and isinstance(live, dict):
+        for key in sorted(saved.keys() | live.keys()):
+            if key not in live:
+                diff.removed.append(f"{path}.{key}")
+            elif key not in saved:
+                diff.added.append(f"{path}.{key}")
+            else:
+                _diff(saved[key], live[key], f"{path}.{key}", diff)
+    elif isinstance(saved, list) and isinstance(live, list):
+        for idx in range(max(len(saved), len(live))):
+            if idx >= len(live):
+                diff.removed.append(f"{path}[{idx}]")
+            elif idx >= len(saved):
+                diff.added.append(f"{path}[{idx}]")
+            else:
+                _diff(saved[idx], live[idx], f"{path}[{idx}]", diff)
+    elif saved != live:
+        diff.changed.append((path, saved, live))
+
+
+@dataclass
+class FingerprintEntry:
+    saved: str
+    live: str
+    status: str
+    errors: list[str] = field(default_factory=list)
+
+
+class FingerprintStore:
+    """
+    Fingerprints of saved and live templates from the last run, with the
+    comparison result they produced, persisted as JSON.
+
+    A template whose both fingerprints match the stored ones is not
+    compared again; its previous result is reused.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._entries: dict[str, FingerprintEntry] = self._read()
+        self._recorded: dict[str, FingerprintEntry] = {}
+        self._lock = threading.Lock()
+
+    def lookup(
+        self, name: str, saved_fp: str, live_fp: str
+    ) -> Optional[FingerprintEntry]:
+        with self._lock:
+            entry = self._recorded.get(name) or self._entries.get(name)
+        if entry is None or (entry.saved, entry.live) != (saved_fp, live_fp):
+            return None
+        return entry
+
+    def record(self, name: str, entry: FingerprintEntry) -> None:
+        with self._lock:
+            self._recorded[name] = entry
+
+    def save(self) -> None:
+        """Write recorded entries over the ones on disk (last writer wins)."""
+        with self._lock:
+            if not self._recorded:
+                return
+            entries = {**self._read(), **self._recorded}
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            tmp_path = f"{self._path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {name: vars(entry) for name, entry in sorted(entries.items())},
+                    f,
+                    indent=2,
+                )
+            os.replace(tmp_path, self._path)
+            self._entries = entries
+            logger.info(f"Saved {len(self._recorded)} fingerprints to {self._path}")
+
+    def _read(self) -> dict[str, FingerprintEntry]:
+        try:
+            with open(self._path) as f:
+                data = json.load(f)
+            return {name: FingerprintEntry(**item) for name, item in data.items()}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable fingerprint store {self._path}: {e}")
+            return {}
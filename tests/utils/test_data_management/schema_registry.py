@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import glob
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import SchemaError, ValidationError
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+
+logger = logging.getLogger("[🔧SCHEMA_REGISTRY]")
+
+
+@dataclass(frozen=True)
+class CompiledSchema:
+    """
+    A parsed schema file checked against its metaschema once.
+    `validator` is None when the schema itself is invalid; `schema_error`
+    then says why.
+    """
+
+    path: str
+    mtime_ns: int
+    schema: dict[str, Any]
+    validator: Optional[Validator]
+    schema_error: str = ""
+
+    def iter_errors(self, instance: Any) -> list[ValidationError]:
+        if self.validator is None:
+            raise SchemaError(f"{self.path} is not a valid schema: {self.schema_error}")
+        return sorted(
+            self.validator.iter_errors(instance), key=lambda error: error.json_path
+        )
+
+
+@dataclass
+class RegistryStats:
+    loaded: int = 0
+    invalid: int = 0
+    hits: int = 0
+    reloads: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"{self.loaded} schemas loaded ({self.invalid} invalid), "
+            f"{self.hits} cache hits, {self.reloads} reloaded after a change"
+        )
+
+
+class SchemaRegistry:
+    """
+    Process-wide cache of parsed JSON schemas and their compiled validators.
+
+    Entries are keyed by (path, mtime), so an edited schema file is picked
+    up on the next lookup. The validator class follows `$schema` and
+    defaults to Draft 7.
+    """
+
+    def __init__(self) -> None:
+        self.stats = RegistryStats()
+        self._entries: dict[str, CompiledSchema] = {}
+        self._lock = threading.Lock()
+
+    def preload(self, directory: str, pattern: str = "*.json") -> list[CompiledSchema]:
+        entries = [
+            self.get(path)
+            for path in sorted(glob.glob(os.path.join(directory, pattern)))
+        ]
+        logger.info(f"Preloaded {len(entries)} schemas from {directory}")
+        return entries
+
+    def get(self, path: str) -> CompiledSchema:
+        path = os.path.abspath(path)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            raise ValueError(f"Schema file not found: {path}") from None
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.mtime_ns == mtime_ns:
+                self.stats.hits += 1
+                return entry
+            if entry is not None:
+                self.stats.reloads += 1
+            entry = self._compile(path, mtime_ns)
+            self._entries[path] = entry
+            return entry
+
+    def _compile(self, path: str, mtime_ns: int) -> CompiledSchema:
+        with open(path) as f:
+            schema = json.load(f)
+        self.stats.loaded += 1
+        cls = validator_for(schema, default=Draft7Validator)
+        try:
+            cls.check_schema(schema)
+        except SchemaError as exc:
+            self.stats.invalid += 1
+            logger.warning(f"Invalid schema {path}: {exc.message}")
+            return CompiledSchema(path, mtime_ns, schema, None, exc.message)
+        return CompiledSchema(path, mtime_ns, schema, cls(schema))
+
+
+def format_errors(errors: list[ValidationError], title: str) -> list[str]:
+    return [
+        f"{title} validation error"
+        + (f" at {error.json_path}" if error.path else "")
+        + f": {error.message}"
+        for error in errors
+    ]
+
+
+schema_registry = SchemaRegistry()
@@ -1,14 +1,16 @@
-import hashlib
 import logging
-import os
 import random
 import string
 from typing import Optional
 
-import lorem  # type: ignore
-
+from tests.utils.file_hasher import file_hasher
 from tests.utils.test_data_management.app_data import AppData
 from tests.utils.test_data_management.disk_data import DiskData
+from tests.utils.test_data_management.file_generator import (
+    FileGenerator,
+    FileKind,
+    GeneratedFile,
+)
 from tests.utils.test_data_management.organization_data import OrganizationData
 from tests.utils.test_data_management.job_data import JobData
 
@@ -25,6 +27,7 @@ class DataManager:
         self._organizations: dict[str, OrganizationData] = {}
         self._disks: dict[str, DiskData] = {}
         self._default_organization: Optional[OrganizationData] = None
+        self._file_generator = FileGenerator(gen_obj_path)
 
     def __repr__(self) -> str:
         return f"DataManager(organizations={list(self._organizations.keys())})"
@@ -96,58 +99,50 @@ class DataManager:
             gherkin_name
         )
 
+    def generate_file(
+        self, kind: FileKind, size_bytes: int, seed: Optional[int] = None
+    ) -> GeneratedFile:
+        """
+        Generate a file and remember its expected digests. Files generated
+        with the same seed share cached content; without one every file
+        gets its own.
+        """
+        generated = self._file_generator.generate(kind, size_bytes, seed)
+        file_hasher.remember(generated.path, generated.md5, "md5")
+        file_hasher.remember(generated.path, generated.sha256, "sha256")
+        logger.info(f"Generated dummy {kind} file: {generated.path}")
+        return generated
+
     def generate_dummy_bin_file(self, size_mb: int = 1) -> tuple[str, str]:
-        """Generate a dummy binary file with random content and random name.
+        """Generate a dummy binary file with unique content and random name.
 
         Args:
             size_mb (int): File size in megabytes (default is 1).
 
         Returns:
-            str: Absolute path to the generated file.
+            tuple[str, str]: Absolute path to the generated file and its name.
         """
-        size_bytes = size_mb * 1024 * 1024
-        rand_part = "".join(random.choices(string.ascii_letters + string.digits, k=8))
-        filename = f"regression-bin-file-{rand_part}.bin"
-        full_path = os.path.join(self._gen_obj_path, filename)
-        with open(full_path, "wb") as f:
-            f.write(os.urandom(size_bytes))
-        logger.info(f"Generated dummy bin file: {full_path}")
-        return full_path, filename
+        generated = self.generate_file("bin", size_mb * 1024 * 1024)
+        return generated.path, generated.name
 
     def generate_dummy_txt_file(self, size_mb: int = 1) -> tuple[str, str]:
-        """Generate a dummy text file with random lorem ipsum content and random name.
+        """Generate a dummy text file with lorem ipsum content and random name.
 
         Args:
             size_mb (int): File size in megabytes (default is 1).
 
         Returns:
-            str: Absolute path to the generated file.
+            tuple[str, str]: Absolute path to the generated file and its name.
         """
-        size_bytes = size_mb * 1024 * 1024
-        rand_part = "".join(random.choices(string.ascii_letters + string.digits, k=8))
-        filename = f"regression-txt-file-{rand_part}.txt"
-        full_path = os.path.join(self._gen_obj_path, filename)
-
-        with open(full_path, "w", encoding="utf-8") as f:
-            written = 0
-            while written < size_bytes:
-                paragraph = lorem.paragraph() + "\n"
-                encoded = paragraph.encode("utf-8")
-                to_write = min(len(encoded), size_bytes - written)
-                f.write(paragraph[:to_write])
-                written += to_write
-        logger.info(f"Generated dummy text file: {full_path}")
-        return full_path, filename
+        generated = self.generate_file("txt", size_mb * 1024 * 1024)
+        return generated.path, generated.name
 
     def compare_files_md5(self, file_path_1: str, file_path_2: str) -> bool:
-        def file_md5(path: str) -> str:
-            hash_md5 = hashlib.md5()
-            with open(path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
-
-        return file_md5(file_path_1) == file_md5(file_path_2)
+        return file_hasher.same_content(file_path_1, file_path_2)
+
+    async def compare_files_md5_async(self, file_path_1: str, file_path_2: str) -> bool:
+        """Same as compare_files_md5, hashing in a thread pool."""
+        return await file_hasher.same_content_async(file_path_1, file_path_2)
 
     def add_disk(
         self,
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import fcntl
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, Optional
+
+from tests.utils.test_data_management.users_manager import UserData
+
+logger = logging.getLogger("[👥USER_POOL]")
+
+# Same id in all xdist workers of one run; fallback for non-xdist runs
+_RUN_ID = os.getenv("PYTEST_XDIST_TESTRUNUID") or uuid.uuid4().hex
+
+
+class UserPool:
+    """
+    On-disk pool of already signed up test users shared by xdist workers.
+
+    The pool file is guarded by an exclusive file lock. A user is leased to
+    one worker at a time. A lease is released when the worker's process is
+    gone (checked by pid for leases made on this host) or, for leases made
+    on another host, once it is older than `lease_ttl` seconds, so users
+    are reused across runs but never taken from a session still using them.
+    Spare users are provisioned by one worker only (the controller or gw0).
+
+    Only users whose state the suite can reset belong here: main users,
+    whose organisations are deleted after every test. The file holds
+    passwords and tokens, so it is written with owner-only permissions and
+    should live outside the repository.
+    """
+
+    def __init__(self, pool_file: str, lease_ttl: int = 6 * 60 * 60) -> None:
+        self._pool_file = pool_file
+        self._lock_file = f"{pool_file}.lock"
+        self._lease_ttl = lease_ttl
+        self._worker_id = os.getenv("PYTEST_XDIST_WORKER", "main")
+        os.makedirs(os.path.dirname(pool_file) or ".", mode=0o700, exist_ok=True)
+
+    def lease(self) -> Optional[UserData]:
+        """Lease a free user from the pool, or return None if there is none."""
+        with self._locked_entries() as entries:
+            for entry in entries:
+                if self._is_free(entry):
+                    self._mark_leased(entry)
+                    user = self._to_user(entry)
+                    logger.info(f"[{self._worker_id}] Leased {user}")
+                    return user
+        return None
+
+    async def lease_checked(
+        self, check: Callable[[UserData], Awaitable[bool]]
+    ) -> Optional[UserData]:
+        """
+        Lease a user that passes `check`. Users failing it are removed from
+        the pool; None means the caller has to sign up a new user.
+        """
+        while (user := self.lease()) is not None:
+            try:
+                if await check(user):
+                    return user
+            except Exception as e:
+                logger.warning(f"Check of pooled user {user} failed: {e}")
+            self.discard(user)
+        return None
+
+    def discard(self, user: UserData) -> None:
+        with self._locked_entries() as entries:
+            entries[:] = [entry for entry in entries if entry["email"] != user.email]
+        logger.info(f"[{self._worker_id}] Removed {user} from pool")
+
+    def add(self, user: UserData, leased: bool = True) -> None:
+        """Add a newly signed up user, leased to this worker by default."""
+        entry: dict[str, Any] = {
+            "email": user.email,
+            "username": user.username,
+            "password": user.password,
+            "token": user.token,
+            "leased_by": None,
+            "leased_at": 0.0,
+            "leased_host": None,
+            "leased_pid": None,
+        }
+        if leased:
+            self._mark_leased(entry)
+        with self._locked_entries() as entries:
+            entries.append(entry)
+        logger.info(f"[{self._worker_id}] Added {user} to pool (leased={leased})")
+
+    def release(self, user: UserData) -> None:
+        with self._locked_entries() as entries:
+            for entry in entries:
+                if entry["email"] == user.email:
+                    entry["token"] = user.token
+                    self._clear_lease(entry)
+
+    def release_all(self) -> None:
+        """Release every user leased by this worker in the current run."""
+        owner = self._owner()
+        with self._locked_entries() as entries:
+            for entry in entries:
+                if entry["leased_by"] == owner:
+                    self._clear_lease(entry)
+
+    def available(self) -> int:
+        with self._locked_entries() as entries:
+            return sum(1 for entry in entries if self._is_free(entry))
+
+    async def provision(
+        self, count: int, signup: Callable[[], Awaitable[UserData]]
+    ) -> None:
+        """
+        Sign up users until at least `count` free users are in the pool.
+        Only one xdist worker provisions, so workers do not sign up
+        `count` users each.
+        """
+        if self._worker_id not in ("main", "gw0"):
+            return
+        missing = count - self.available()
+        for _ in range(max(0, missing)):
+            user = await signup()
+            self.add(user, leased=False)
+
+    def _owner(self) -> str:
+        return f"{_RUN_ID}:{self._worker_id}"
+
+    def _mark_leased(self, entry: dict[str, Any]) -> None:
+        entry["leased_by"] = self._owner()
+        entry["leased_at"] = time.time()
+        entry["leased_host"] = socket.gethostname()
+        entry["leased_pid"] = os.getpid()
+
+    @staticmethod
+    def _clear_lease(entry: dict[str, Any]) -> None:
+        entry["leased_by"] = None
+        entry["leased_at"] = 0.0
+        entry["leased_host"] = None
+        entry["leased_pid"] = None
+
+    def _is_free(self, entry: dict[str, Any]) -> bool:
+        if not entry.get("leased_by"):
+            return True
+        pid = entry.get("leased_pid")
+        if pid and entry.get("leased_host") == socket.gethostname():
+            return not _process_alive(int(pid))
+        return bool(time.time() - float(entry.get("leased_at", 0)) > self._lease_ttl)
+
+    @staticmethod
+    def _to_user(entry: dict[str, Any]) -> UserData:
+        return UserData(
+            email=entry["email"],
+            username=entry["username"],
+            password=entry["password"],
+            token=entry.get("token", ""),
+        )
+
+    @contextmanager
+    def _locked_entries(self) -> Iterator[list[dict[str, Any]]]:
+        with open(self._lock_file, "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                entries = self._read()
+                snapshot = json.dumps(entries)
+                yield entries
+                if json.dumps(entries) != snapshot:
+                    self._write(entries)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read(self) -> list[dict[str, Any]]:
+        try:
+            with open(self._pool_file) as f:
+                data = json.load(f)
+            return list(data.get("users", []))
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            logger.warning(f"Corrupted user pool file, starting empty: {e}")
+            return []
+
+    def _write(self, entries: list[dict[str, Any]]) -> None:
+        tmp_path = f"{self._pool_file}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"users": entries}, f, indent=2)
+        os.replace(tmp_path, self._pool_file)
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists, but belongs to another user
+        return True
+    return True
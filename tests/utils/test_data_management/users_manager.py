@@ -4,7 +4,11 @@ import logging
 import random
 import string
 from dataclasses import dataclass, field
-from typing import Optional
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from tests.utils.test_data_management.user_pool import UserPool
 
 logger = logging.getLogger("[👤UsersManager]")
 
@@ -23,7 +27,8 @@ class UserData:
 
 
 class UsersManager:
-    def __init__(self) -> None:
+    def __init__(self, user_pool: Optional[UserPool] = None) -> None:
+        self._user_pool = user_pool
         self._users: list[UserData] = []
         self._main_user: Optional[UserData] = None
         self._second_user: Optional[UserData] = None
@@ -62,6 +67,25 @@ class UsersManager:
             self.main_user = user
         return user
 
+    async def lease_pooled_user(
+        self, check: Callable[[UserData], Awaitable[bool]]
+    ) -> Optional[UserData]:
+        """
+        Lease an already signed up user that passes `check` from the pool,
+        if there is one.
+        """
+        if self._user_pool is None:
+            return None
+        user = await self._user_pool.lease_checked(check)
+        if user:
+            self._users.append(user)
+        return user
+
+    def add_to_pool(self, user: UserData) -> None:
+        """Register a freshly signed up user in the pool, leased to this worker."""
+        if self._user_pool is not None:
+            self._user_pool.add(user)
+
     @property
     def main_user(self) -> UserData:
         if self._main_user is None:
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from functools import partial
+from graphlib import TopologicalSorter
+from typing import Any, Optional
+
+from tests.utils.api_helper import APIHelper
+from tests.utils.test_data_management.organization_data import OrganizationData
+from tests.utils.test_data_management.test_data import DataManager
+
+logger = logging.getLogger("[🏗TOPOLOGY]")
+
+OK_STATUSES = (200, 201)
+
+
+@dataclass(frozen=True)
+class ProjectSpec:
+    gherkin_name: str
+    default_role: str = "reader"
+    default: bool = False
+    members: tuple[tuple[str, str], ...] = ()
+    secrets: tuple[tuple[str, str], ...] = ()
+
+
+@dataclass(frozen=True)
+class OrgSpec:
+    gherkin_name: str
+    members: tuple[tuple[str, str], ...] = ()
+    projects: tuple[ProjectSpec, ...] = ()
+
+
+class Topology:
+    """
+    Declarative description of orgs, projects, members with roles and secrets.
+
+        topology = (
+            Topology()
+            .org("My-organization", members={second_user.username: "user"})
+            .project(
+                "My-organization",
+                "project 1",
+                members={second_user.username: "manager"},
+                secrets={"my-secret": "value"},
+            )
+        )
+
+    Project members that are not listed as org members are added to the
+    org with the "user" role first, as the admin API requires.
+    """
+
+    def __init__(self) -> None:
+        self._orgs: dict[str, OrgSpec] = {}
+
+    def org(
+        self, gherkin_name: str, members: Optional[Mapping[str, str]] = None
+    ) -> Topology:
+        if gherkin_name in self._orgs:
+            raise ValueError(f"Organization '{gherkin_name}' is already described.")
+        self._orgs[gherkin_name] = OrgSpec(
+            gherkin_name=gherkin_name, members=_pairs(members)
+        )
+        return self
+
+    def project(
+        self,
+        org_gherkin_name: str,
+        gherkin_name: str,
+        default_role: str = "reader",
+        default: bool = False,
+        members: Optional[Mapping[str, str]] = None,
+        secrets: Optional[Mapping[str, str]] = None,
+    ) -> Topology:
+        org = self._orgs.get(org_gherkin_name)
+        if org is None:
+            raise ValueError(f"Organization '{org_gherkin_name}' is not described.")
+        if gherkin_name in [proj.gherkin_name for proj in org.projects]:
+            raise ValueError(
+                f"Project '{gherkin_name}' is already described in '{org_gherkin_name}'."
+            )
+        project = ProjectSpec(
+            gherkin_name=gherkin_name,
+            default_role=default_role,
+            default=default,
+            members=_pairs(members),
+            secrets=_pairs(secrets),
+        )
+        self._orgs[org_gherkin_name] = OrgSpec(
+            gherkin_name=org.gherkin_name,
+            members=org.members,
+            projects=org.projects + (project,),
+        )
+        return self
+
+    @property
+    def orgs(self) -> tuple[OrgSpec, ...]:
+        return tuple(self._orgs.values())
+
+    def key(self) -> str:
+        """Hash of the described structure; member and secret order is ignored."""
+        structure = [
+            {
+                "org": org.gherkin_name,
+                "members": sorted(org.members),
+                "projects": sorted(
+                    [
+                        proj.gherkin_name,
+                        proj.default_role.lower(),
+                        proj.default,
+                        sorted((user, role.lower()) for user, role in proj.members),
+                        sorted(proj.secrets),
+                    ]
+                    for proj in org.projects
+                ),
+            }
+            for org in sorted(self.orgs, key=lambda org: org.gherkin_name)
+        ]
+        return hashlib.sha256(json.dumps(structure).encode()).hexdigest()
+
+
+def _pairs(mapping: Optional[Mapping[str, str]]) -> tuple[tuple[str, str], ...]:
+    return tuple(mapping.items()) if mapping else ()
+
+
+@dataclass
+class ProvisionFailure:
+    resource: str
+    error: str
+
+    def __str__(self) -> str:
+        return f"{self.resource}: {self.error}"
+
+
+@dataclass
+class ProvisionResult:
+    orgs: dict[str, OrganizationData] = field(default_factory=dict)
+    created: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    failures: list[ProvisionFailure] = field(default_factory=list)
+
+    def summary(self) -> str:
+        lines = [
+            f"Created resources: {len(self.created)}",
+            f"Skipped resources: {len(self.skipped)}",
+            f"Failures: {len(self.failures)}",
+        ]
+        lines.extend(f"  - {failure}" for failure in self.failures)
+        lines.extend(f"  - {resource}: dependency failed" for resource in self.skipped)
+        return "\n".join(lines)
+
+
+@dataclass
+class _Node:
+    deps: set[str]
+    action: Callable[[], Awaitable[tuple[int, Any]]]
+
+
+class TopologyBuilder:
+    """
+    Provisions a Topology through the admin REST API.
+
+    Every org, project, membership and secret is a node of a dependency
+    graph (org -> org member / project -> project member / secret); a node
+    is started as soon as its dependencies are done, under a shared
+    semaphore. Nodes whose dependencies failed are skipped. Orgs and
+    projects are registered in DataManager before they are created, the same
+    way the API steps do, so teardown and lookups by gherkin name work as
+    usual. Without a DataManager nothing is registered.
+    """
+
+    def __init__(
+        self,
+        api_helper: APIHelper,
+        data_manager: Optional[DataManager],
+        token: str,
+        max_parallel: int = 8,
+    ) -> None:
+        self._api_helper = api_helper
+        self._data_manager = data_manager
+        self._token = token
+        self._semaphore = asyncio.Semaphore(max_parallel)
+
+    async def provision(
+        self, topology: Topology, existing_orgs: Optional[Mapping[str, str]] = None
+    ) -> ProvisionResult:
+        """
+        existing_orgs: gherkin name -> name of an org that already exists
+        with its members; only the projects of such orgs are created.
+        """
+        result = ProvisionResult()
+        nodes = self._build_graph(topology, result, existing_orgs or {})
+
+        sorter = TopologicalSorter({key: node.deps for key, node in nodes.items()})
+        sorter.prepare()
+        failed: set[str] = set()
+        running: dict[asyncio.Task[None], str] = {}
+        while sorter.is_active():
+            for key in sorter.get_ready():
+                task = asyncio.create_task(self._run(key, nodes[key], failed, result))
+                running[task] = key
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                sorter.done(running.pop(task))
+
+        logger.info(f"Provisioning finished:\n{result.summary()}")
+        return result
+
+    def _build_graph(
+        self,
+        topology: Topology,
+        result: ProvisionResult,
+        existing_orgs: Mapping[str, str],
+    ) -> dict[str, _Node]:
+        api, token = self._api_helper, self._token
+        nodes: dict[str, _Node] = {}
+
+        for org_spec in topology.orgs:
+            existing_name = existing_orgs.get(org_spec.gherkin_name)
+            if self._data_manager:
+                org = self._data_manager.add_organization(
+                    org_spec.gherkin_name, existing_name
+                )
+            else:
+                org = OrganizationData(org_spec.gherkin_name, existing_name)
+            result.orgs[org_spec.gherkin_name] = org
+            org_name = org.org_name
+            org_key = f"org:{org_name}"
+            member_deps: dict[str, set[str]] = {}
+
+            if existing_name is None:
+                nodes[org_key] = _Node(
+                    deps=set(), action=partial(api.add_org, token, org_name)
+                )
+                org_members = dict(org_spec.members)
+                for proj_spec in org_spec.projects:
+                    for username, _ in proj_spec.members:
+                        org_members.setdefault(username, "user")
+                for username, role in org_members.items():
+                    member_key = f"org-member:{org_name}/{username}"
+                    member_deps[username] = {member_key}
+                    nodes[member_key] = _Node(
+                        deps={org_key},
+                        action=partial(
+                            api.add_user_to_org, token, org_name, username, role.lower()
+                        ),
+                    )
+
+            for proj_spec in org_spec.projects:
+                proj_name = org.add_project(proj_spec.gherkin_name).project_name
+                proj_key = f"project:{org_name}/{proj_name}"
+                nodes[proj_key] = _Node(
+                    deps={org_key} if existing_name is None else set(),
+                    action=partial(
+                        api.add_proj,
+                        token,
+                        org_name,
+                        proj_name,
+                        proj_spec.default_role.lower(),
+                        proj_spec.default,
+                    ),
+                )
+                for username, role in proj_spec.members:
+                    nodes[f"project-member:{org_name}/{proj_name}/{username}"] = _Node(
+                        deps={proj_key} | member_deps.get(username, set()),
+                        action=partial(
+                            api.add_user_to_proj,
+                            token,
+                            org_name,
+                            proj_name,
+                            username,
+                            role.lower(),
+                        ),
+                    )
+                for secret_name, secret_value in proj_spec.secrets:
+                    nodes[f"secret:{org_name}/{proj_name}/{secret_name}"] = _Node(
+                        deps={proj_key},
+                        action=partial(
+                            api.add_secret,
+                            token,
+                            org_name,
+                            proj_name,
+                            secret_name,
+                            secret_value,
+                        ),
+                    )
+        return nodes
+
+    async def _run(
+        self, key: str, node: _Node, failed: set[str], result: ProvisionResult
+    ) -> None:
+        if node.deps & failed:
+            failed.add(key)
+            result.skipped.append(key)
+            return
+        try:
+            async with self._semaphore:
+                status, response = await node.action()
+        except Exception as exc:
+            failed.add(key)
+            result.failures.append(ProvisionFailure(key, repr(exc)))
+            return
+        if status not in OK_STATUSES:
+            failed.add(key)
+            result.failures.append(ProvisionFailure(key, f"{status} {response}"))
+            return
+        result.created.append(key)
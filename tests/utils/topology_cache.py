@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+
+from tests.utils.api_helper import APIHelper
+from tests.utils.org_cleaner import CleanupResult, OrgCleaner
+from tests.utils.test_data_management.organization_data import OrganizationData
+from tests.utils.test_data_management.test_data import DataManager
+from tests.utils.topology_builder import ProvisionResult, Topology, TopologyBuilder
+
+logger = logging.getLogger("[🏗TOPOLOGY]")
+
+
+@dataclass
+class _Entry:
+    topology: Topology
+    token: str
+    orgs: dict[str, OrganizationData]
+    refs: int = 0
+
+    @property
+    def org_names(self) -> dict[str, str]:
+        return {gherkin: org.org_name for gherkin, org in self.orgs.items()}
+
+
+@dataclass
+class TopologyCache:
+    """
+    Keeps provisioned topologies alive across the tests of a class.
+
+    Entries are keyed by Topology.key(). A read-only acquisition registers
+    the cached orgs and projects in the test's DataManager; a mutable one
+    (the test changes project membership) clones the projects into fresh
+    projects of the cached orgs, which are deleted when the test releases
+    them. Org membership is shared and must not be changed by tests.
+
+    Orgs of live entries are excluded from the per-test org cleanup and are
+    deleted by close() after the last test of the class.
+    """
+
+    pending_tests: set[str] = field(default_factory=set)
+    closed: bool = False
+    _entries: dict[str, _Entry] = field(default_factory=dict)
+    _held: list[_Entry] = field(default_factory=list)
+    _clones: list[tuple[str, str, str]] = field(default_factory=list)
+
+    async def acquire(
+        self,
+        topology: Topology,
+        api_helper: APIHelper,
+        data_manager: DataManager,
+        token: str,
+        mutable: bool = False,
+    ) -> ProvisionResult:
+        key = topology.key()
+        entry = self._entries.get(key)
+        if entry is None:
+            base = await TopologyBuilder(
+                api_helper=api_helper, data_manager=None, token=token
+            ).provision(topology)
+            if base.failures or base.skipped:
+                # Not cached: the partial topology is removed by the test cleanup
+                return base
+            entry = _Entry(topology=topology, token=token, orgs=base.orgs)
+            self._entries[key] = entry
+            logger.info(f"Cached topology {key[:12]}: {entry.org_names}")
+        else:
+            logger.info(f"Reusing cached topology {key[:12]}: {entry.org_names}")
+
+        entry.refs += 1
+        self._held.append(entry)
+
+        if mutable:
+            result = await TopologyBuilder(
+                api_helper=api_helper, data_manager=data_manager, token=token
+            ).provision(topology, existing_orgs=entry.org_names)
+            for org in result.orgs.values():
+                for proj in org.get_all_projects():
+                    self._clones.append((token, org.org_name, proj.project_name))
+            return result
+
+        result = ProvisionResult()
+        for gherkin_name, cached_org in entry.orgs.items():
+            org = data_manager.add_organization(gherkin_name, cached_org.org_name)
+            for proj in cached_org.get_all_projects():
+                org.add_project(proj.gherkin_name, proj.project_name)
+            result.orgs[gherkin_name] = org
+        return result
+
+    def pinned_orgs(self) -> set[str]:
+        return {
+            org_name
+            for entry in self._entries.values()
+            for org_name in entry.org_names.values()
+        }
+
+    async def release_held(self, api_helper: APIHelper) -> None:
+        """Drop the references of the current test and delete its clones."""
+        for token, org_name, proj_name in self._clones:
+            try:
+                await api_helper.delete_proj(
+                    token=token, org_name=org_name, proj_name=proj_name
+                )
+            except Exception as exc:
+                logger.warning(f"Can not delete cloned project {proj_name}: {exc}")
+        self._clones.clear()
+        for entry in self._held:
+            entry.refs -= 1
+        self._held.clear()
+
+    def finish_test(self, nodeid: str) -> bool:
+        """Mark a test as done; True once no tests of the class are left."""
+        self.pending_tests.discard(nodeid)
+        return not self.pending_tests
+
+    async def close(self, api_helper: APIHelper) -> CleanupResult:
+        result = CleanupResult()
+        for key, entry in self._entries.items():
+            if entry.refs:
+                logger.warning(f"Topology {key[:12]} still has {entry.refs} refs")
+            cleaned = await OrgCleaner(
+                api_helper=api_helper, token=entry.token
+            ).cleanup(list(entry.org_names.values()))
+            result.deleted_orgs.extend(cleaned.deleted_orgs)
+            result.deleted_projects.extend(cleaned.deleted_projects)
+            result.failures.extend(cleaned.failures)
+        self._entries.clear()
+        self.closed = True
+        return result